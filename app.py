@@ -1,68 +1,92 @@
 import streamlit as st
 
-# =========================
-# PAGE CONFIG
-# =========================
-st.set_page_config(
-    page_title="Student Performance Analysis",
-    page_icon="🎓",
-    layout="wide"
-)
-
-# =========================
-# SIDEBAR
-# =========================
-st.sidebar.title("📊 Navigation")
-st.sidebar.markdown("**Student Performance Dashboard**")
-
-menu = st.sidebar.radio(
-    "Select Page",
-    [
-        "🏠 About Dataset",
-        "📈 Dashboards",
-        "🤖 Machine Learning",
-        "🔮 Prediction App",
-        "📬 Contact Me"
-    ]
-)
-
-st.sidebar.markdown("---")
-st.sidebar.markdown("👩‍🎓 **Nur Ihza Aprilia**")
-st.sidebar.caption("Final Project Data Science – Dibimbing")
-
-# =========================
-# MAIN HEADER
-# =========================
-st.title("🎓 Exploratory Analysis of Student Performance and Learning Factors")
-st.markdown(
-    """
-    Analisis ini bertujuan untuk memahami faktor-faktor yang memengaruhi
-    **performa akademik siswa** melalui eksplorasi data, visualisasi,
-    serta penerapan **machine learning**.
-    """
-)
-
-st.divider()
-
-# =========================
-# PAGE ROUTING
-# =========================
-if menu == "🏠 About Dataset":
-    import about
-    about.about_dataset()
-
-elif menu == "📈 Dashboards":
-    import visualisasi
-    visualisasi.chart()
-
-elif menu == "🤖 Machine Learning":
-    import machine_learning
-    machine_learning.ml_model()
-
-elif menu == "🔮 Prediction App":
-    import prediction
-    prediction.prediction_app()
-
-elif menu == "📬 Contact Me":
-    import kontak
-    kontak.contact_me()
+import profiling
+from theme import apply_theme
+
+
+# Streamlit menjalankan file ini sebagai __main__; worker process worker_pool (spawn)
+# meng-import ulang file ini sebagai __mp_main__ dan tidak boleh ikut merender halaman
+def main():
+    # =========================
+    # PAGE CONFIG
+    # =========================
+    st.set_page_config(
+        page_title="Student Performance Analysis",
+        page_icon="🎓",
+        layout="wide"
+    )
+
+    apply_theme()
+
+    # =========================
+    # SIDEBAR
+    # =========================
+    st.sidebar.title("📊 Navigation")
+    st.sidebar.markdown("**Student Performance Dashboard**")
+
+    menu = st.sidebar.radio(
+        "Select Page",
+        [
+            "🏠 About Dataset",
+            "📈 Dashboards",
+            "🤖 Machine Learning",
+            "🔮 Prediction App",
+            "📬 Contact Me"
+        ]
+    )
+
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("👩‍🎓 **Nur Ihza Aprilia**")
+    st.sidebar.caption("Final Project Data Science – Dibimbing")
+
+    # =========================
+    # MAIN HEADER
+    # =========================
+    st.title("🎓 Exploratory Analysis of Student Performance and Learning Factors")
+    st.markdown(
+        """
+        Analisis ini bertujuan untuk memahami faktor-faktor yang memengaruhi
+        **performa akademik siswa** melalui eksplorasi data, visualisasi,
+        serta penerapan **machine learning**.
+        """
+    )
+
+    st.divider()
+
+    # =========================
+    # PAGE ROUTING
+    # =========================
+    profiling.start_run(menu)
+
+    if menu == "🏠 About Dataset":
+        import about
+        about.about_dataset()
+
+    elif menu == "📈 Dashboards":
+        import visualisasi
+        visualisasi.chart()
+
+    elif menu == "🤖 Machine Learning":
+        import machine_learning
+        machine_learning.ml_model()
+
+    elif menu == "🔮 Prediction App":
+        import prediction
+        prediction.prediction_app()
+
+    elif menu == "📬 Contact Me":
+        import kontak
+        kontak.contact_me()
+
+    # =========================
+    # PROFILING
+    # =========================
+    # timing per section ditulis ke log/Prometheus (jika dikonfigurasi),
+    # panel hanya muncul dengan ?debug=1 atau STUDENT_APP_DEBUG=1
+    profiling.flush()
+    if profiling.debug_enabled():
+        profiling.render_debug_panel()
+
+
+if __name__ == "__main__":
+    main()
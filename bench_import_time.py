@@ -0,0 +1,106 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# =========================
+# CONFIG
+# =========================
+PAGE_MODULES = ["theme", "about", "kontak", "visualisasi", "machine_learning", "prediction"]
+BUDGET_PATH = "import_time_budget.json"
+REPEAT = 5
+TOLERANCE = 0.5
+# slack absolut supaya modul yang sangat kecil tidak gagal karena noise
+SLACK_MS = 5.0
+
+
+# =========================
+# MEASURE (à la python -X importtime)
+# =========================
+def parse_importtime(stderr):
+    # baris: "import time: self [us] | cumulative | imported package"
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure_module(module, repeat=REPEAT):
+    # streamlit di-import lebih dulu: yang diukur adalah biaya tambahan modul halaman
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import streamlit; import {module}"],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"import {module} gagal:\n{proc.stderr[-2000:]}")
+        rows = parse_importtime(proc.stderr)
+        index = next(i for i, (name, _, _) in enumerate(rows) if name == f" {module}")
+        total_us = rows[index][2]
+        if best is None or total_us < best[0]:
+            # anak langsung modul ini tercatat sebelum barisnya sendiri (indentasi 3 spasi)
+            children = []
+            for name, _, cumulative_us in reversed(rows[:index]):
+                depth = (len(name) - len(name.lstrip())) // 2
+                if depth == 0:
+                    break
+                if depth == 1:
+                    children.append((name, cumulative_us))
+            best = (total_us, sorted(children, key=lambda row: row[1], reverse=True)[:5])
+    return best
+
+
+# =========================
+# REPORT & BUDGET CHECK
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time report dan budget cold start per halaman")
+    parser.add_argument("--budget", default=BUDGET_PATH)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="regresi yang masih ditoleransi relatif terhadap budget (0.5 = +50%%)")
+    parser.add_argument("--update", action="store_true", help="tulis hasil pengukuran sebagai budget baru")
+    args = parser.parse_args(argv)
+
+    budget = {}
+    if os.path.exists(args.budget):
+        with open(args.budget) as f:
+            budget = json.load(f)
+
+    measured = {}
+    failures = []
+    for module in PAGE_MODULES:
+        total_us, heaviest = measure_module(module, args.repeat)
+        measured[module] = round(total_us / 1000, 2)
+
+        limit = budget.get(module)
+        status = "-"
+        if limit is not None:
+            allowed = limit * (1 + args.tolerance) + SLACK_MS
+            status = "OK" if measured[module] <= allowed else "REGRESSION"
+            if status == "REGRESSION":
+                failures.append(f"{module}: {measured[module]} ms > {allowed:.2f} ms")
+
+        print(f"{module:<18} {measured[module]:>9.2f} ms  budget={limit}  {status}")
+        for name, cumulative_us in heaviest:
+            print(f"    {name.strip():<30} {cumulative_us / 1000:>9.2f} ms")
+
+    if args.update:
+        with open(args.budget, "w") as f:
+            json.dump(measured, f, indent=2)
+        print(f"Budget ditulis ke {args.budget}")
+        return 0
+
+    if failures:
+        print("Cold start regression:\n  " + "\n  ".join(failures))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# =========================
+# CONFIG
+# =========================
+SOURCE_CSV = os.path.join(ROOT, "6. Student Performance Data.csv")
+BASELINE_PATH = os.path.join(ROOT, "bench_baselines.json")
+SCALES = [1, 10, 100, 1000]
+SEED = 42
+
+# regresi yang ditoleransi relatif terhadap baseline
+TOLERANCE = {"wall_s": 0.5, "peak_mb": 0.3, "payload_kb": 0.1}
+# batas bawah absolut supaya angka yang sangat kecil tidak gagal karena noise
+MIN_SLACK = {"wall_s": 0.05, "peak_mb": 1.0, "payload_kb": 1.0}
+
+PAGES = {
+    "about": ("about", "about_dataset"),
+    "dashboard": ("visualisasi", "chart"),
+    "machine_learning": ("machine_learning", "ml_model"),
+    "prediction": ("prediction", "prediction_app"),
+}
+
+
+# =========================
+# SYNTHETIC DATASET
+# =========================
+def make_dataset(scale, out_dir, seed=SEED):
+    import pandas as pd
+
+    import synthetic_data
+
+    source = pd.read_csv(SOURCE_CSV)
+    rows = len(source) * scale
+    path = os.path.join(out_dir, f"students_x{scale}.parquet")
+    synthetic_data.write(synthetic_data.fit(source), path, rows, seed=seed)
+    return path, rows
+
+
+# =========================
+# MEASUREMENT
+# =========================
+def _payload_bytes(node):
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if proto is not None and hasattr(proto, "ByteSize") else 0
+    for child in getattr(node, "children", {}).values():
+        size += _payload_bytes(child)
+    return size
+
+
+def _measure(func, prepare=None):
+    # tracemalloc memperlambat alokasi berkali lipat, jadi waktu dan memori
+    # diukur di dua run terpisah dengan kondisi cache yang sama
+    if prepare:
+        prepare()
+    start = time.perf_counter()
+    payload = func()
+    wall = time.perf_counter() - start
+
+    if prepare:
+        prepare()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "wall_s": round(wall, 4),
+        "peak_mb": round(peak / 2**20, 2),
+        "payload_kb": round(payload / 1024, 2),
+    }
+
+
+def bench_page(module, function):
+    from streamlit.testing.v1 import AppTest
+
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {ROOT!r})\n"
+        f"import {module}\n"
+        f"{module}.{function}()\n"
+    )
+    app = AppTest.from_string(script, default_timeout=600)
+
+    def render():
+        app.run()
+        if app.exception:
+            raise RuntimeError(f"{module}.{function}: {app.exception[0].value}")
+        return _payload_bytes(app._tree)
+
+    # render sekali dulu supaya import modul tidak ikut terukur (itu tugas bench_import_time.py);
+    # cold = render dengan cache kosong, warm = rerun seperti saat user klik widget
+    render()
+    return {"cold": _measure(render, prepare=reset_caches), "warm": _measure(render)}
+
+
+def bench_model_lifecycle(path):
+    import data_loader
+    import training
+    from model_pipeline import ModelPipeline
+
+    def lifecycle():
+        result = training.run_pipeline(data_loader.load_dataset(path))
+        target = os.path.join(os.path.dirname(path), "pipeline.npz")
+        ModelPipeline.from_training(result).save(target)
+        ModelPipeline.load(target)
+        return os.path.getsize(target)
+
+    return {"cold": _measure(lifecycle, prepare=reset_caches)}
+
+
+def bench_batch_prediction(path):
+    import pandas as pd
+
+    import scoring
+    from model_pipeline import ModelPipeline
+
+    roster = pd.read_parquet(path)
+    pipeline = ModelPipeline.load(os.path.join(ROOT, "model_pipeline.npz"))
+
+    def batch():
+        result, errors = scoring.score_roster(pipeline, roster)
+        if errors:
+            raise RuntimeError("; ".join(errors))
+        return len(scoring.to_csv_bytes(result))
+
+    return {"cold": _measure(batch)}
+
+
+def reset_caches():
+    import shutil
+
+    import streamlit as st
+
+    import data_loader
+    import dataset_stats
+    import evaluation
+    import filter_engine
+    import tuning
+    import worker_pool
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    data_loader._frames.clear()
+    filter_engine._engines.clear()
+    worker_pool.clear()
+    tuning._memory_cache.clear()
+    evaluation._memory_cache.clear()
+    shutil.rmtree(tuning.TUNING_CACHE_DIR, ignore_errors=True)
+    shutil.rmtree(evaluation.EVALUATION_CACHE_DIR, ignore_errors=True)
+    shutil.rmtree(dataset_stats.STATS_DIR, ignore_errors=True)
+
+
+def run_benchmarks(scales, pages, work_dir):
+    import data_loader
+
+    results = {}
+    for scale in scales:
+        path, rows = make_dataset(scale, work_dir)
+        data_loader.DATASET_PATH = path
+        reset_caches()
+        print(f"== x{scale} ({rows} rows)")
+
+        for name in pages:
+            if name == "model_lifecycle":
+                stats = bench_model_lifecycle(path)
+            elif name == "batch_prediction":
+                stats = bench_batch_prediction(path)
+            else:
+                stats = bench_page(*PAGES[name])
+            results.setdefault(name, {})[f"x{scale}"] = stats
+            for phase, values in stats.items():
+                print(f"  {name:<18} {phase:<5} " + "  ".join(f"{k}={v}" for k, v in values.items()))
+    return results
+
+
+# =========================
+# BASELINE COMPARISON
+# =========================
+def compare(results, baseline):
+    failures = []
+    for name, scales in results.items():
+        for scale, phases in scales.items():
+            for phase, values in phases.items():
+                reference = baseline.get(name, {}).get(scale, {}).get(phase)
+                if reference is None:
+                    continue
+                for metric, value in values.items():
+                    allowed = max(
+                        reference[metric] * (1 + TOLERANCE[metric]),
+                        reference[metric] + MIN_SLACK[metric]
+                    )
+                    if value > allowed:
+                        failures.append(
+                            f"{name} {scale} {phase} {metric}: {value} > {allowed:.2f} "
+                            f"(baseline {reference[metric]})"
+                        )
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark headless semua halaman dan lifecycle model")
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES)
+    parser.add_argument("--pages", nargs="+",
+                        default=list(PAGES) + ["model_lifecycle", "batch_prediction"])
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        # cache parquet/tuning benchmark dipisah dari cache aplikasi
+        os.environ["STUDENT_CACHE_DIR"] = os.path.join(work_dir, "cache")
+        sys.path.insert(0, ROOT)
+        warnings.filterwarnings("ignore")
+        logging.disable(logging.WARNING)
+        results = run_benchmarks(args.scales, args.pages, work_dir)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.update_baseline:
+        for name, scales in results.items():
+            baseline.setdefault(name, {}).update(scales)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Baseline ditulis ke {args.baseline}")
+        return 0
+
+    failures = compare(results, baseline)
+    if failures:
+        print("Regression terdeteksi:\n  " + "\n  ".join(failures))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
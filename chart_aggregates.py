@@ -0,0 +1,184 @@
+import math
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# =========================
+# CONFIG
+# =========================
+# di atas jumlah titik unik ini scatter dikirim sebagai grid 2D (bin + count)
+MAX_SCATTER_POINTS = 5000
+SCATTER_GRID = 80
+MAX_BOX_OUTLIERS = 200
+
+
+# =========================
+# AGGREGATIONS (server-side)
+# =========================
+def _nice_width(raw):
+    if not raw > 0:
+        return 1.0
+    exponent = 10 ** math.floor(math.log10(raw))
+    for multiple in (1, 2, 5, 10):
+        if multiple * exponent >= raw:
+            return multiple * exponent
+
+
+def histogram_bins(values, nbins):
+    values = pd.Series(values).dropna().to_numpy(dtype=np.float64)
+    if values.size == 0:
+        return {"edges": np.array([0.0, 1.0]), "counts": np.array([0])}
+
+    low, high = values.min(), values.max()
+    width = _nice_width((high - low) / nbins)
+    if np.all(values == np.round(values)):
+        width = max(width, 1.0)
+    start = math.floor(low / width) * width
+    n_bins = int((high - start) // width) + 1
+
+    edges = start + width * np.arange(n_bins + 1)
+    counts, _ = np.histogram(values, bins=edges)
+    return {"edges": edges, "counts": counts}
+
+
+def category_counts(series):
+    # kolom category (schema.py) ikut menghitung kategori yang tidak muncul -> dibuang
+    counts = series.value_counts()
+    return counts[counts > 0]
+
+
+def box_stats(frame, x, y, max_outliers=MAX_BOX_OUTLIERS):
+    rows = []
+    for category, values in frame.groupby(x, observed=True, sort=True)[y]:
+        values = values.dropna().to_numpy(dtype=np.float64)
+        if values.size == 0:
+            continue
+        q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+        outliers = np.unique(values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)])
+        rows.append({
+            "category": category,
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "lowerfence": inside.min(),
+            "upperfence": inside.max(),
+            "outliers": outliers[:max_outliers],
+        })
+    return pd.DataFrame(rows)
+
+
+def scatter_points(frame, x, y, max_points=MAX_SCATTER_POINTS, grid=SCATTER_GRID):
+    data = frame[[x, y]].dropna()
+    # titik yang bertumpuk digabung jadi satu titik + count
+    points = data.groupby([x, y], observed=True).size().reset_index(name="count")
+    if len(points) <= max_points:
+        return points
+
+    counts, x_edges, y_edges = np.histogram2d(data[x], data[y], bins=grid)
+    x_idx, y_idx = np.nonzero(counts)
+    return pd.DataFrame({
+        x: (x_edges[x_idx] + x_edges[x_idx + 1]) / 2,
+        y: (y_edges[y_idx] + y_edges[y_idx + 1]) / 2,
+        "count": counts[x_idx, y_idx].astype(int),
+    })
+
+
+# =========================
+# DASHBOARD (satu task per kombinasi filter)
+# =========================
+def dashboard_aggregates(frame):
+    return {
+        # copy: head() berbagi blok dengan frame hasil filter dan akan menahannya di cache view
+        "preview": frame.head().copy(),
+        "father_job": category_counts(frame["father_job"]),
+        "mother_job": category_counts(frame["mother_job"]),
+        "grade_bins": histogram_bins(frame["grade"], 30),
+        "grade_counts": frame["grade"].value_counts().rename_axis("Performance Level").reset_index(name="Count"),
+        "attendance_points": scatter_points(frame, "absences", "grade"),
+        "studytime_box": box_stats(frame, "studytime", "grade"),
+        "freetime_box": box_stats(frame, "freetime", "grade"),
+        "school_support_counts": category_counts(frame["school_support"]),
+        "health_counts": category_counts(frame["health"]),
+        "traveltime_counts": category_counts(frame["traveltime"]),
+    }
+
+
+def view_aggregates(path, signature, selection):
+    # dijalankan di proses Streamlit atau di worker process (lihat worker_pool.py);
+    # hasilnya hanya ringkasan kecil, frame hasil filter tidak pernah dikirim balik
+    import filter_engine
+
+    view = filter_engine.shared_engine(path, signature).select(selection)
+    return view.aggregate("dashboard", dashboard_aggregates)
+
+
+# =========================
+# FIGURES (summary traces only)
+# =========================
+def histogram_figure(bins, x_label, title, color):
+    edges, counts = bins["edges"], bins["counts"]
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color=color,
+        hovertemplate=f"{x_label}=%{{x}}<br>count=%{{y}}<extra></extra>"
+    ))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title="count", bargap=0)
+    return fig
+
+
+def pie_figure(counts, title, colors, hole=0.0):
+    fig = go.Figure(go.Pie(
+        labels=[str(label) for label in counts.index],
+        values=counts.to_numpy(),
+        hole=hole,
+        marker_colors=colors
+    ))
+    fig.update_layout(title=title)
+    return fig
+
+
+def box_figure(stats, x_label, y_label, title, color):
+    fig = go.Figure()
+    if not stats.empty:
+        fig.add_trace(go.Box(
+            x=stats["category"],
+            q1=stats["q1"],
+            median=stats["median"],
+            q3=stats["q3"],
+            lowerfence=stats["lowerfence"],
+            upperfence=stats["upperfence"],
+            marker_color=color,
+            name=y_label,
+            showlegend=False
+        ))
+        outliers = stats[["category", "outliers"]].explode("outliers").dropna()
+        if not outliers.empty:
+            fig.add_trace(go.Scatter(
+                x=outliers["category"],
+                y=outliers["outliers"],
+                mode="markers",
+                marker_color=color,
+                showlegend=False
+            ))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title=y_label)
+    return fig
+
+
+def scatter_figure(points, x, y, title, color):
+    counts = points["count"].to_numpy()
+    sizes = 6 + 14 * np.sqrt(counts / counts.max()) if counts.size else []
+    fig = go.Figure(go.Scattergl(
+        x=points[x],
+        y=points[y],
+        mode="markers",
+        marker=dict(color=color, size=sizes),
+        customdata=counts,
+        hovertemplate=f"{x}=%{{x}}<br>{y}=%{{y}}<br>count=%{{customdata}}<extra></extra>"
+    ))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
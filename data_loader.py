@@ -0,0 +1,172 @@
+import hashlib
+import json
+import os
+import threading
+
+import profiling
+
+# =========================
+# CONFIG
+# =========================
+DATASET_PATH = os.environ.get("STUDENT_DATA_PATH", "Student Performance Data.xlsx")
+CACHE_DIR = os.environ.get("STUDENT_CACHE_DIR", ".cache")
+
+# frame yang sudah dimuat, dipakai bersama oleh semua session dalam satu proses
+_frames = {}
+_lock = threading.Lock()
+
+
+# =========================
+# SOURCE FINGERPRINT
+# =========================
+def source_signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def append_marker(path, rows, offset=None, tail_size=4096):
+    # posisi akhir data yang sudah di-ingest (untuk update inkremental);
+    # hash byte terakhir sebelum offset mendeteksi file yang ditulis ulang, bukan di-append
+    offset = os.path.getsize(path) if offset is None else offset
+    with open(path, "rb") as f:
+        f.seek(max(0, offset - tail_size))
+        tail = f.read(min(offset, tail_size))
+    return {"rows": int(rows), "offset": int(offset), "tail_sha256": hashlib.sha256(tail).hexdigest()}
+
+
+# =========================
+# COLUMNAR CACHE
+# =========================
+def _read_source(path):
+    import pandas as pd
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".xlsx", ".xls"):
+        return pd.read_excel(path)
+    if ext == ".csv":
+        return pd.read_csv(path)
+    if ext == ".parquet":
+        return pd.read_parquet(path)
+    raise ValueError(f"Format dataset tidak didukung: {path}")
+
+
+def cache_paths(path):
+    # (parquet, meta json) cache untuk satu sumber; nama file juga dipakai store lain di .cache/
+    key = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(path))[0].replace(" ", "_")
+    base = os.path.join(CACHE_DIR, f"{stem}-{key}")
+    return base + ".parquet", base + ".json"
+
+
+def write_json(path, payload):
+    # tulis atomik (tmp + os.replace): pembaca di proses lain tidak pernah melihat JSON setengah jadi
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(payload, f)
+    os.replace(tmp, path)
+
+
+def build_cache(path):
+    import schema
+
+    # parquet source yang sudah sesuai schema tidak perlu dikonversi, langsung di-memory-map
+    if path.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        if schema.is_compact(pq.read_schema(path)):
+            return path
+
+    parquet_path, meta_path = cache_paths(path)
+    mtime_ns, size = source_signature(path)
+
+    meta = {}
+    if os.path.exists(meta_path) and os.path.exists(parquet_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta.get("schema") != schema.SCHEMA_VERSION:
+            meta = {}
+        if meta.get("mtime_ns") == mtime_ns and meta.get("size") == size:
+            return parquet_path
+
+    # mtime berubah tapi isi sama (mis. file di-copy ulang) -> cukup update metadata
+    digest = file_hash(path)
+    if meta.get("sha256") == digest:
+        meta.update(mtime_ns=mtime_ns, size=size)
+        write_json(meta_path, meta)
+        return parquet_path
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # cache disimpan dengan dtype schema (kategori = dictionary encoding, int8),
+    # jadi load berikutnya langsung ringkas tanpa konversi
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    table = pa.Table.from_pandas(schema.apply(_read_source(path)), preserve_index=False)
+    tmp = f"{parquet_path}.{os.getpid()}.tmp"
+    pq.write_table(table, tmp)
+    os.replace(tmp, parquet_path)
+    write_json(meta_path, {
+        "source": path, "mtime_ns": mtime_ns, "size": size, "sha256": digest,
+        "schema": schema.SCHEMA_VERSION,
+    })
+    return parquet_path
+
+
+# =========================
+# CHUNKED READ (out-of-core)
+# =========================
+def iter_chunks(path=None, chunksize=100_000):
+    # baca source per potongan tanpa pernah memuat seluruh file
+    import pandas as pd
+
+    path = path or DATASET_PATH
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        yield from pd.read_csv(path, chunksize=chunksize)
+    elif ext == ".parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    elif ext in (".xlsx", ".xls"):
+        # Excel tidak bisa dibaca streaming: lewat cache parquet (sekali konversi)
+        yield from iter_chunks(build_cache(path), chunksize)
+    else:
+        raise ValueError(f"Format dataset tidak didukung: {path}")
+
+
+# =========================
+# LOAD DATASET
+# =========================
+@profiling.timed("load_dataset")
+def load_dataset(path=None):
+    # Frame hasil load dipakai bersama (read-only): kolom numerik tanpa null
+    # menunjuk langsung ke buffer parquet yang di-memory-map, jadi jangan
+    # diubah in-place. Operasi filter/seleksi biasa tetap aman karena membuat copy.
+    # dtype mengikuti schema.py (category/int8); nilai di luar rentang -> ValueError
+    path = path or DATASET_PATH
+    key = os.path.abspath(path)
+    signature = source_signature(path)
+
+    with _lock:
+        cached = _frames.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        import pyarrow.parquet as pq
+
+        import schema
+
+        table = pq.read_table(build_cache(path), memory_map=True)
+        # no-op untuk cache parquet; tetap dipanggil supaya rentang nilai selalu tervalidasi
+        df = schema.apply(table.to_pandas(split_blocks=True))
+        _frames[key] = (signature, df)
+        return df
@@ -0,0 +1,182 @@
+import argparse
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+import preprocessing
+import profiling
+
+# =========================
+# CONFIG
+# =========================
+# naikkan jika isi store berubah, store lama otomatis dihitung ulang
+STATS_VERSION = 1
+STATS_DIR = os.path.join(data_loader.CACHE_DIR, "stats")
+# sama dengan kolom filter dashboard (filter_engine.FILTER_COLUMNS)
+GROUP_COLUMNS = ("sex", "grade")
+HIGH_RISK_GRADE = 50
+
+_lock = threading.Lock()
+
+
+# =========================
+# PRECOMPUTE
+# =========================
+def group_totals(df):
+    # KPI dashboard hanya butuh jumlah & count per kombinasi filter (sex, grade);
+    # KPI untuk filter apa pun = jumlah dari grup yang dipilih
+    frame = pd.DataFrame({
+        "sex": df["sex"],
+        "grade": df["grade"],
+        "absences": df["absences"],
+        "high_risk": df["grade"] < HIGH_RISK_GRADE,
+    })
+    totals = frame.groupby(list(GROUP_COLUMNS), observed=True, sort=True).agg(
+        rows=("high_risk", "size"),
+        grade_sum=("grade", "sum"),
+        grade_count=("grade", "count"),
+        absences_sum=("absences", "sum"),
+        absences_count=("absences", "count"),
+        high_risk=("high_risk", "sum"),
+    )
+    return totals.reset_index()
+
+
+def correlation_and_vif(df):
+    # langkah preprocessing yang sama dengan training.run_pipeline (preprocessing.py),
+    # jadi heatmap & VIF di dashboard selalu sesuai dengan data yang dipakai model
+    df_clean, numbers, _ = preprocessing.remove_outliers(df)
+    df_select = preprocessing.model_frame(df_clean, numbers)
+    corr = preprocessing.correlation(df_select)
+    vif_df = preprocessing.compute_vif(df_select.drop(preprocessing.TARGET, axis=1))
+    return corr, vif_df, len(df_select)
+
+
+def compute(df):
+    corr, vif_df, rows_clean = correlation_and_vif(df)
+    return {
+        "rows": int(len(df)),
+        "rows_clean": int(rows_clean),
+        "groups": json.loads(group_totals(df).to_json(orient="records")),
+        "corr": {"columns": corr.columns.tolist(), "values": corr.to_numpy().tolist()},
+        "vif": {"Feature": vif_df["Feature"].tolist(), "VIF": vif_df["VIF"].tolist()},
+    }
+
+
+# =========================
+# STORED STATISTICS
+# =========================
+def _ratio(total, count):
+    return float(total / count) if count else float("nan")
+
+
+class DatasetStats:
+
+    def __init__(self, payload):
+        self.rows = payload["rows"]
+        self.rows_clean = payload["rows_clean"]
+        self.groups = pd.DataFrame(payload["groups"])
+        corr = payload["corr"]
+        self.corr = pd.DataFrame(corr["values"], index=corr["columns"], columns=corr["columns"])
+        self.vif_df = pd.DataFrame(payload["vif"])
+
+    def kpis(self, selection):
+        mask = np.ones(len(self.groups), dtype=bool)
+        for column, values in selection.items():
+            mask &= self.groups[column].isin(list(values)).to_numpy()
+        selected = self.groups[mask]
+        return {
+            "total_students": int(selected["rows"].sum()),
+            "avg_grade": _ratio(selected["grade_sum"].sum(), selected["grade_count"].sum()),
+            "avg_absences": _ratio(selected["absences_sum"].sum(), selected["absences_count"].sum()),
+            "high_risk": int(selected["high_risk"].sum()),
+        }
+
+
+# =========================
+# STORE (satu file per dataset)
+# =========================
+def store_path(path=None):
+    path = path or data_loader.DATASET_PATH
+    parquet_path, _ = data_loader.cache_paths(path)
+    return os.path.join(STATS_DIR, os.path.basename(parquet_path).replace(".parquet", ".json"))
+
+
+def store_token(path=None):
+    # berubah setiap kali store ditulis ulang / dihapus -> dipakai sebagai key cache di page
+    try:
+        return os.stat(store_path(path)).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _read(target):
+    try:
+        with open(target) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+@profiling.timed("dataset_stats")
+def load_or_build(path=None):
+    # dihitung sekali per versi dataset; proses/session lain cukup membaca file JSON kecil
+    path = path or data_loader.DATASET_PATH
+    target = store_path(path)
+    mtime_ns, size = data_loader.source_signature(path)
+
+    with _lock:
+        payload = _read(target)
+        if payload and payload.get("version") == STATS_VERSION:
+            if payload.get("mtime_ns") == mtime_ns and payload.get("size") == size:
+                return DatasetStats(payload)
+
+        digest = data_loader.file_hash(path)
+        if not (payload and payload.get("version") == STATS_VERSION and payload.get("sha256") == digest):
+            payload = {
+                "version": STATS_VERSION,
+                "source": path,
+                "sha256": digest,
+                **compute(data_loader.load_dataset(path)),
+            }
+        payload.update(mtime_ns=mtime_ns, size=size)
+
+        os.makedirs(STATS_DIR, exist_ok=True)
+        data_loader.write_json(target, payload)
+        return DatasetStats(payload)
+
+
+def invalidate(path=None):
+    # hapus store secara eksplisit (mis. setelah logika perhitungan berubah);
+    # page akan menghitung ulang pada rerun berikutnya karena store_token berubah
+    try:
+        os.remove(store_path(path))
+        return True
+    except FileNotFoundError:
+        return False
+
+
+# =========================
+# CLI
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute statistik dataset untuk dashboard & halaman ML")
+    parser.add_argument("--data", default=data_loader.DATASET_PATH)
+    parser.add_argument("--invalidate", action="store_true", help="hapus store lalu hitung ulang")
+    args = parser.parse_args(argv)
+
+    if args.invalidate:
+        invalidate(args.data)
+    stats = load_or_build(args.data)
+    print(
+        f"{store_path(args.data)}: {stats.rows} baris, {len(stats.groups)} grup KPI, "
+        f"korelasi {stats.corr.shape[0]}x{stats.corr.shape[1]}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+import argparse
+import atexit
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+import data_loader
+import model_registry
+
+# =========================
+# CONFIG
+# =========================
+DRIFT_DB = os.environ.get("STUDENT_DRIFT_DB", os.path.join(data_loader.CACHE_DIR, "drift.sqlite"))
+# bin rata di antara batas IQR training + 1 bin di bawah lower + 1 bin di atas upper
+PROFILE_BINS = 10
+# count per proses dikumpulkan di memori, ditulis ke SQLite paling sering sekali per interval
+FLUSH_INTERVAL = 5.0
+OBSERVE_CHUNK = 50_000
+
+# ambang PSI yang umum dipakai: < 0.1 stabil, 0.1-0.25 bergeser, > 0.25 drift
+PSI_WARN = 0.1
+PSI_ALERT = 0.25
+# PSI/KS belum berarti dengan sedikit input
+MIN_ROWS = 100
+# proporsi minimum per bin supaya bin kosong tidak membuat PSI inf
+EPSILON = 1e-4
+# pengganti 1 / lebar bin untuk fitur dengan lower == upper
+DEGENERATE_SCALE = 1e12
+
+STATUS_DRIFT = "Drift 🚨"
+STATUS_WARN = "Bergeser 👀"
+STATUS_STABLE = "Stabil ✅"
+STATUS_FEW = "Data kurang"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS drift_counts (
+    model TEXT NOT NULL,
+    feature TEXT NOT NULL,
+    bin INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (model, feature, bin)
+);
+CREATE TABLE IF NOT EXISTS drift_models (
+    model TEXT PRIMARY KEY,
+    rows INTEGER NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+"""
+
+
+# =========================
+# BINNING (profil training & input)
+# =========================
+def bin_counts(X, lower, upper, bins=PROFILE_BINS):
+    # (n, p) -> count (p, bins + 2). Edge cukup diturunkan dari batas IQR model, jadi
+    # profil training (in-memory, out-of-core, inkremental) dan input memakai bin yang sama
+    # dan count-nya bisa dijumlahkan antar chunk / proses.
+    X = np.asarray(X, dtype=np.float64)
+    n_features = X.shape[1]
+    finite = np.isfinite(X).all(axis=1)
+    if not finite.all():
+        X = X[finite]
+
+    # index bin global = offset fitur + bin lokal, dihitung dalam satu pass float lalu
+    # satu bincount; nilai tepat di upper masuk bin interior terakhir. Fitur dengan
+    # lower == upper (IQR 0): semua nilai selain batas itu jatuh ke bin overflow.
+    width = (upper - lower) / bins
+    scale = np.where(width > 0, 1 / np.where(width > 0, width, 1.0), DEGENERATE_SCALE)
+    offset = np.arange(n_features) * (bins + 2)
+    index = X * scale
+    index += offset + 1 - lower * scale
+    np.clip(index, offset, offset + bins + 1, out=index)
+    index = index.astype(np.intp)
+    index -= X == np.where(width > 0, upper, np.nan)
+    counts = np.bincount(index.ravel(), minlength=n_features * (bins + 2))
+    return counts.reshape(n_features, bins + 2)
+
+
+def bin_edges(pipeline, bins=PROFILE_BINS):
+    # (p, bins + 1): batas bin interior per fitur, untuk label chart
+    return np.linspace(pipeline.lower, pipeline.upper, bins + 1, axis=1)
+
+
+# =========================
+# DRIFT STATISTICS
+# =========================
+def proportions(counts):
+    counts = np.asarray(counts, dtype=np.float64)
+    totals = counts.sum(axis=-1, keepdims=True)
+    return counts / np.where(totals > 0, totals, 1.0)
+
+
+def psi(expected, actual):
+    # Population Stability Index per fitur dari count bin (axis terakhir)
+    e = np.maximum(proportions(expected), EPSILON)
+    a = np.maximum(proportions(actual), EPSILON)
+    return np.sum((a - e) * np.log(a / e), axis=-1)
+
+
+def ks(expected, actual):
+    # statistik KS dari CDF per bin; exact di batas bin (fitur ordinal = satu nilai per bin)
+    cdf = np.cumsum(proportions(expected), axis=-1) - np.cumsum(proportions(actual), axis=-1)
+    return np.abs(cdf).max(axis=-1)
+
+
+def status(psi_values, rows):
+    psi_values = np.asarray(psi_values)
+    labels = np.where(
+        psi_values >= PSI_ALERT, STATUS_DRIFT,
+        np.where(psi_values >= PSI_WARN, STATUS_WARN, STATUS_STABLE)
+    ).astype(object)
+    if rows < MIN_ROWS:
+        labels[:] = STATUS_FEW
+    return labels
+
+
+def report(pipeline, counts):
+    # tabel per fitur: biaya O(fitur x bin), tidak bergantung jumlah baris yang sudah di-score
+    import pandas as pd
+
+    rows = int(counts[0].sum()) if len(counts) else 0
+    psi_values = psi(pipeline.profile, counts)
+    out_of_range = counts[:, [0, -1]].sum(axis=1) / max(rows, 1)
+    return pd.DataFrame({
+        "Fitur": pipeline.features,
+        "PSI": psi_values.round(4),
+        "KS": ks(pipeline.profile, counts).round(4),
+        "Di luar rentang (%)": (out_of_range * 100).round(2),
+        "Status": status(psi_values, rows),
+    })
+
+
+# =========================
+# STORE (SQLite, dipakai bersama app + scoring service)
+# =========================
+def _connect(path=None):
+    path = path or DRIFT_DB
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    db = sqlite3.connect(path, timeout=30, isolation_level=None)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+def live_counts(pipeline, path=None):
+    # count input untuk model ini + info (rows, first_seen, last_seen); None jika belum ada input.
+    # Key = id isi model di registry: versi bisa sama untuk dua model yang dipublish di detik yang sama
+    model = model_registry.model_id(pipeline)
+    db = _connect(path)
+    try:
+        info = db.execute(
+            "SELECT rows, first_seen, last_seen FROM drift_models WHERE model = ?", (model,)
+        ).fetchone()
+        if info is None:
+            return None, None
+        counts = np.zeros_like(pipeline.profile, dtype=np.int64)
+        position = {feature: i for i, feature in enumerate(pipeline.features)}
+        for feature, index, count in db.execute(
+            "SELECT feature, bin, count FROM drift_counts WHERE model = ?", (model,)
+        ):
+            if feature in position and index < counts.shape[1]:
+                counts[position[feature], index] = count
+    finally:
+        db.close()
+    return counts, dict(zip(("rows", "first_seen", "last_seen"), info))
+
+
+def reset(model, path=None):
+    db = _connect(path)
+    try:
+        db.execute("DELETE FROM drift_counts WHERE model = ?", (model,))
+        db.execute("DELETE FROM drift_models WHERE model = ?", (model,))
+    finally:
+        db.close()
+
+
+class DriftMonitor:
+    # satu instance per proses (cache_resource di app, satu di scoring service).
+    # observe() hanya binning + penjumlahan di memori; SQLite disentuh sekali per FLUSH_INTERVAL
+    # dengan upsert count += delta, jadi beberapa proses bisa menulis ke store yang sama.
+
+    def __init__(self, path=None, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.flushed = time.monotonic()
+        atexit.register(self.flush)
+
+    def observe(self, pipeline, X):
+        # X = input mentah (sebelum clip), supaya nilai di luar rentang training ikut tercatat
+        X = np.asarray(X, dtype=np.float64)
+        if not pipeline.has_profile or X.shape[0] == 0:
+            return
+        counts = sum(
+            bin_counts(X[start:start + OBSERVE_CHUNK], pipeline.lower, pipeline.upper)
+            for start in range(0, X.shape[0], OBSERVE_CHUNK)
+        )
+
+        key = model_registry.model_id(pipeline)
+        with self.lock:
+            if key in self.pending:
+                self.pending[key][1] += counts
+            else:
+                self.pending[key] = [list(pipeline.features), counts]
+            due = time.monotonic() - self.flushed >= self.flush_interval
+
+        if due:
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # monitoring tidak boleh menggagalkan prediksi; count dicoba lagi di flush berikutnya
+                pass
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.flushed = time.monotonic()
+        if not pending:
+            return
+
+        now = time.time()
+        db = _connect(self.path)
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            for model, (features, counts) in pending.items():
+                feature_idx, bin_idx = np.nonzero(counts)
+                db.executemany(
+                    "INSERT INTO drift_counts (model, feature, bin, count) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (model, feature, bin) DO UPDATE SET count = count + excluded.count",
+                    [
+                        (model, features[i], int(j), int(counts[i, j]))
+                        for i, j in zip(feature_idx, bin_idx)
+                    ]
+                )
+                db.execute(
+                    "INSERT INTO drift_models (model, rows, first_seen, last_seen) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (model) DO UPDATE SET rows = rows + excluded.rows, last_seen = excluded.last_seen",
+                    (model, int(counts[0].sum()), now, now)
+                )
+            db.execute("COMMIT")
+        except sqlite3.Error:
+            if db.in_transaction:
+                db.execute("ROLLBACK")
+            self._restore(pending)
+            raise
+        finally:
+            db.close()
+
+    def _restore(self, pending):
+        with self.lock:
+            for model, (features, counts) in pending.items():
+                if model in self.pending:
+                    self.pending[model][1] += counts
+                else:
+                    self.pending[model] = [features, counts]
+
+
+# =========================
+# CLI
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drift input prediksi vs profil data training")
+    parser.add_argument("command", choices=["report", "reset"])
+    parser.add_argument("--db", default=DRIFT_DB)
+    parser.add_argument("--registry", default=model_registry.REGISTRY_DIR)
+    args = parser.parse_args(argv)
+
+    pipeline = model_registry.load_current(args.registry)
+    if args.command == "reset":
+        reset(model_registry.model_id(pipeline), args.db)
+        print(f"Count drift untuk model {pipeline.version} dihapus")
+        return
+
+    if not pipeline.has_profile:
+        print(f"Model {pipeline.version} tidak menyimpan profil training; latih ulang dulu")
+        return
+    counts, info = live_counts(pipeline, args.db)
+    if info is None:
+        print(f"Belum ada input untuk model {pipeline.version}")
+        return
+    print(f"Model {pipeline.version}: {info['rows']} baris input")
+    print(report(pipeline, counts).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+from concurrent.futures import as_completed
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+import tuning
+import worker_pool
+
+# =========================
+# CONFIG
+# =========================
+METRICS = ("MAE", "RMSE", "R²", "MAPE (%)")
+MODELS = ("Ridge Regression", "Lasso Regression", "Linear Regression")
+CV_FOLDS = 10
+CV_REPEATS = 3
+RANDOM_STATE = 42
+# naikkan jika isi report berubah, report lama di cache tidak dipakai lagi
+REPORT_VERSION = 1
+
+EVALUATION_CACHE_DIR = os.path.join(data_loader.CACHE_DIR, "evaluation")
+_memory_cache = {}
+
+
+# =========================
+# VECTORIZED METRICS
+# =========================
+def metrics_matrix(y_true, predictions):
+    # predictions: (n_model, n_row) -> (n_model, len(METRICS)) dalam satu pass
+    y = np.asarray(y_true, dtype=np.float64)
+    errors = np.atleast_2d(np.asarray(predictions, dtype=np.float64)) - y
+    squared = errors ** 2
+
+    mae = np.abs(errors).mean(axis=1)
+    rmse = np.sqrt(squared.mean(axis=1))
+    sst = np.sum((y - y.mean()) ** 2)
+    r2 = 1 - squared.sum(axis=1) / sst if sst > 0 else np.full(len(errors), np.nan)
+
+    # MAPE hanya untuk grade != 0 (pembagian dengan nol -> inf)
+    nonzero = y != 0
+    if nonzero.any():
+        mape = np.mean(np.abs(errors[:, nonzero]) / np.abs(y[nonzero]), axis=1) * 100
+    else:
+        mape = np.full(len(errors), np.nan)
+    return np.column_stack([mae, rmse, r2, mape])
+
+
+def metrics_table(y_true, predictions):
+    # predictions: dict nama model -> array prediksi
+    values = metrics_matrix(y_true, np.vstack(list(predictions.values())))
+    table = pd.DataFrame(values, columns=list(METRICS))
+    table.insert(0, "Model", list(predictions))
+    return table
+
+
+# =========================
+# K-FOLD / REPEATED CV
+# =========================
+def _fit_predict(X_train, y_train, X_val, ridge_alpha, lasso_alpha):
+    from sklearn.linear_model import Lasso, LinearRegression, Ridge
+
+    # scaler di-fit per fold (sama dengan StandardScaler), jadi fold validasi tidak bocor
+    mean = X_train.mean(axis=0)
+    scale = X_train.std(axis=0)
+    scale[scale == 0] = 1.0
+    train_scaled = (X_train - mean) / scale
+    val_scaled = (X_val - mean) / scale
+
+    return np.vstack([
+        Ridge(alpha=ridge_alpha).fit(train_scaled, y_train).predict(val_scaled),
+        Lasso(alpha=lasso_alpha).fit(train_scaled, y_train).predict(val_scaled),
+        LinearRegression().fit(X_train, y_train).predict(X_val),
+    ])
+
+
+def _run_fold(args):
+    X, y, train_idx, val_idx, ridge_alpha, lasso_alpha = args
+    predictions = _fit_predict(X[train_idx], y[train_idx], X[val_idx], ridge_alpha, lasso_alpha)
+    return metrics_matrix(y[val_idx], predictions)
+
+
+def cross_validate(X, y, ridge_alpha, lasso_alpha, cv=CV_FOLDS, repeats=CV_REPEATS,
+                   n_jobs=None, progress=None):
+    # hasil: array (cv * repeats, n_model, n_metric); progress(done, total) per fold
+    from sklearn.model_selection import KFold, RepeatedKFold
+
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    splitter = (
+        KFold(n_splits=cv) if repeats == 1
+        else RepeatedKFold(n_splits=cv, n_repeats=repeats, random_state=RANDOM_STATE)
+    )
+    tasks = [
+        (X, y, train_idx, val_idx, ridge_alpha, lasso_alpha)
+        for train_idx, val_idx in splitter.split(X)
+    ]
+
+    if n_jobs is None:
+        n_jobs = min(len(tasks), os.cpu_count() or 1) if X.shape[0] >= tuning.PARALLEL_MIN_ROWS else 1
+
+    fold_metrics = [None] * len(tasks)
+    if n_jobs > 1:
+        with worker_pool.process_pool(n_jobs) as pool:
+            futures = {pool.submit(_run_fold, task): i for i, task in enumerate(tasks)}
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    fold_metrics[futures[future]] = future.result()
+                    if progress:
+                        progress(done, len(tasks))
+            except BaseException:
+                pool.shutdown(cancel_futures=True)
+                raise
+    else:
+        for i, task in enumerate(tasks):
+            fold_metrics[i] = _run_fold(task)
+            if progress:
+                progress(i + 1, len(tasks))
+    return np.stack(fold_metrics)
+
+
+# =========================
+# REPORT (cached per data + alpha + skema CV)
+# =========================
+def _frame_records(values, models=MODELS):
+    table = pd.DataFrame(values, columns=list(METRICS))
+    table.insert(0, "Model", list(models))
+    return json.loads(table.to_json(orient="records"))
+
+
+def cv_inputs(result):
+    # seluruh data bersih (train + test) untuk CV; target sama dengan training
+    X = result.df_clean[list(result.feature_columns)].to_numpy(dtype=np.float64)
+    y = result.df_clean[result.y_train.name].to_numpy(dtype=np.float64)
+    return X, y
+
+
+def report_key(result, cv=CV_FOLDS, repeats=CV_REPEATS):
+    # dihitung sekali per TrainingResult: page memanggil ini di setiap rerun
+    if (cv, repeats) in result.evaluation_keys:
+        return result.evaluation_keys[(cv, repeats)]
+
+    X, y = cv_inputs(result)
+    digest = hashlib.sha256()
+    digest.update(f"{REPORT_VERSION}:{cv}:{repeats}".encode("utf-8"))
+    digest.update(repr((float(result.ridge.alpha), float(result.lasso.alpha))).encode("utf-8"))
+    for array in (X, y, np.asarray(result.y_test, dtype=np.float64)):
+        digest.update(str(array.shape).encode("utf-8"))
+        digest.update(np.ascontiguousarray(array).tobytes())
+    result.evaluation_keys[(cv, repeats)] = digest.hexdigest()
+    return result.evaluation_keys[(cv, repeats)]
+
+
+def cached_report(result, cv=CV_FOLDS, repeats=CV_REPEATS):
+    # hanya baca cache (dipakai page), tidak pernah menghitung
+    key = report_key(result, cv, repeats)
+    if key in _memory_cache:
+        return _memory_cache[key]
+    path = os.path.join(EVALUATION_CACHE_DIR, f"{key}.json")
+    if os.path.exists(path):
+        with open(path) as f:
+            _memory_cache[key] = json.load(f)
+        return _memory_cache[key]
+    return None
+
+
+def evaluate(result, cv=CV_FOLDS, repeats=CV_REPEATS, n_jobs=None, progress=None):
+    report = cached_report(result, cv, repeats)
+    if report is not None:
+        return report
+
+    X, y = cv_inputs(result)
+    folds = cross_validate(
+        X, y, float(result.ridge.alpha), float(result.lasso.alpha),
+        cv=cv, repeats=repeats, n_jobs=n_jobs, progress=progress
+    )
+    y_test = np.asarray(result.y_test, dtype=np.float64)
+    report = {
+        "version": REPORT_VERSION,
+        "holdout": json.loads(result.results_df.to_json(orient="records")),
+        "cv": {
+            "folds": cv,
+            "repeats": repeats,
+            "mean": _frame_records(np.nanmean(folds, axis=0)),
+            "std": _frame_records(np.nanstd(folds, axis=0)),
+        },
+        "ridge_alpha": float(result.ridge.alpha),
+        "lasso_alpha": float(result.lasso.alpha),
+        "rows": int(len(y)),
+        "rows_test": int(len(y_test)),
+        "mape_excluded_test": int(np.sum(y_test == 0)),
+    }
+
+    key = report_key(result, cv, repeats)
+    _memory_cache[key] = report
+    os.makedirs(EVALUATION_CACHE_DIR, exist_ok=True)
+    data_loader.write_json(os.path.join(EVALUATION_CACHE_DIR, f"{key}.json"), report)
+    return report
+
+
+def cv_table(report):
+    # mean ± std per model untuk ditampilkan di page
+    mean = pd.DataFrame(report["cv"]["mean"]).set_index("Model")
+    std = pd.DataFrame(report["cv"]["std"]).set_index("Model")
+    return mean.join(std, rsuffix=" std")[[
+        column for metric in METRICS for column in (metric, f"{metric} std")
+    ]]
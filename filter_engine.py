@@ -0,0 +1,120 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+
+# =========================
+# CONFIG
+# =========================
+FILTER_COLUMNS = ("sex", "grade")
+MAX_CACHED_VIEWS = 64
+
+# satu engine per dataset per proses (proses Streamlit maupun worker process)
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def selection_key(selection):
+    return tuple(sorted((column, frozenset(values)) for column, values in selection.items()))
+
+
+# =========================
+# FILTER VIEW
+# =========================
+class FilterView:
+    # satu kombinasi filter: mask dan agregat yang sudah dihitung. Frame hasil filter
+    # tidak disimpan: salinan per view (hingga MAX_CACHED_VIEWS per engine, di setiap
+    # worker process) jauh lebih besar daripada mask + ringkasan agregatnya
+
+    def __init__(self, df, mask):
+        self.df = df
+        self.mask = mask
+        self._aggregates = {}
+        self._lock = threading.Lock()
+
+    @property
+    def frame(self):
+        return self.df[self.mask]
+
+    def aggregate(self, name, func):
+        with self._lock:
+            if name not in self._aggregates:
+                self._aggregates[name] = func(self.frame)
+            return self._aggregates[name]
+
+
+# =========================
+# FILTER ENGINE
+# =========================
+class FilterEngine:
+
+    def __init__(self, df, columns=FILTER_COLUMNS, max_views=MAX_CACHED_VIEWS):
+        self.df = df
+        self.max_views = max_views
+        self._codes = {}
+        self._categories = {}
+        self._lookup = {}
+        for column in columns:
+            self.add_column(column)
+
+        self._column_masks = OrderedDict()
+        self._views = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add_column(self, column):
+        # kode kategori dihitung sekali; NaN mendapat kode -1 dan tidak pernah lolos filter
+        codes, categories = pd.factorize(self.df[column], sort=False)
+        self._codes[column] = codes
+        self._categories[column] = categories
+        self._lookup[column] = {value: i for i, value in enumerate(categories)}
+
+    def options(self, column):
+        return list(self._categories[column])
+
+    def _column_mask(self, column, selected):
+        key = (column, selected)
+        mask = self._column_masks.get(key)
+        if mask is None:
+            lookup = self._lookup[column]
+            # slot terakhir menampung kode -1 (NaN) dan selalu False
+            table = np.zeros(len(lookup) + 1, dtype=bool)
+            table[[lookup[v] for v in selected if v in lookup]] = True
+            mask = table[self._codes[column]]
+            self._column_masks[key] = mask
+        self._column_masks.move_to_end(key)
+        while len(self._column_masks) > self.max_views:
+            self._column_masks.popitem(last=False)
+        return mask
+
+    def select(self, selection):
+        key = selection_key(selection)
+
+        with self._lock:
+            view = self._views.get(key)
+            if view is not None:
+                self._views.move_to_end(key)
+                return view
+
+            # mask per kolom di-cache terpisah, jadi mengubah satu filter
+            # hanya menghitung ulang mask kolom tersebut
+            mask = np.ones(len(self.df), dtype=bool)
+            for column, selected in key:
+                mask &= self._column_mask(column, selected)
+
+            view = FilterView(self.df, mask)
+            self._views[key] = view
+            while len(self._views) > self.max_views:
+                self._views.popitem(last=False)
+            return view
+
+
+def shared_engine(path, signature):
+    with _engines_lock:
+        cached = _engines.get(path)
+        if cached is None or cached[0] != signature:
+            cached = (signature, FilterEngine(data_loader.load_dataset(path)))
+            _engines[path] = cached
+        return cached[1]
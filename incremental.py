@@ -0,0 +1,249 @@
+import argparse
+import hashlib
+import io
+import os
+import time
+
+import numpy as np
+
+import data_loader
+import drift_monitor
+import out_of_core
+import preprocessing
+import model_registry
+from model_pipeline import ModelPipeline
+
+# =========================
+# CONFIG
+# =========================
+CHUNK_SIZE = out_of_core.CHUNK_SIZE
+
+
+# =========================
+# NEW ROWS ONLY
+# =========================
+class _BoundedReader(io.RawIOBase):
+    # file yang berhenti di byte `end`: baris yang di-append selama update berjalan
+    # tidak ikut terbaca (offset yang disimpan = end), jadi diambil di update berikutnya
+
+    def __init__(self, f, end):
+        self.f = f
+        self.end = end
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self.end - self.f.tell())
+        if size <= 0:
+            return 0
+        data = self.f.read(size)
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _iter_new_rows(path, marker, chunksize, end):
+    import pandas as pd
+
+    if not path.lower().endswith(".csv"):
+        # format non-CSV tidak bisa di-seek per byte: lewati baris yang sudah di-ingest
+        skip = marker.get("rows", 0)
+        for chunk in data_loader.iter_chunks(path, chunksize):
+            if skip >= len(chunk):
+                skip -= len(chunk)
+                continue
+            yield chunk.iloc[skip:]
+            skip = 0
+        return
+
+    offset = marker.get("offset", 0)
+    if offset:
+        if os.path.getsize(path) < offset or data_loader.append_marker(path, 0, offset)["tail_sha256"] != marker["tail_sha256"]:
+            raise ValueError(f"{path} berubah selain append; jalankan training penuh ulang")
+
+    with open(path, "rb") as f:
+        header = f.readline().decode("utf-8").strip().split(",")
+        # baca mulai dari offset terakhir, baris lama tidak di-parse sama sekali
+        f.seek(max(offset, f.tell()))
+        if f.tell() >= end:
+            return
+        reader = io.BufferedReader(_BoundedReader(f, end))
+        yield from pd.read_csv(reader, header=None, names=header, chunksize=chunksize)
+
+
+def _rows_digest(digest, chunk):
+    import pandas as pd
+
+    digest.update(pd.util.hash_pandas_object(chunk, index=False).to_numpy().tobytes())
+
+
+# =========================
+# INCREMENTAL UPDATE
+# =========================
+def _load(pipeline_path, registry):
+    # default: model CURRENT di registry; --pipeline untuk file .npz tertentu
+    if pipeline_path:
+        return ModelPipeline.load(pipeline_path)
+    return model_registry.load_current(registry)
+
+
+def update(data_path, pipeline_path=None, retune=False, chunksize=CHUNK_SIZE,
+           registry=model_registry.REGISTRY_DIR, promote=True):
+    import pandas as pd
+
+    start = time.perf_counter()
+    pipeline = _load(pipeline_path, registry)
+    if not pipeline.stats:
+        raise ValueError("Artifact belum menyimpan statistik cukup; jalankan `python training.py` sekali")
+
+    folds, test = out_of_core.unpack_stats(pipeline.stats)
+    features = pipeline.features
+    lower, upper = pipeline.meta["target_bounds"]
+    bounds = pd.DataFrame(
+        {"lower": np.append(pipeline.lower, lower), "upper": np.append(pipeline.upper, upper)},
+        index=features + [out_of_core.TARGET]
+    )
+
+    key = os.path.normpath(data_path)
+    marker = pipeline.meta.get("sources", {}).get(key, {"rows": 0, "offset": 0})
+    row_counter = pipeline.meta.get("row_counter", 0)
+    # data hanya dibaca sampai ukuran ini; baris yang di-append selama update berjalan
+    # diambil update berikutnya (offset yang disimpan = batas baca yang sama)
+    size_at_start = os.path.getsize(data_path)
+
+    # count bin bersifat aditif: profil drift = profil lama + baris train baru
+    # (artifact lama tanpa profil tetap tanpa profil sampai training penuh)
+    profile = np.array(pipeline.profile, dtype=np.int64) if pipeline.has_profile else None
+
+    digest = hashlib.sha256(pipeline.version.encode("utf-8"))
+    new_rows = new_kept = 0
+    for chunk in _iter_new_rows(data_path, marker, chunksize, size_at_start):
+        _rows_digest(digest, chunk)
+        index = np.arange(row_counter + new_rows, row_counter + new_rows + len(chunk))
+        new_rows += len(chunk)
+
+        # bounds IQR tetap dari training awal, baris baru yang outlier dibuang
+        keep = ~preprocessing.outlier_mask(chunk, bounds)
+        X = chunk.loc[keep, features].to_numpy(dtype=np.float64)
+        y = chunk.loc[keep, out_of_core.TARGET].to_numpy(dtype=np.float64)
+        u = out_of_core._row_uniform(index[keep])
+        new_kept += len(y)
+
+        is_test = u < out_of_core.TEST_SIZE
+        test.update(X[is_test], y[is_test])
+        fold_id = ((u[~is_test] - out_of_core.TEST_SIZE) / (1 - out_of_core.TEST_SIZE) * len(folds)).astype(int)
+        for k, fold in enumerate(folds):
+            fold.update(X[~is_test][fold_id == k], y[~is_test][fold_id == k])
+        if profile is not None:
+            profile += drift_monitor.bin_counts(X[~is_test], pipeline.lower, pipeline.upper)
+
+    if new_rows == 0:
+        return None
+
+    alpha = pipeline.meta["ridge_alpha"]
+    ridge_tuning = None
+    if retune:
+        ridge_tuning = out_of_core.tune_ridge(folds)
+        alpha = ridge_tuning["best_alpha"]
+
+    train = sum(folds[1:], folds[0])
+    mean, scale = train.scaler()
+    coef, intercept = train.solve_ridge(alpha, scale)
+    weights, bias = out_of_core._raw_weights(coef, intercept, mean, scale)
+    cov, sigma2 = train.ridge_covariance(alpha, scale, weights, bias)
+
+    sources = dict(pipeline.meta.get("sources", {}))
+    sources[key] = data_loader.append_marker(data_path, marker.get("rows", 0) + new_rows, size_at_start)
+    updated = ModelPipeline(
+        features=features,
+        mean=mean,
+        scale=scale,
+        coef=coef,
+        intercept=intercept,
+        lower=pipeline.lower,
+        upper=pipeline.upper,
+        meta={
+            **pipeline.meta,
+            "ridge_alpha": float(alpha),
+            "mode": "incremental",
+            "parent_version": pipeline.version,
+            "row_counter": row_counter + new_rows,
+            "sources": sources,
+        },
+        stats=out_of_core.pack_stats(folds, test),
+        cov=cov,
+        sigma2=sigma2,
+        profile=profile
+    )
+    solve_ms = (time.perf_counter() - start) * 1000
+
+    version = model_registry.publish(updated, {
+        "mode": "incremental",
+        "parent_version": pipeline.version,
+        "source": key,
+        "rows_added": new_rows,
+        "rows_added_after_outliers": new_kept,
+        "rows_train": train.n,
+        "rows_test": test.n,
+        "ridge_alpha": float(alpha),
+        "features": features,
+        "metrics": {"Ridge Regression": out_of_core.evaluate(test, updated)}
+    }, digest.hexdigest(), registry, promote)
+
+    return {"version": version, "rows_added": new_rows, "rows_kept": new_kept,
+            "update_ms": round(solve_ms, 2), "ridge_tuning": ridge_tuning}
+
+
+def mark(data_path, pipeline_path=None, registry=model_registry.REGISTRY_DIR):
+    # tandai seluruh isi file saat ini sebagai sudah ada di model (tanpa ingest),
+    # mis. file hasil ekspor dari data yang sama dengan data training
+    pipeline = _load(pipeline_path, registry)
+    rows = sum(len(chunk) for chunk in data_loader.iter_chunks(data_path))
+    sources = dict(pipeline.meta.get("sources", {}))
+    sources[os.path.normpath(data_path)] = data_loader.append_marker(data_path, rows)
+    pipeline.meta = {**pipeline.meta, "sources": sources}
+    # versi model tetap sama, hanya metadata source yang berubah -> object baru di registry
+    object_id = model_registry.current_id(registry)
+    metrics = model_registry.metadata(object_id, registry)["metrics"] if object_id and not pipeline_path else {}
+    model_registry.promote(model_registry.register(pipeline, metrics, registry), registry)
+    return rows
+
+
+# =========================
+# CLI
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update model Ridge secara inkremental dari baris baru")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_update = sub.add_parser("update", help="ingest baris baru lalu solve ulang Ridge")
+    p_update.add_argument("--data", required=True)
+    p_update.add_argument("--pipeline", default=None, help="default: model CURRENT di registry")
+    p_update.add_argument("--registry", default=model_registry.REGISTRY_DIR)
+    p_update.add_argument("--retune", action="store_true", help="pilih ulang alpha lewat CV dari statistik fold")
+    p_update.add_argument("--chunksize", type=int, default=CHUNK_SIZE)
+    p_update.add_argument("--no-promote", action="store_true")
+
+    p_mark = sub.add_parser("mark", help="anggap isi file saat ini sudah ada di model")
+    p_mark.add_argument("--data", required=True)
+    p_mark.add_argument("--pipeline", default=None)
+    p_mark.add_argument("--registry", default=model_registry.REGISTRY_DIR)
+    args = parser.parse_args(argv)
+
+    if args.command == "mark":
+        rows = mark(args.data, args.pipeline, args.registry)
+        print(f"{args.data}: {rows} baris ditandai sudah di-ingest")
+        return
+
+    result = update(args.data, args.pipeline, args.retune, args.chunksize, args.registry, not args.no_promote)
+    if result is None:
+        print("Tidak ada baris baru")
+        return
+    print(
+        f"Model version {result['version']}: +{result['rows_added']} baris "
+        f"({result['rows_kept']} setelah outlier), update {result['update_ms']} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
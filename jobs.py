@@ -0,0 +1,365 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import uuid
+from contextlib import closing
+
+import data_loader
+
+# =========================
+# CONFIG
+# =========================
+JOBS_DB = os.environ.get("STUDENT_JOBS_DB", os.path.join(data_loader.CACHE_DIR, "jobs.sqlite"))
+HEARTBEAT_INTERVAL = 2.0
+# worker dianggap mati jika heartbeat lebih lama dari ini
+HEARTBEAT_TIMEOUT = 10.0
+POLL_INTERVAL = 0.5
+# worker yang distart otomatis dari app berhenti sendiri setelah idle selama ini
+IDLE_EXIT = 300.0
+
+ACTIVE = ("queued", "running")
+
+_lock = threading.Lock()
+# worker yang di-start proses ini (di-poll supaya tidak jadi zombie)
+_spawned = []
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    result TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    worker_pid INTEGER,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS workers (
+    pid INTEGER PRIMARY KEY,
+    heartbeat REAL NOT NULL
+);
+"""
+
+
+class JobCancelled(Exception):
+    pass
+
+
+# =========================
+# DATABASE
+# =========================
+def _connect(path=None):
+    path = path or JOBS_DB
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    db = sqlite3.connect(path, timeout=30, isolation_level=None)
+    db.row_factory = sqlite3.Row
+    # WAL: page membaca status job sementara worker menulis progress
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+def _row(row):
+    if row is None:
+        return None
+    job = dict(row)
+    job["params"] = json.loads(job["params"])
+    job["result"] = json.loads(job["result"]) if job["result"] else None
+    return job
+
+
+# =========================
+# JOB API
+# =========================
+def submit(kind, params, db_path=None):
+    if kind not in JOB_KINDS:
+        raise ValueError(f"Jenis job tidak dikenal: {kind}")
+    job_id = uuid.uuid4().hex[:12]
+    with closing(_connect(db_path)) as db:
+        db.execute(
+            "INSERT INTO jobs (id, kind, params, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+            (job_id, kind, json.dumps(params, sort_keys=True), time.time())
+        )
+    return job_id
+
+
+def get(job_id, db_path=None):
+    with closing(_connect(db_path)) as db:
+        return _row(db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone())
+
+
+def list_jobs(limit=20, kind=None, db_path=None):
+    query = "SELECT * FROM jobs"
+    args = ()
+    if kind:
+        query += " WHERE kind = ?"
+        args = (kind,)
+    with closing(_connect(db_path)) as db:
+        rows = db.execute(query + " ORDER BY created_at DESC LIMIT ?", args + (limit,)).fetchall()
+    return [_row(row) for row in rows]
+
+
+def cancel(job_id, db_path=None):
+    # job antrian langsung dibatalkan; job yang berjalan berhenti di batas fold berikutnya
+    with closing(_connect(db_path)) as db:
+        db.execute(
+            "UPDATE jobs SET status = 'cancelled', finished_at = ?, message = 'dibatalkan' "
+            "WHERE id = ? AND status = 'queued'",
+            (time.time(), job_id)
+        )
+        db.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (job_id,))
+
+
+def _claim(db, pid):
+    row = db.execute(
+        "UPDATE jobs SET status = 'running', started_at = ?, worker_pid = ? "
+        "WHERE id = (SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1) "
+        "AND status = 'queued' RETURNING *",
+        (time.time(), pid)
+    ).fetchone()
+    return _row(row)
+
+
+def _finish(db, job_id, status, result=None, error=None, message=""):
+    db.execute(
+        "UPDATE jobs SET status = ?, result = ?, error = ?, message = ?, finished_at = ?, "
+        "progress = CASE WHEN ? = 'done' THEN 1 ELSE progress END WHERE id = ?",
+        (status, json.dumps(result) if result is not None else None, error, message, time.time(), status, job_id)
+    )
+
+
+# =========================
+# JOB KINDS
+# =========================
+def _tune_job(params, progress):
+    import numpy as np
+
+    import training
+    import tuning
+
+    X_train_scaled, y_train = training.tuning_inputs(data_loader.load_dataset(params["data"]))
+    alphas = np.logspace(params.get("log_alpha_min", -3), params.get("log_alpha_max", 3), params.get("n_alphas", 20))
+    return tuning.tune(
+        params["model"], X_train_scaled, y_train,
+        alphas=alphas, cv=params.get("cv", tuning.CV_FOLDS),
+        progress=lambda done, total: progress(done / total, f"fold {done}/{total}")
+    )
+
+
+def _train_job(params, progress):
+    import evaluation
+    import training
+
+    path = params["data"]
+    result = training.run_pipeline(
+        data_loader.load_dataset(path),
+        progress=lambda fraction: progress(fraction, "tuning CV")
+    )
+    evaluation.evaluate(
+        result, progress=lambda done, total: progress(0.9 + 0.05 * done / total, f"evaluasi CV {done}/{total}")
+    )
+    progress(0.95, "menyimpan ke registry")
+    version = training.save_artifacts(
+        result, data_loader.file_hash(path), promote=params.get("promote", True), source=path
+    )
+    return {
+        "version": version,
+        "ridge_alpha": float(result.ridge.alpha),
+        "lasso_alpha": float(result.lasso.alpha),
+        "metrics": json.loads(result.results_df.to_json(orient="records")),
+    }
+
+
+def _evaluate_job(params, progress):
+    import evaluation
+    import training
+
+    # training memakai alpha dari cache tuning, jadi yang berat hanya fold CV-nya
+    progress(0.0, "training")
+    result = training.run_pipeline(data_loader.load_dataset(params["data"]))
+    report = evaluation.evaluate(
+        result, cv=params.get("cv", evaluation.CV_FOLDS), repeats=params.get("repeats", evaluation.CV_REPEATS),
+        progress=lambda done, total: progress(done / total, f"fold {done}/{total}")
+    )
+    return {"cv": report["cv"], "holdout": report["holdout"]}
+
+
+JOB_KINDS = {
+    "tune": _tune_job,
+    "train": _train_job,
+    "evaluate": _evaluate_job,
+}
+
+
+# =========================
+# WORKER
+# =========================
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def recover_stale(db):
+    # job 'running' milik worker yang sudah mati (crash / OOM / di-kill) ditandai gagal
+    for row in db.execute("SELECT id, worker_pid FROM jobs WHERE status = 'running'").fetchall():
+        if row["worker_pid"] and not _pid_alive(row["worker_pid"]):
+            _finish(db, row["id"], "failed", error="worker berhenti sebelum job selesai", message="gagal")
+    db.execute("DELETE FROM workers WHERE heartbeat < ?", (time.time() - HEARTBEAT_TIMEOUT,))
+
+
+def _heartbeat(db_path, pid, stop):
+    with closing(_connect(db_path)) as db:
+        # worker sudah hidup: placeholder dari ensure_worker tidak diperlukan lagi
+        db.execute("DELETE FROM workers WHERE pid = -1")
+        while not stop.is_set():
+            db.execute("INSERT OR REPLACE INTO workers (pid, heartbeat) VALUES (?, ?)", (pid, time.time()))
+            stop.wait(HEARTBEAT_INTERVAL)
+        db.execute("DELETE FROM workers WHERE pid = ?", (pid,))
+
+
+def run_job(db, job):
+    def progress(fraction, message=""):
+        db.execute(
+            "UPDATE jobs SET progress = ?, message = ? WHERE id = ?",
+            (float(min(max(fraction, 0.0), 1.0)), message, job["id"])
+        )
+        if db.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job["id"],)).fetchone()[0]:
+            raise JobCancelled()
+
+    try:
+        progress(0.0, "mulai")
+        result = JOB_KINDS[job["kind"]](job["params"], progress)
+    except JobCancelled:
+        _finish(db, job["id"], "cancelled", message="dibatalkan")
+    except Exception as exc:
+        _finish(db, job["id"], "failed", error="".join(traceback.format_exception_only(exc)).strip(), message="gagal")
+        traceback.print_exc()
+    else:
+        _finish(db, job["id"], "done", result=result, message="selesai")
+
+
+def worker(db_path=None, idle_exit=None):
+    pid = os.getpid()
+    stop = threading.Event()
+    beat = threading.Thread(target=_heartbeat, args=(db_path, pid, stop), daemon=True)
+    beat.start()
+    idle_since = time.monotonic()
+    try:
+        with closing(_connect(db_path)) as db:
+            recover_stale(db)
+            while True:
+                job = _claim(db, pid)
+                if job is None:
+                    if idle_exit is not None and time.monotonic() - idle_since > idle_exit:
+                        return
+                    time.sleep(POLL_INTERVAL)
+                    continue
+                run_job(db, job)
+                idle_since = time.monotonic()
+    finally:
+        stop.set()
+        beat.join()
+
+
+def worker_processes(processes=1, db_path=None, idle_exit=None):
+    if processes <= 1:
+        return worker(db_path, idle_exit)
+    ctx = multiprocessing.get_context("spawn")
+    children = [ctx.Process(target=worker, args=(db_path, idle_exit)) for _ in range(processes)]
+    for child in children:
+        child.start()
+    for child in children:
+        child.join()
+
+
+def ensure_worker(db_path=None):
+    # dipanggil app saat submit: start worker di background jika belum ada yang hidup
+    with _lock, closing(_connect(db_path)) as db:
+        _spawned[:] = [process for process in _spawned if process.poll() is None]
+        recover_stale(db)
+        workers = db.execute(
+            "SELECT pid FROM workers WHERE heartbeat >= ?", (time.time() - HEARTBEAT_TIMEOUT,)
+        ).fetchall()
+        if any(row["pid"] == -1 or _pid_alive(row["pid"]) for row in workers):
+            return False
+        command = [sys.executable, os.path.abspath(__file__), "--db", db_path or JOBS_DB,
+                   "worker", "--idle-exit", str(IDLE_EXIT)]
+        # output worker ke file log di samping database, bukan ke terminal Streamlit
+        with open(os.path.splitext(db_path or JOBS_DB)[0] + "-worker.log", "ab") as log:
+            _spawned.append(subprocess.Popen(
+                command, cwd=os.path.dirname(os.path.abspath(__file__)),
+                stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT, start_new_session=True
+            ))
+        # catat sementara supaya session lain tidak ikut men-start worker kedua
+        db.execute("INSERT OR REPLACE INTO workers (pid, heartbeat) VALUES (?, ?)", (-1, time.time()))
+        return True
+
+
+# =========================
+# CLI
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Job runner background (tuning / training / evaluasi) berbasis SQLite")
+    parser.add_argument("--db", default=JOBS_DB)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_worker = sub.add_parser("worker", help="jalankan worker yang mengambil job dari antrian")
+    p_worker.add_argument("--processes", type=int, default=1)
+    p_worker.add_argument("--idle-exit", type=float, default=None, help="berhenti setelah idle N detik")
+
+    p_submit = sub.add_parser("submit", help="masukkan job ke antrian")
+    p_submit.add_argument("kind", choices=sorted(JOB_KINDS))
+    p_submit.add_argument("--data", default=data_loader.DATASET_PATH)
+    p_submit.add_argument("--model", choices=["ridge", "lasso"], default="ridge")
+    p_submit.add_argument("--cv", type=int, default=10)
+    p_submit.add_argument("--repeats", type=int, default=3, help="jumlah pengulangan CV (job evaluate)")
+    p_submit.add_argument("--no-promote", action="store_true")
+
+    sub.add_parser("list", help="tampilkan job terbaru")
+    p_status = sub.add_parser("status", help="status dan hasil satu job")
+    p_status.add_argument("job_id")
+    p_cancel = sub.add_parser("cancel", help="batalkan job")
+    p_cancel.add_argument("job_id")
+    args = parser.parse_args(argv)
+
+    if args.command == "worker":
+        worker_processes(args.processes, args.db, args.idle_exit)
+    elif args.command == "submit":
+        params = {"data": args.data}
+        if args.kind == "tune":
+            params.update(model=args.model, cv=args.cv)
+        elif args.kind == "evaluate":
+            params.update(cv=args.cv, repeats=args.repeats)
+        else:
+            params.update(promote=not args.no_promote)
+        print(submit(args.kind, params, args.db))
+    elif args.command == "list":
+        for job in list_jobs(db_path=args.db):
+            created = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(job["created_at"]))
+            print(f"{job['id']}  {job['kind']:<8} {job['status']:<10} {job['progress']:>5.0%}  {created}  {job['message']}")
+    elif args.command == "status":
+        print(json.dumps(get(args.job_id, args.db), indent=2))
+    elif args.command == "cancel":
+        cancel(args.job_id, args.db)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,9 @@
 import streamlit as st
 
-def contact_me():
-
-    # =========================
-    # CUSTOM CSS (PASTEL CONTACT PAGE)
-    # =========================
-    st.markdown(
-        """
-        <style>
-        /* Background utama */
-        .stApp {
-            background-color: #FDF2F8; /* pink muda */
-        }
+import profiling
 
-        /* Sidebar */
-        section[data-testid="stSidebar"] {
-            background-color: #FADADD; /* pink pastel */
-        }
-
-        /* Header */
-        h1, h2, h3, h4 {
-            color: #831843;
-        }
-
-        /* Divider */
-        hr {
-            border-top: 1px solid #F9A8D4;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+@profiling.timed("contact")
+def contact_me():
 
     # =========================
     # CONTENT
@@ -1,181 +1,248 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
 
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import GridSearchCV, train_test_split
-from sklearn.linear_model import LinearRegression, Lasso, Ridge
-from sklearn.metrics import (
-    mean_absolute_error,
-    mean_squared_error,
-    r2_score
-)
+import data_loader
+import profiling
+from theme import PINK_BG
 
-from statsmodels.stats.outliers_influence import variance_inflation_factor
-import joblib
 
+# =========================
+# SHARED TRAINING
+# =========================
+# training hanya dijalankan sekali per versi dataset dan dipakai bersama oleh
+# semua session; dengan STUDENT_APP_WORKERS > 0 training jalan di worker process
+# dan page ini menampilkan status sampai hasilnya siap
+def load_training_result(path, signature):
+    import training
+    import worker_pool
 
-def ml_model():
+    return worker_pool.poll("training", (path, signature), training.run_from_path, path)
 
-    # =========================
-    # CUSTOM CSS (PINK THEME)
-    # =========================
-    st.markdown(
-        """
-        <style>
-        .stApp { background-color: #FDF2F8; }
-        section[data-testid="stSidebar"] { background-color: #FADADD; }
-        h1, h2, h3, h4 { color: #831843; }
-        hr { border-top: 1px solid #F9A8D4; }
-        </style>
-        """,
-        unsafe_allow_html=True
+
+# heatmap korelasi & VIF dari store precompute, dihitung sekali per versi dataset
+@st.cache_data(show_spinner=False)
+def load_dataset_stats(path, signature, token):
+    import dataset_stats
+    import worker_pool
+
+    return worker_pool.run(dataset_stats.load_or_build, path)
+
+
+def tuning_curve(tuning_result, name):
+    import plotly.express as px
+
+    fig = px.line(
+        x=tuning_result["alphas"],
+        y=tuning_result["mean_mse"],
+        log_x=True,
+        markers=True,
+        labels={"x": "alpha", "y": "CV MSE"},
+        title=f"{name}: CV MSE vs Alpha",
+        color_discrete_sequence=["#F9A8D4"]
     )
+    fig.update_layout(paper_bgcolor=PINK_BG, plot_bgcolor=PINK_BG)
+    return fig
 
-    # =========================
-    # TITLE
-    # =========================
-    st.title("📊 Student Performance Analysis & Modeling")
 
-    df = pd.read_excel("Student Performance Data.xlsx")
+# =========================
+# BACKGROUND JOBS
+# =========================
+JOB_ICONS = {"queued": "🕒", "running": "⏳", "done": "✅", "failed": "❌", "cancelled": "⛔"}
+JOB_POLL_SECONDS = 1.0
 
-    # =========================
-    # 1. IDENTIFIKASI TIPE DATA
-    # =========================
-    numbers = df.select_dtypes(include=["number"]).columns
+
+def _job_label(job):
+    params = job["params"]
+    if job["kind"] == "tune":
+        return f"Tuning {params['model'].title()} ({params.get('cv', 10)}-fold, {params.get('n_alphas', 20)} alpha)"
+    if job["kind"] == "evaluate":
+        return f"Evaluasi CV ({params.get('cv', 10)}-fold x{params.get('repeats', 3)})"
+    return "Training + simpan ke registry"
+
+
+def render_jobs():
+    import jobs
+
+    recent = jobs.list_jobs(limit=10)
+    if not recent:
+        st.caption("Belum ada job.")
+    for job in recent:
+        st.progress(
+            job["progress"],
+            text=f"{JOB_ICONS[job['status']]} `{job['id']}` {_job_label(job)} — {job['status']} {job['message']}"
+        )
+        if job["status"] in jobs.ACTIVE:
+            if st.button("Batalkan", key=f"cancel_{job['id']}"):
+                jobs.cancel(job["id"])
+                st.rerun(scope="fragment")
+        elif job["status"] == "done" and job["kind"] == "tune":
+            with st.expander(f"Best alpha: {job['result']['best_alpha']:.4g}"):
+                profiling.plotly_chart(
+                    tuning_curve(job["result"], job["params"]["model"].title()),
+                    use_container_width=True, key=f"curve_{job['id']}"
+                )
+        elif job["status"] == "done" and job["kind"] == "evaluate":
+            st.caption("Report CV tersimpan, lihat bagian ❾ Model Evaluation.")
+        elif job["status"] == "done":
+            st.caption(f"Versi `{job['result']['version']}` (Ridge alpha {job['result']['ridge_alpha']:.4g})")
+        elif job["status"] == "failed":
+            st.caption(f"Error: {job['error']}")
+    return any(job["status"] in jobs.ACTIVE for job in recent)
+
+
+def job_panel():
+    # hanya panel ini yang di-refresh selama ada job aktif, sisa halaman tidak ikut rerun
+    import jobs
+
+    recent = jobs.list_jobs(limit=10)
+    active = any(job["status"] in jobs.ACTIVE for job in recent)
+    if any(job["status"] == "queued" for job in recent):
+        # worker sebelumnya berhenti (idle / crash) sementara masih ada antrian
+        jobs.ensure_worker()
+
+    def panel():
+        if not render_jobs() and active:
+            # semua job selesai: rerun penuh sekali untuk mematikan polling
+            st.rerun()
+
+    st.fragment(panel, run_every=JOB_POLL_SECONDS if active else None)()
+
+
+@profiling.timed("machine_learning")
+def ml_model():
+    # sklearn/plotly hanya di-load saat halaman ML dibuka
+    with profiling.section("imports"):
+        import pandas as pd
+        import plotly.express as px
+
+        import dataset_stats
+        import evaluation
+        import jobs
+        import training
+        import worker_pool
 
     # =========================
-    # 2. OUTLIER HANDLING
+    # TITLE
     # =========================
-    st.header("❶ Deteksi dan Penanganan Outlier (IQR Method)")
+    with profiling.section("load_training"):
+        st.title("📊 Student Performance Analysis & Modeling")
 
-    Q1 = df[numbers].quantile(0.25)
-    Q3 = df[numbers].quantile(0.75)
-    IQR = Q3 - Q1
+        path = data_loader.DATASET_PATH
+        signature = data_loader.source_signature(path)
+        stats = load_dataset_stats(path, signature, dataset_stats.store_token(path))
+        with st.spinner("Training model..."):
+            result = load_training_result(path, signature)
+    if result is None:
+        worker_pool.rerun_later("⏳ Model sedang dilatih di worker process, halaman diperbarui otomatis...")
 
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
+    # =========================
+    # 1-2. OUTLIER HANDLING
+    # =========================
+    with profiling.section("outliers"):
+        st.header("❶ Deteksi dan Penanganan Outlier (IQR Method)")
 
-    st.write(f"Jumlah data sebelum pembersihan: **{df.shape[0]} baris**")
-    df = df[~((df[numbers] < lower_bound) | (df[numbers] > upper_bound)).any(axis=1)]
-    st.write(f"Jumlah data setelah pembersihan outlier: **{df.shape[0]} baris**")
+        st.write(f"Jumlah data sebelum pembersihan: **{result.rows_before} baris**")
+        st.write(f"Jumlah data setelah pembersihan outlier: **{result.rows_after} baris**")
 
     # =========================
     # 3. PREVIEW DATA
     # =========================
-    df_select = df[numbers]
-    st.dataframe(df.head(), use_container_width=True)
+    with profiling.section("preview"):
+        st.dataframe(result.df_clean.head(), use_container_width=True)
 
     # =========================
     # 4. KORELASI
     # =========================
-    
-    st.header("❷ Analisis Korelasi Antar Variabel Numerik")
+    with profiling.section("correlation"):
+        st.header("❷ Analisis Korelasi Antar Variabel Numerik")
 
-    col1, col2 = st.columns([6, 4])
+        col1, col2 = st.columns([6, 4])
 
-    PINK_BG = "#FDF2F8"  # pink muda pastel
-
-    with col1:
-        st.subheader("📈 Correlation Heatmap")
-
-        corr = df_select.corr().round(2)
-
-        fig = px.imshow(
-            corr,
-            text_auto=True,
-            aspect="auto",
-            color_continuous_scale="RdPu"
-        )
+        with col1:
+            st.subheader("📈 Correlation Heatmap")
 
-        fig.update_layout(
-            paper_bgcolor=PINK_BG,
-            plot_bgcolor=PINK_BG,
-            title_font=dict(size=16),
-            coloraxis_colorbar=dict(
-                bgcolor=PINK_BG
+            fig = px.imshow(
+                stats.corr,
+                text_auto=True,
+                aspect="auto",
+                color_continuous_scale="RdPu"
             )
-        )
 
-        st.plotly_chart(fig, use_container_width=True)
-
-    with col2:
-        st.subheader("📝 Interpretasi Korelasi")
-        st.write(
-            """
-            - **Mother Education – Father Education (0.63)**
-            Korelasi positif kuat.
-            Tingkat pendidikan ibu cenderung sejalan dengan tingkat pendidikan ayah.
-            - **Mother Education – Grade (0.24)**
-            Korelasi positif lemah.
-            Pendidikan ibu memiliki hubungan positif kecil terhadap nilai akhir siswa.
-            - **Father Education – Grade (0.19)**
-            Korelasi positif lemah.
-            Pendidikan ayah sedikit berhubungan dengan peningkatan nilai siswa.
-            - **Age – Grade (-0.20)**
-            Korelasi negatif lemah.
-            Semakin bertambah usia siswa, nilai akhir cenderung sedikit menurun.
-            - **Study Time – Grade (0.10)**
-            Korelasi positif sangat lemah.
-            Waktu belajar memiliki pengaruh kecil terhadap nilai akhir.
-            - **Travel Time – Grade (-0.11)**
-            Korelasi negatif sangat lemah.
-            Waktu perjalanan yang lebih lama sedikit berkaitan dengan penurunan nilai.
-            - **Absences – Grade (0.07)**
-            Korelasi positif sangat lemah.
-            Jumlah ketidakhadiran hampir tidak berpengaruh terhadap nilai akhir.
-            - **Health – Grade (-0.05)**
-            Korelasi sangat lemah (mendekati nol).
-            Kondisi kesehatan tidak menunjukkan hubungan berarti dengan nilai.
-
-            """
-        )
+            fig.update_layout(
+                paper_bgcolor=PINK_BG,
+                plot_bgcolor=PINK_BG,
+                title_font=dict(size=16),
+                coloraxis_colorbar=dict(
+                    bgcolor=PINK_BG
+                )
+            )
 
+            profiling.plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            st.subheader("📝 Interpretasi Korelasi")
+            st.write(
+                """
+                - **Mother Education – Father Education (0.63)**
+                Korelasi positif kuat.
+                Tingkat pendidikan ibu cenderung sejalan dengan tingkat pendidikan ayah.
+                - **Mother Education – Grade (0.24)**
+                Korelasi positif lemah.
+                Pendidikan ibu memiliki hubungan positif kecil terhadap nilai akhir siswa.
+                - **Father Education – Grade (0.19)**
+                Korelasi positif lemah.
+                Pendidikan ayah sedikit berhubungan dengan peningkatan nilai siswa.
+                - **Age – Grade (-0.20)**
+                Korelasi negatif lemah.
+                Semakin bertambah usia siswa, nilai akhir cenderung sedikit menurun.
+                - **Study Time – Grade (0.10)**
+                Korelasi positif sangat lemah.
+                Waktu belajar memiliki pengaruh kecil terhadap nilai akhir.
+                - **Travel Time – Grade (-0.11)**
+                Korelasi negatif sangat lemah.
+                Waktu perjalanan yang lebih lama sedikit berkaitan dengan penurunan nilai.
+                - **Absences – Grade (0.07)**
+                Korelasi positif sangat lemah.
+                Jumlah ketidakhadiran hampir tidak berpengaruh terhadap nilai akhir.
+                - **Health – Grade (-0.05)**
+                Korelasi sangat lemah (mendekati nol).
+                Kondisi kesehatan tidak menunjukkan hubungan berarti dengan nilai.
+
+                """
+            )
 
-    # =========================
-    # 5. SPLIT VARIABEL
-    # =========================
-    X = df_select.drop("grade", axis=1)
-    y = df_select["grade"]
 
     # =========================
-    # 6. VIF
+    # 5-6. VIF
     # =========================
-    st.header("❸ Uji Multikolinearitas (VIF)")
+    with profiling.section("vif"):
+        st.header("❸ Uji Multikolinearitas (VIF)")
 
-    vif_df = pd.DataFrame()
-    vif_df["Feature"] = X.columns
-    vif_df["VIF"] = [
-        variance_inflation_factor(X.values, i)
-        for i in range(X.shape[1])
-    ]
-    st.dataframe(vif_df, use_container_width=True)
+        st.dataframe(stats.vif_df, use_container_width=True)
 
     # =========================
     # 7. TRAIN TEST SPLIT
     # =========================
-    st.header("❹ Train Test Split")
+    with profiling.section("train_test_split"):
+        st.header("❹ Train Test Split")
 
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
-    )
+        X_train, X_test = result.X_train, result.X_test
+        y_train, y_test = result.y_train, result.y_test
 
-    st.write("Jumlah data train:", len(X_train))
-    st.write("Jumlah data test:", len(X_test))
+        st.write("Jumlah data train:", len(X_train))
+        st.write("Jumlah data test:", len(X_test))
 
-    tab1, tab2 = st.tabs(["📘 Data Train", "📕 Data Test"])
-    with tab1:
-        st.subheader("X_train")
-        st.dataframe(X_train.head())
-        st.subheader("y_train")
-        st.dataframe(y_train.head())
+        tab1, tab2 = st.tabs(["📘 Data Train", "📕 Data Test"])
+        with tab1:
+            st.subheader("X_train")
+            st.dataframe(X_train.head())
+            st.subheader("y_train")
+            st.dataframe(y_train.head())
 
-    with tab2:
-        st.subheader("X_test")
-        st.dataframe(X_test.head())
-        st.subheader("y_test")
-        st.dataframe(y_test.head())
+        with tab2:
+            st.subheader("X_test")
+            st.dataframe(X_test.head())
+            st.subheader("y_test")
+            st.dataframe(y_test.head())
 
 
     # =========================
@@ -183,167 +250,151 @@ def ml_model():
     # =========================
     st.header("❺ Standard Scaler")
 
-    scaler = StandardScaler()
-    X_train_scaled = scaler.fit_transform(X_train)
-    X_test_scaled = scaler.transform(X_test)
-
     # =========================
     # 9. LINEAR REGRESSION
     # =========================
-    st.header("❻ Linear Regression")
+    with profiling.section("linear_regression"):
+        st.header("❻ Linear Regression")
 
-    linreg = LinearRegression()
-    linreg.fit(X_train, y_train)
-
-    coef_df = pd.DataFrame({
-        "Feature": X.columns,
-        "Coefficient": linreg.coef_
-    })
-    st.dataframe(coef_df, use_container_width=True)
+        coef_df = pd.DataFrame({
+            "Feature": result.feature_columns,
+            "Coefficient": result.linreg.coef_
+        })
+        st.dataframe(coef_df, use_container_width=True)
 
     # =========================
     # 10. HYPERPARAMETER TUNING
     # =========================
-    st.header("❼ Hyperparameter Tuning")
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        if st.button("Tuning Ridge"):
-            ridge = Ridge()
-            grid = GridSearchCV(
-                ridge,
-                {"alpha": np.logspace(-3, 3, 20)},
-                cv=10,
-                scoring="neg_mean_squared_error"
-            )
-            grid.fit(X_train_scaled, y_train)
-            st.success(f"Best Alpha Ridge: {grid.best_params_['alpha']}")
-
-    with col2:
-        if st.button("Tuning Lasso"):
-            lasso = Lasso(max_iter=10000)
-            grid = GridSearchCV(
-                lasso,
-                {"alpha": np.logspace(-3, 3, 20)},
-                cv=10,
-                scoring="neg_mean_squared_error"
-            )
-            grid.fit(X_train_scaled, y_train)
-            st.success(f"Best Alpha Lasso: {grid.best_params_['alpha']}")
-    
-    # =========================
-    # 10. RIDGE vs LASSO
-    # =========================
-    st.header("❽ Regularization: Ridge vs Lasso")
-
-    col1, col2 = st.columns(2)
-
-    # -------- Ridge Regression --------
-    with col1:
-        st.subheader("📘 Ridge Regression")
-
-        ridge = Ridge(alpha=112)
-        ridge.fit(X_train_scaled, y_train)
+    with profiling.section("tuning"):
+        st.header("❼ Hyperparameter Tuning")
 
-        st.dataframe(
-            pd.DataFrame({
-                "Feature": X.columns,
-                "Coefficient": ridge.coef_
-            }),
-            use_container_width=True
+        st.caption(
+            "10-fold CV pada 20 nilai alpha (logspace -3 s/d 3). Alpha terbaik "
+            "otomatis dipakai untuk evaluasi dan model yang disimpan."
         )
 
-        y_pred = ridge.predict(X_test_scaled)
-
+        st.success(
+            f"Best Alpha Ridge: {result.ridge_tuning['best_alpha']} — "
+            f"Best Alpha Lasso: {result.lasso_tuning['best_alpha']}"
+        )
 
+        # grid lain dijalankan sebagai job background: halaman tetap responsif,
+        # progress per fold terlihat dan hasilnya tersimpan di .cache/jobs.sqlite
+        with st.expander("⚙️ Grid tuning (job background)"):
+            cv = st.select_slider("Jumlah fold CV", options=[3, 5, 10, 20], value=10)
+            log_min, log_max = st.slider("Rentang log10(alpha)", -5.0, 5.0, (-3.0, 3.0), step=0.5)
+            n_alphas = st.slider("Jumlah nilai alpha", 5, 100, 20)
 
-    # -------- Lasso Regression --------
-    with col2:
-        st.subheader("📕 Lasso Regression")
+        col1, col2, col3 = st.columns(3)
 
-        lasso = Lasso(alpha=0.33)
-        lasso.fit(X_train_scaled, y_train)
-
-        st.dataframe(
-            pd.DataFrame({
-                "Feature": X.columns,
-                "Coefficient": lasso.coef_
-            }),
-            use_container_width=True
-        )
-
-        y_pred = lasso.predict(X_test_scaled)
+        for col, model in ((col1, "ridge"), (col2, "lasso")):
+            with col:
+                if st.button(f"Tuning {model.title()}"):
+                    job_id = jobs.submit("tune", {
+                        "data": path, "model": model, "cv": cv, "n_alphas": n_alphas,
+                        "log_alpha_min": log_min, "log_alpha_max": log_max
+                    })
+                    jobs.ensure_worker()
+                    st.toast(f"Job `{job_id}` masuk antrian")
 
+        with col3:
+            # training penuh + simpan ke registry, tanpa menahan session ini
+            if st.button("🔁 Training ulang"):
+                job_id = jobs.submit("train", {"data": path, "promote": True})
+                jobs.ensure_worker()
+                st.toast(f"Job `{job_id}` masuk antrian")
 
+        st.subheader("📋 Job Background")
+        job_panel()
 
     # =========================
-    # 11. RIDGE & LASSO
+    # 10. RIDGE vs LASSO
     # =========================
-    st.header("❾ Model Evaluation")
+    with profiling.section("ridge_lasso"):
+        st.header("❽ Regularization: Ridge vs Lasso")
 
-    # Ridge
-    ridge = Ridge(alpha=112)
-    ridge.fit(X_train_scaled, y_train)
-    y_pred_ridge = ridge.predict(X_test_scaled)
+        col1, col2 = st.columns(2)
 
-    # Lasso
-    lasso = Lasso(alpha=0.33)
-    lasso.fit(X_train_scaled, y_train)
-    y_pred_lasso = lasso.predict(X_test_scaled)
+        # -------- Ridge Regression --------
+        with col1:
+            st.subheader("📘 Ridge Regression")
 
-    # Linear Regression
-    y_pred_linreg = linreg.predict(X_test)
+            st.dataframe(
+                pd.DataFrame({
+                    "Feature": result.feature_columns,
+                    "Coefficient": result.ridge.coef_
+                }),
+                use_container_width=True
+            )
 
-    # =========================
-    # CREATE COMPARISON TABLE
-    # =========================
+        # -------- Lasso Regression --------
+        with col2:
+            st.subheader("📕 Lasso Regression")
 
-    results_df = pd.DataFrame({
-        "Model": ["Ridge Regression", "Lasso Regression", "Linear Regression"],
-        "MAE": [
-            mean_absolute_error(y_test, y_pred_ridge),
-            mean_absolute_error(y_test, y_pred_lasso),
-            mean_absolute_error(y_test, y_pred_linreg)
-        ],
-        "RMSE": [
-            np.sqrt(mean_squared_error(y_test, y_pred_ridge)),
-            np.sqrt(mean_squared_error(y_test, y_pred_lasso)),
-            np.sqrt(mean_squared_error(y_test, y_pred_linreg))
-        ],
-        "R²": [
-            ridge.score(X_test_scaled, y_test),
-            lasso.score(X_test_scaled, y_test),
-            r2_score(y_test, y_pred_linreg)
-        ],
-        "MAPE (%)": [
-            np.mean(np.abs((y_test - y_pred_ridge) / y_test)) * 100,
-            np.mean(np.abs((y_test - y_pred_lasso) / y_test)) * 100,
-            np.mean(np.abs((y_test - y_pred_linreg) / y_test)) * 100
-        ]
-    })
+            st.dataframe(
+                pd.DataFrame({
+                    "Feature": result.feature_columns,
+                    "Coefficient": result.lasso.coef_
+                }),
+                use_container_width=True
+            )
 
     # =========================
-    # DISPLAY TABLE
+    # 11. RIDGE & LASSO
     # =========================
+    with profiling.section("evaluation"):
+        st.header("❾ Model Evaluation")
 
-    st.subheader("📊 Model Performance Comparison")
-    st.dataframe(
-        results_df.style.format({
-            "MAE": "{:.3f}",
-            "RMSE": "{:.3f}",
-            "R²": "{:.3f}",
-            "MAPE (%)": "{:.2f}"
-        }),
-        use_container_width=True
-    )
+        results_df = result.results_df
+
+        st.subheader("📊 Model Performance Comparison")
+        st.dataframe(
+            results_df.style.format({
+                "MAE": "{:.3f}",
+                "RMSE": "{:.3f}",
+                "R²": "{:.3f}",
+                "MAPE (%)": "{:.2f}"
+            }),
+            use_container_width=True
+        )
+        n_zero = int((result.y_test == 0).sum())
+        if n_zero:
+            st.caption(f"MAPE dihitung tanpa {n_zero} siswa dengan grade 0 (pembagian dengan nol).")
+
+        # CV hanya dibaca dari cache; perhitungannya lewat job background (train / evaluate)
+        st.subheader(f"🔁 {evaluation.CV_FOLDS}-fold Cross-Validation x{evaluation.CV_REPEATS}")
+        report = evaluation.cached_report(result)
+        if report is not None:
+            st.dataframe(
+                evaluation.cv_table(report).style.format("{:.3f}"),
+                use_container_width=True
+            )
+        else:
+            st.caption("Report CV belum tersedia untuk data & alpha ini.")
+            if st.button("📐 Hitung Cross-Validation"):
+                job_id = jobs.submit("evaluate", {
+                    "data": path, "cv": evaluation.CV_FOLDS, "repeats": evaluation.CV_REPEATS
+                })
+                jobs.ensure_worker()
+                st.toast(f"Job `{job_id}` masuk antrian (lihat 📋 Job Background)")
 
     # =========================
     # 13. SAVE MODEL
     # =========================
-    st.header("💾 Save Model")
+    with profiling.section("save_model"):
+        st.header("💾 Save Model")
 
-    joblib.dump(ridge, "model_ridge.pkl")
-    joblib.dump(X.columns, "numeric_columns.pkl")
+        st.caption(
+            "Model didaftarkan sebagai versi baru di `registry/` lalu dijadikan CURRENT; "
+            "halaman Prediction langsung memakai model baru. Training juga bisa dijalankan offline: "
+            "`python training.py`"
+        )
 
-    st.success("Model berhasil disimpan ✅")
+        if st.button("💾 Simpan Model"):
+            version = training.save_artifacts(result, data_loader.file_hash(path), source=path)
+            st.success(f"Model berhasil disimpan ✅ (versi `{version}`)")
+            if report is None:
+                st.caption(
+                    "Report CV belum ada, jadi tidak ikut tersimpan di metadata model. "
+                    "Jalankan job `train` untuk training + evaluasi + simpan sekaligus."
+                )
@@ -0,0 +1,173 @@
+import json
+import os
+from dataclasses import dataclass, field
+from statistics import NormalDist
+
+import numpy as np
+
+# =========================
+# CONFIG
+# =========================
+PIPELINE_PATH = "model_pipeline.npz"
+STATS_KEYS = ("n", "mean", "m2")
+# interval prediksi default: 90% (mean +- z * std prediksi)
+INTERVAL_LEVEL = 0.90
+
+
+# =========================
+# MODEL PIPELINE
+# =========================
+# Seluruh pipeline serving (bounds IQR -> StandardScaler -> Ridge) disimpan
+# sebagai array NumPy biasa, jadi prediksi cukup clip + dot product tanpa sklearn.
+# `stats` (opsional) berisi statistik cukup per fold + test untuk update inkremental.
+# `cov` + `sigma2` (opsional) = kovarians Ridge dan varians residual untuk interval prediksi;
+# artifact lama tanpa keduanya tetap bisa dipakai (interval = titik prediksi).
+# `profile` (opsional) = count bin data train per fitur (drift_monitor.bin_counts), referensi
+# untuk memantau drift input prediksi.
+# `object_id` = id isi model di registry (model_registry.model_id), diisi saat load dari registry.
+@dataclass
+class ModelPipeline:
+    features: list
+    mean: np.ndarray
+    scale: np.ndarray
+    coef: np.ndarray
+    intercept: float
+    lower: np.ndarray
+    upper: np.ndarray
+    meta: dict = field(default_factory=dict)
+    stats: dict = field(default_factory=dict)
+    cov: np.ndarray = None
+    sigma2: float = 0.0
+    profile: np.ndarray = None
+    object_id: str = None
+
+    def __post_init__(self):
+        # scaler dilipat ke dalam bobot: ((x - mean) / scale) @ coef + b = x @ w + b0
+        self.weights = self.coef / self.scale
+        self.bias = self.intercept - float((self.mean / self.scale) @ self.coef)
+        # importance global = RMS kontribusi di data train = |coef| (fitur scaled ber-std 1)
+        self.importance = np.abs(np.asarray(self.coef, dtype=np.float64))
+        if self.has_intervals:
+            # cov = F F' (eigh, aman untuk matriks semi-definit), mean dilipat ke offset:
+            # [1, x - mean] @ F = x @ F[1:] + offset
+            eigval, eigvec = np.linalg.eigh(np.asarray(self.cov, dtype=np.float64))
+            factor = eigvec * np.sqrt(np.clip(eigval, 0, None))
+            self._factor = factor[1:]
+            self._offset = factor[0] - self.mean @ factor[1:]
+
+    @property
+    def version(self):
+        return self.meta.get("version", "unknown")
+
+    @property
+    def has_intervals(self):
+        return self.cov is not None
+
+    @property
+    def has_profile(self):
+        return self.profile is not None
+
+    @classmethod
+    def from_training(cls, result, meta=None):
+        features = list(result.feature_columns)
+        return cls(
+            features=features,
+            mean=np.asarray(result.scaler.mean_, dtype=np.float64),
+            scale=np.asarray(result.scaler.scale_, dtype=np.float64),
+            coef=np.asarray(result.ridge.coef_, dtype=np.float64),
+            intercept=float(result.ridge.intercept_),
+            lower=result.bounds.loc[features, "lower"].to_numpy(dtype=np.float64),
+            upper=result.bounds.loc[features, "upper"].to_numpy(dtype=np.float64),
+            meta=dict(meta or {})
+        )
+
+    # =========================
+    # SERIALIZATION
+    # =========================
+    def save(self, path=PIPELINE_PATH):
+        tmp = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp,
+            features=np.array(self.features, dtype=str),
+            mean=self.mean,
+            scale=self.scale,
+            coef=self.coef,
+            intercept=np.array(self.intercept),
+            lower=self.lower,
+            upper=self.upper,
+            meta=np.array(json.dumps(self.meta)),
+            **{f"stats_{key}": value for key, value in self.stats.items()},
+            **({"cov": self.cov, "sigma2": np.array(self.sigma2)} if self.has_intervals else {}),
+            **({"profile": self.profile} if self.has_profile else {})
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=PIPELINE_PATH):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                features=data["features"].tolist(),
+                mean=data["mean"],
+                scale=data["scale"],
+                coef=data["coef"],
+                intercept=float(data["intercept"]),
+                lower=data["lower"],
+                upper=data["upper"],
+                meta=json.loads(str(data["meta"])),
+                stats={key: data[f"stats_{key}"] for key in STATS_KEYS if f"stats_{key}" in data},
+                cov=data["cov"] if "cov" in data else None,
+                sigma2=float(data["sigma2"]) if "sigma2" in data else 0.0,
+                profile=data["profile"] if "profile" in data else None
+            )
+
+    # =========================
+    # PREDICTION
+    # =========================
+    def clip(self, X):
+        out_of_range = (X < self.lower) | (X > self.upper)
+        return np.clip(X, self.lower, self.upper), out_of_range
+
+    def predict(self, X):
+        X, out_of_range = self.clip(np.asarray(X, dtype=np.float64))
+        return np.clip(X @ self.weights + self.bias, 0, 100), out_of_range
+
+    # =========================
+    # EXPLANATION (linear SHAP)
+    # =========================
+    @property
+    def base_value(self):
+        # prediksi siswa "rata-rata" data train; base_value + jumlah kontribusi = prediksi sebelum clip 0-100
+        return float(self.intercept)
+
+    def contributions(self, X):
+        # X sudah di-clip. SHAP exact untuk model linear: coef_j * nilai scaled = w_j * (x_j - mean_j)
+        contributions = X - self.mean
+        contributions *= self.weights
+        return contributions
+
+    def explain(self, X):
+        X, out_of_range = self.clip(np.asarray(X, dtype=np.float64))
+        return self.contributions(X), out_of_range
+
+    def half_width(self, X, level=INTERVAL_LEVEL):
+        # X sudah di-clip. var = [1, d] cov [1, d]' + sigma2 dengan d = x - mean:
+        # satu matmul kecil (n x p @ p x p+1) per batch, tanpa bootstrap / refit
+        if not self.has_intervals:
+            return np.zeros(X.shape[0])
+        projected = X @ self._factor
+        projected += self._offset
+        var = np.einsum("ij,ij->i", projected, projected)
+        var += self.sigma2
+        return NormalDist().inv_cdf(0.5 + level / 2) * np.sqrt(var, out=var)
+
+    def predict_interval(self, X, level=INTERVAL_LEVEL):
+        X, out_of_range = self.clip(np.asarray(X, dtype=np.float64))
+        raw = X @ self.weights + self.bias
+        half = self.half_width(X, level)
+        return (
+            np.clip(raw, 0, 100),
+            np.clip(raw - half, 0, 100),
+            np.clip(raw + half, 0, 100),
+            out_of_range
+        )
+
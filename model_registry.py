@@ -0,0 +1,288 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+import numpy as np
+
+from model_pipeline import PIPELINE_PATH, ModelPipeline
+
+# =========================
+# CONFIG
+# =========================
+REGISTRY_DIR = os.environ.get("STUDENT_REGISTRY_DIR", "registry")
+ARRAY_FIELDS = ("mean", "scale", "coef", "lower", "upper")
+RELOAD_INTERVAL = 1.0
+# label / lineage yang berubah di setiap publish, bukan bagian dari isi model
+VOLATILE_META = ("version", "parent_version")
+
+
+# =========================
+# LAYOUT
+# =========================
+# registry/
+#   objects/<id>/      satu model: array .npy (di-memory-map saat load) + metadata.json
+#   CURRENT            id model yang sedang dipakai (diganti atomik lewat os.replace)
+#   history.jsonl      log promosi, dipakai untuk audit / rollback
+def _object_dir(object_id, root):
+    return os.path.join(root, "objects", object_id)
+
+
+def content_id(pipeline):
+    # id = hash isi model (array + schema + meta deterministik), model yang sama tidak
+    # disimpan dua kali; versi (timestamp) hanya label dan tidak ikut di-hash
+    digest = hashlib.sha256()
+    digest.update(json.dumps(pipeline.features).encode("utf-8"))
+    digest.update(repr(float(pipeline.intercept)).encode("utf-8"))
+    for name in ARRAY_FIELDS:
+        digest.update(np.ascontiguousarray(getattr(pipeline, name), dtype=np.float64).tobytes())
+    for key in sorted(pipeline.stats):
+        digest.update(np.ascontiguousarray(pipeline.stats[key]).tobytes())
+    if pipeline.has_intervals:
+        digest.update(np.ascontiguousarray(pipeline.cov, dtype=np.float64).tobytes())
+        digest.update(repr(float(pipeline.sigma2)).encode("utf-8"))
+    if pipeline.has_profile:
+        digest.update(np.ascontiguousarray(pipeline.profile, dtype=np.int64).tobytes())
+    meta = {key: value for key, value in pipeline.meta.items() if key not in VOLATILE_META}
+    digest.update(json.dumps(meta, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def model_id(pipeline):
+    # key cache prediksi / count drift: id isi model, bukan versi (resolusi versi hanya 1 detik).
+    # Model dari registry sudah membawa id-nya; file .npz di-hash sekali lalu disimpan
+    if pipeline.object_id is None:
+        pipeline.object_id = content_id(pipeline)
+    return pipeline.object_id
+
+
+# =========================
+# REGISTER & PROMOTE
+# =========================
+def register(pipeline, metrics=None, root=REGISTRY_DIR):
+    object_id = content_id(pipeline)
+    target = _object_dir(object_id, root)
+    if os.path.isdir(target):
+        _fill_metrics(object_id, metrics, root)
+        return object_id
+
+    # ditulis ke direktori sementara lalu di-rename: pembaca tidak pernah melihat object setengah jadi
+    tmp = f"{target}.{os.getpid()}.tmp"
+    os.makedirs(tmp, exist_ok=True)
+    for name in ARRAY_FIELDS:
+        np.save(os.path.join(tmp, f"{name}.npy"), np.asarray(getattr(pipeline, name), dtype=np.float64))
+    for key, value in pipeline.stats.items():
+        np.save(os.path.join(tmp, f"stats_{key}.npy"), value)
+    if pipeline.has_intervals:
+        np.save(os.path.join(tmp, "cov.npy"), np.asarray(pipeline.cov, dtype=np.float64))
+    if pipeline.has_profile:
+        np.save(os.path.join(tmp, "profile.npy"), np.asarray(pipeline.profile, dtype=np.int64))
+
+    info = {
+        "id": object_id,
+        "version": pipeline.version,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "data_sha256": pipeline.meta.get("data_sha256"),
+        "intercept": float(pipeline.intercept),
+        "sigma2": float(pipeline.sigma2) if pipeline.has_intervals else None,
+        "features": [
+            {"name": name, "lower": float(lo), "upper": float(hi), "importance": float(importance)}
+            for name, lo, hi, importance in zip(
+                pipeline.features, pipeline.lower, pipeline.upper, pipeline.importance
+            )
+        ],
+        "meta": pipeline.meta,
+        "metrics": metrics or {},
+    }
+    with open(os.path.join(tmp, "metadata.json"), "w") as f:
+        json.dump(info, f, indent=2)
+
+    try:
+        os.rename(tmp, target)
+    except OSError:
+        # proses lain sudah mendaftarkan model yang sama
+        shutil.rmtree(tmp, ignore_errors=True)
+    return object_id
+
+
+def _fill_metrics(object_id, metrics, root):
+    # model identik didaftarkan ulang: isi object tetap, hanya metrics yang dulu belum ada
+    # (mis. report CV yang baru dihitung setelah model pertama kali disimpan) dilengkapi
+    info = metadata(object_id, root)
+    missing = {
+        key: value for key, value in (metrics or {}).items()
+        if value is not None and info["metrics"].get(key) is None
+    }
+    if not missing:
+        return
+    info["metrics"].update(missing)
+    path = os.path.join(_object_dir(object_id, root), "metadata.json")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(info, f, indent=2)
+    os.replace(tmp, path)
+
+
+def resolve(ref, root=REGISTRY_DIR):
+    # terima id object atau string versi
+    if os.path.isdir(_object_dir(ref, root)):
+        return ref
+    for info in list_models(root):
+        if info["version"] == ref:
+            return info["id"]
+    raise KeyError(f"Model tidak ditemukan di registry: {ref}")
+
+
+def promote(ref, root=REGISTRY_DIR):
+    object_id = resolve(ref, root)
+    path = os.path.join(root, "CURRENT")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(object_id)
+    os.replace(tmp, path)
+
+    with open(os.path.join(root, "history.jsonl"), "a") as f:
+        f.write(json.dumps({"ts": time.time(), "id": object_id}) + "\n")
+    return object_id
+
+
+def publish(pipeline, metrics=None, data_hash="", root=REGISTRY_DIR, make_current=True):
+    # versi baru dari training / update inkremental: daftarkan lalu (opsional) promosikan
+    version = f"{time.strftime('%Y%m%d-%H%M%S')}-{data_hash[:8]}"
+    pipeline.meta.update(version=version, data_sha256=data_hash)
+    object_id = register(pipeline, metrics, root)
+    # model identik sudah terdaftar: object lama dipakai ulang beserta versinya
+    version = metadata(object_id, root)["version"]
+    pipeline.meta["version"] = version
+    if make_current:
+        promote(object_id, root)
+    return version
+
+
+# =========================
+# LOAD
+# =========================
+def current_id(root=REGISTRY_DIR):
+    try:
+        with open(os.path.join(root, "CURRENT")) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def metadata(object_id, root=REGISTRY_DIR):
+    with open(os.path.join(_object_dir(object_id, root), "metadata.json")) as f:
+        return json.load(f)
+
+
+def load(object_id, root=REGISTRY_DIR, mmap=True):
+    # array di-memory-map read-only: semua worker process berbagi page cache yang sama
+    directory = _object_dir(object_id, root)
+    info = metadata(object_id, root)
+
+    mode = "r" if mmap else None
+    arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mode) for name in ARRAY_FIELDS}
+    stats = {
+        name[len("stats_"):-len(".npy")]: np.load(os.path.join(directory, name), mmap_mode=mode)
+        for name in os.listdir(directory) if name.startswith("stats_")
+    }
+    # object lama (sebelum interval prediksi) tidak punya cov.npy
+    cov_path = os.path.join(directory, "cov.npy")
+    cov = np.load(cov_path, mmap_mode=mode) if os.path.exists(cov_path) else None
+    # begitu juga profile.npy (sebelum drift monitoring)
+    profile_path = os.path.join(directory, "profile.npy")
+    profile = np.load(profile_path, mmap_mode=mode) if os.path.exists(profile_path) else None
+    return ModelPipeline(
+        features=[feature["name"] for feature in info["features"]],
+        intercept=info["intercept"],
+        meta=info["meta"],
+        stats=stats,
+        cov=cov,
+        sigma2=info.get("sigma2") or 0.0,
+        profile=profile,
+        object_id=object_id,
+        **arrays
+    )
+
+
+def load_current(root=REGISTRY_DIR, fallback=PIPELINE_PATH):
+    # registry kosong (mis. clone baru) atau root=None -> file .npz bawaan repo
+    object_id = current_id(root) if root else None
+    return load(object_id, root) if object_id else ModelPipeline.load(fallback)
+
+
+def list_models(root=REGISTRY_DIR):
+    objects = os.path.join(root, "objects")
+    if not os.path.isdir(objects):
+        return []
+    models = []
+    for object_id in os.listdir(objects):
+        path = os.path.join(objects, object_id, "metadata.json")
+        if os.path.exists(path):
+            with open(path) as f:
+                models.append(json.load(f))
+    return sorted(models, key=lambda m: m["created_at"])
+
+
+class CurrentModel:
+    # untuk proses yang berjalan lama (scoring service): cek CURRENT paling sering
+    # sekali per `interval` detik dan load ulang saat model yang dipromosikan berubah.
+    # root=None -> selalu pakai file fallback, tanpa reload
+
+    def __init__(self, root=REGISTRY_DIR, fallback=PIPELINE_PATH, interval=RELOAD_INTERVAL):
+        self.root = root
+        self.fallback = fallback
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.object_id = current_id(root) if root else None
+        self.pipeline = load_current(root, fallback)
+        self.checked = time.monotonic()
+
+    def get(self):
+        now = time.monotonic()
+        if self.root is None or now - self.checked < self.interval:
+            return self.pipeline
+        with self.lock:
+            self.checked = now
+            object_id = current_id(self.root)
+            if object_id and object_id != self.object_id:
+                self.pipeline = load(object_id, self.root)
+                self.object_id = object_id
+        return self.pipeline
+
+
+# =========================
+# CLI
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Registry model lokal (versi, promosi, rollback)")
+    parser.add_argument("--registry", default=REGISTRY_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="tampilkan semua model terdaftar")
+    p_promote = sub.add_parser("promote", help="jadikan model (id atau versi) sebagai CURRENT")
+    p_promote.add_argument("ref")
+    p_import = sub.add_parser("import", help="daftarkan file .npz lama ke registry")
+    p_import.add_argument("path", nargs="?", default=PIPELINE_PATH)
+    p_import.add_argument("--promote", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        current = current_id(args.registry)
+        for info in list_models(args.registry):
+            marker = "*" if info["id"] == current else " "
+            rmse = info["metrics"].get("metrics", {}).get("Ridge Regression", {}).get("RMSE")
+            print(f"{marker} {info['id']}  {info['version']:<28} {info['meta'].get('mode', 'full'):<12} RMSE={rmse}")
+    elif args.command == "promote":
+        print(f"CURRENT -> {promote(args.ref, args.registry)}")
+    elif args.command == "import":
+        object_id = register(ModelPipeline.load(args.path), root=args.registry)
+        if args.promote:
+            promote(object_id, args.registry)
+        print(f"{args.path} -> {object_id}")
+
+
+if __name__ == "__main__":
+    main()
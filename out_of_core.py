@@ -0,0 +1,346 @@
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+import drift_monitor
+import preprocessing
+import profiling
+import tuning
+from model_pipeline import ModelPipeline
+
+# =========================
+# CONFIG
+# =========================
+TARGET = "grade"
+TEST_SIZE = 0.2
+SPLIT_SEED = 42
+CHUNK_SIZE = 100_000
+
+
+# =========================
+# SUFFICIENT STATISTICS
+# =========================
+# Statistik cukup untuk regresi linear atas Z = [X, y]: jumlah baris, mean dan
+# matriks cross-product yang sudah di-center (setara X'X, X'y, y'y tapi stabil
+# secara numerik). Ukurannya (d+1)^2, tidak bergantung jumlah baris.
+@dataclass
+class SufficientStats:
+    n: int
+    mean: np.ndarray
+    m2: np.ndarray
+
+    @classmethod
+    def empty(cls, n_features):
+        d = n_features + 1
+        return cls(0, np.zeros(d), np.zeros((d, d)))
+
+    def merge(self, n, mean, m2):
+        # gabung dua kelompok baris (Chan et al.), urutan chunk tidak berpengaruh
+        if n == 0:
+            return self
+        total = self.n + n
+        delta = mean - self.mean
+        self.m2 = self.m2 + m2 + np.outer(delta, delta) * (self.n * n / total)
+        self.mean = self.mean + delta * (n / total)
+        self.n = total
+        return self
+
+    def update(self, X, y):
+        Z = np.column_stack([X, y]).astype(np.float64, copy=False)
+        if len(Z) == 0:
+            return self
+        mean = Z.mean(axis=0)
+        centered = Z - mean
+        return self.merge(len(Z), mean, centered.T @ centered)
+
+    def __add__(self, other):
+        return SufficientStats(self.n, self.mean.copy(), self.m2.copy()).merge(other.n, other.mean, other.m2)
+
+    # =========================
+    # CLOSED-FORM RIDGE
+    # =========================
+    def scaler(self):
+        # sama dengan StandardScaler: std populasi, kolom konstan -> scale 1
+        scale = np.sqrt(np.diag(self.m2)[:-1] / self.n)
+        scale[scale == 0] = 1.0
+        return self.mean[:-1], scale
+
+    def solve_ridge(self, alpha, scale=None):
+        # Ridge(fit_intercept=True) pada X yang di-scale dengan `scale`:
+        # (Sxx / s s' + alpha I) w = Sxy / s, intercept = mean y
+        if scale is None:
+            scale = self.scaler()[1]
+        sxx = self.m2[:-1, :-1] / np.outer(scale, scale)
+        sxy = self.m2[:-1, -1] / scale
+        coef = np.linalg.solve(sxx + alpha * np.eye(len(scale)), sxy)
+        return coef, float(self.mean[-1])
+
+    def sse(self, weights, bias):
+        # sum (y - X w - b)^2 langsung dari statistik, tanpa membaca ulang baris
+        direction = np.append(-weights, 1.0)
+        residual_mean = self.mean[-1] - self.mean[:-1] @ weights - bias
+        return float(direction @ self.m2 @ direction + self.n * residual_mean ** 2)
+
+    def sst(self):
+        return float(self.m2[-1, -1])
+
+    def ridge_covariance(self, alpha, scale, weights, bias):
+        # kovarians parameter prediksi [mean y, w] terhadap fitur [1, x - mean] untuk
+        # interval closed form: Cov(beta) = sigma^2 A^-1 Sxx A^-1, A = Sxx + alpha I
+        # (ruang scaled), lalu dibawa ke bobot mentah w = beta / scale
+        sxx = self.m2[:-1, :-1] / np.outer(scale, scale)
+        a_inv = np.linalg.inv(sxx + alpha * np.eye(len(scale)))
+        dof = max(self.n - 1 - np.trace(sxx @ a_inv), 1.0)
+        sigma2 = self.sse(weights, bias) / dof
+
+        cov = np.zeros((len(scale) + 1, len(scale) + 1))
+        cov[0, 0] = sigma2 / self.n
+        cov[1:, 1:] = sigma2 * (a_inv @ sxx @ a_inv) / np.outer(scale, scale)
+        return cov, float(sigma2)
+
+
+# =========================
+# PERSISTENCE (statistik di dalam artifact)
+# =========================
+def pack_stats(folds, test):
+    groups = list(folds) + [test]
+    return {
+        "n": np.array([group.n for group in groups], dtype=np.int64),
+        "mean": np.stack([group.mean for group in groups]),
+        "m2": np.stack([group.m2 for group in groups]),
+    }
+
+
+def unpack_stats(stats):
+    groups = [
+        SufficientStats(int(n), mean.copy(), m2.copy())
+        for n, mean, m2 in zip(stats["n"], stats["mean"], stats["m2"])
+    ]
+    return groups[:-1], groups[-1]
+
+
+def stats_from_split(X_train, y_train, X_test, y_test, cv=tuning.CV_FOLDS):
+    # fold berurutan tanpa shuffle = pembagian KFold yang dipakai tuning.tune
+    X_train = np.asarray(X_train, dtype=np.float64)
+    y_train = np.asarray(y_train, dtype=np.float64)
+    folds = [
+        SufficientStats.empty(X_train.shape[1]).update(X_train[idx], y_train[idx])
+        for idx in np.array_split(np.arange(len(y_train)), cv)
+    ]
+    test = SufficientStats.empty(X_train.shape[1]).update(X_test, y_test)
+    return folds, test
+
+
+def training_meta(bounds, rows, source=None):
+    # info yang dibutuhkan update inkremental: bounds target, nomor baris berikutnya
+    # (untuk hash split) dan posisi akhir tiap source yang sudah di-ingest
+    meta = {
+        "target_bounds": bounds.loc[TARGET, ["lower", "upper"]].astype(float).tolist(),
+        "row_counter": int(rows),
+        "sources": {},
+    }
+    if source:
+        meta["sources"][os.path.normpath(source)] = data_loader.append_marker(source, rows)
+    return meta
+
+
+# =========================
+# STREAMING PASSES
+# =========================
+def _row_uniform(index, seed=SPLIT_SEED):
+    # splitmix64 dari nomor baris -> bilangan [0, 1) yang deterministik,
+    # jadi split train/test/fold tidak butuh permutasi seluruh dataset
+    with np.errstate(over="ignore"):
+        x = index.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15) * np.uint64(seed + 1)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        x = x ^ (x >> np.uint64(31))
+    return (x >> np.uint64(11)).astype(np.float64) / 2.0 ** 53
+
+
+def _quantiles_from_counts(counts, qs):
+    # quantile interpolasi linear (default pandas) dari tabel frekuensi
+    values = counts.index.to_numpy(dtype=np.float64)
+    cumulative = np.cumsum(counts.to_numpy())
+    out = []
+    for q in qs:
+        h = (cumulative[-1] - 1) * q
+        lo = values[np.searchsorted(cumulative, np.floor(h), side="right")]
+        hi = values[np.searchsorted(cumulative, np.ceil(h), side="right")]
+        out.append(lo + (h - np.floor(h)) * (hi - lo))
+    return out
+
+
+def fit_bounds(path, chunksize=CHUNK_SIZE):
+    # pass 1: IQR bounds exact dari value counts per kolom; memori sebanding
+    # jumlah nilai unik (kecil untuk data skor/ordinal), bukan jumlah baris
+    counts = {}
+    rows = 0
+    for chunk in data_loader.iter_chunks(path, chunksize):
+        numbers = chunk.select_dtypes(include=["number"]).columns
+        rows += len(chunk)
+        for column in numbers:
+            vc = chunk[column].value_counts()
+            counts[column] = vc if column not in counts else counts[column].add(vc, fill_value=0)
+
+    columns = list(counts)
+    q1, q3 = np.array([
+        _quantiles_from_counts(counts[c].sort_index(), [0.25, 0.75]) for c in columns
+    ]).T
+    iqr = q3 - q1
+    bounds = pd.DataFrame(
+        {"lower": q1 - preprocessing.IQR_FACTOR * iqr, "upper": q3 + preprocessing.IQR_FACTOR * iqr},
+        index=pd.Index(columns)
+    )
+    return bounds, rows
+
+
+def accumulate(path, bounds, features, chunksize=CHUNK_SIZE, cv=tuning.CV_FOLDS, start_row=0):
+    # pass 2: buang outlier, bagi baris ke test / fold CV lewat hash nomor baris;
+    # sekaligus count bin baris train untuk profil drift
+    folds = [SufficientStats.empty(len(features)) for _ in range(cv)]
+    test = SufficientStats.empty(len(features))
+    lower = bounds.loc[features, "lower"].to_numpy(dtype=np.float64)
+    upper = bounds.loc[features, "upper"].to_numpy(dtype=np.float64)
+    profile = np.zeros((len(features), drift_monitor.PROFILE_BINS + 2), dtype=np.int64)
+    rows_seen = rows_kept = 0
+
+    for chunk in data_loader.iter_chunks(path, chunksize):
+        index = np.arange(start_row + rows_seen, start_row + rows_seen + len(chunk))
+        rows_seen += len(chunk)
+
+        keep = ~preprocessing.outlier_mask(chunk, bounds)
+        X = chunk.loc[keep, features].to_numpy(dtype=np.float64)
+        y = chunk.loc[keep, TARGET].to_numpy(dtype=np.float64)
+        u = _row_uniform(index[keep])
+        rows_kept += len(y)
+
+        is_test = u < TEST_SIZE
+        test.update(X[is_test], y[is_test])
+        fold_id = ((u[~is_test] - TEST_SIZE) / (1 - TEST_SIZE) * cv).astype(int)
+        X_train, y_train = X[~is_test], y[~is_test]
+        for k in range(cv):
+            in_fold = fold_id == k
+            folds[k].update(X_train[in_fold], y_train[in_fold])
+        profile += drift_monitor.bin_counts(X_train, lower, upper)
+
+    return folds, test, rows_seen, rows_kept, profile
+
+
+# =========================
+# TUNING & EVALUATION
+# =========================
+def _raw_weights(coef, bias, mean, scale):
+    weights = coef / scale
+    return weights, bias - float(mean @ weights)
+
+
+def tune_ridge(folds, alphas=tuning.ALPHAS):
+    # k-fold CV closed form: model tiap fold = gabungan fold lain, MSE dihitung
+    # dari statistik fold validasi. Scaler dari seluruh train (seperti tuning.tune)
+    train = sum(folds[1:], folds[0])
+    _, scale = train.scaler()
+
+    fold_mse = []
+    for k, held_out in enumerate(folds):
+        others = [f for i, f in enumerate(folds) if i != k]
+        fold_train = sum(others[1:], others[0])
+        mse = []
+        for alpha in alphas:
+            coef, bias = fold_train.solve_ridge(alpha, scale)
+            weights, intercept = _raw_weights(coef, bias, fold_train.mean[:-1], scale)
+            mse.append(held_out.sse(weights, intercept) / held_out.n)
+        fold_mse.append(mse)
+
+    mean_mse = np.mean(fold_mse, axis=0)
+    return {
+        "model": "ridge",
+        "alphas": np.asarray(alphas, dtype=np.float64).tolist(),
+        "mean_mse": mean_mse.tolist(),
+        "best_alpha": float(alphas[np.argmin(mean_mse)]),
+    }
+
+
+def evaluate(test, pipeline):
+    sse = test.sse(pipeline.weights, pipeline.bias)
+    return {
+        "RMSE": float(np.sqrt(sse / test.n)),
+        "R²": float(1 - sse / test.sst()),
+    }
+
+
+# =========================
+# PIPELINE
+# =========================
+@dataclass
+class OutOfCoreResult:
+    rows_before: int
+    rows_after: int
+    bounds: pd.DataFrame
+    features: list
+    folds: list
+    test: SufficientStats
+    ridge_tuning: dict
+    pipeline: ModelPipeline
+    metrics: dict
+
+    @property
+    def train(self):
+        return sum(self.folds[1:], self.folds[0])
+
+
+@profiling.timed("out_of_core")
+def run_pipeline(path, ridge_alpha=None, chunksize=CHUNK_SIZE, bounds=None):
+    rows_before = None
+    if bounds is None:
+        with profiling.section("fit_bounds"):
+            bounds, rows_before = fit_bounds(path, chunksize)
+
+    features = [column for column in bounds.index if column != TARGET]
+    with profiling.section("accumulate"):
+        folds, test, rows_seen, rows_kept, profile = accumulate(path, bounds, features, chunksize)
+
+    with profiling.section("tune_ridge"):
+        ridge_tuning = tune_ridge(folds)
+    if ridge_alpha is None:
+        ridge_alpha = ridge_tuning["best_alpha"]
+
+    train = sum(folds[1:], folds[0])
+    mean, scale = train.scaler()
+    coef, intercept = train.solve_ridge(ridge_alpha, scale)
+    weights, bias = _raw_weights(coef, intercept, mean, scale)
+    cov, sigma2 = train.ridge_covariance(ridge_alpha, scale, weights, bias)
+
+    pipeline = ModelPipeline(
+        features=features,
+        mean=mean,
+        scale=scale,
+        coef=coef,
+        intercept=intercept,
+        lower=bounds.loc[features, "lower"].to_numpy(dtype=np.float64),
+        upper=bounds.loc[features, "upper"].to_numpy(dtype=np.float64),
+        meta={
+            "ridge_alpha": float(ridge_alpha),
+            "mode": "out_of_core",
+            **training_meta(bounds, rows_seen, path)
+        },
+        stats=pack_stats(folds, test),
+        cov=cov,
+        sigma2=sigma2,
+        profile=profile
+    )
+
+    return OutOfCoreResult(
+        rows_before=rows_before or rows_seen,
+        rows_after=rows_kept,
+        bounds=bounds,
+        features=features,
+        folds=folds,
+        test=test,
+        ridge_tuning=ridge_tuning,
+        pipeline=pipeline,
+        metrics={"Ridge Regression": evaluate(test, pipeline)}
+    )
@@ -1,51 +1,48 @@
 import streamlit as st
-import pandas as pd
-import joblib
+import numpy as np
 
-def prediction_app():
-
-    # =========================
-    # STYLE (PASTEL THEME)
-    # =========================
-    st.markdown(
-        """
-        <style>
-        /* Background utama */
-        .stApp {
-            background-color: #FDF2F8; /* pink muda */
-        }
-
-        /* Sidebar */
-        section[data-testid="stSidebar"] {
-            background-color: #FADADD; /* pink pastel */
-        }
-
-        /* Header */
-        h1, h2, h3, h4 {
-            color: #831843;
-        }
-
-        /* Divider */
-        hr {
-            border-top: 1px solid #F9A8D4;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+import profiling
+import scoring
+from theme import PINK_BG
 
+LEVEL_COLORS = {
+    scoring.LEVEL_HIGH: "#E6F4EA",    # pastel green
+    scoring.LEVEL_MEDIUM: "#FFF7E6",  # pastel yellow
+    scoring.LEVEL_LOW: "#FDEAEA"      # pastel red
+}
 
+@profiling.timed("prediction")
+def prediction_app():
+    # registry, drift store (sqlite3) & cache baru di-import saat halaman ini benar-benar dibuka
+    with profiling.section("imports"):
+        import drift_monitor
+        import model_registry
+        from model_pipeline import ModelPipeline
+        from prediction_cache import PredictionCache
 
     # =========================
     # LOAD MODEL
     # =========================
+    # key cache = id model CURRENT di registry: begitu model baru dipromosikan,
+    # rerun berikutnya otomatis memuat model baru tanpa restart aplikasi
+    @st.cache_resource(max_entries=4)
+    def load_model(model_id):
+        # registry masih kosong -> model bawaan repo (model_pipeline.npz)
+        return model_registry.load(model_id) if model_id else ModelPipeline.load()
+
+    # cache hasil prediksi dipakai bersama oleh semua session
     @st.cache_resource
-    def load_model():
-        model = joblib.load("model_ridge.pkl")
-        features = joblib.load("numeric_columns.pkl")
-        return model, features
+    def load_prediction_cache():
+        return PredictionCache()
 
-    model, feature_columns = load_model()
+    # count input untuk drift monitor dikumpulkan per proses, ditulis ke SQLite berkala
+    @st.cache_resource
+    def load_drift_monitor():
+        return drift_monitor.DriftMonitor()
+
+    pipeline = load_model(model_registry.current_id())
+    cache = load_prediction_cache()
+    monitor = load_drift_monitor()
 
     # =========================
     # HEADER
@@ -59,6 +56,22 @@ def prediction_app():
 
     st.divider()
 
+    tab_single, tab_batch, tab_drift = st.tabs(["👤 Single Student", "📂 Batch Roster", "📡 Drift Monitor"])
+
+    with tab_single:
+        single_prediction(pipeline, cache, monitor)
+
+    with tab_batch:
+        batch_prediction(pipeline, monitor)
+
+    with tab_drift:
+        drift_panel(pipeline, monitor)
+
+
+@profiling.timed()
+def single_prediction(pipeline, cache, monitor):
+    from model_pipeline import INTERVAL_LEVEL
+
     # =========================
     # INPUT FORM
     # =========================
@@ -69,15 +82,14 @@ def prediction_app():
         cols = st.columns(2)
 
         i = 0
-        for feature in feature_columns:
-            if feature not in ["grade", "study_efficiency"]:
-                with cols[i % 2]:
-                    inputs[feature] = st.number_input(
-                        label=feature.replace("_", " ").title(),
-                        value=0.0,
-                        step=1.0
-                    )
-                i += 1
+        for feature in scoring.input_features(pipeline.features):
+            with cols[i % 2]:
+                inputs[feature] = st.number_input(
+                    label=feature.replace("_", " ").title(),
+                    value=0.0,
+                    step=1.0
+                )
+            i += 1
 
         st.markdown("---")
         submitted = st.form_submit_button("🔮 Predict Grade")
@@ -86,23 +98,23 @@ def prediction_app():
     # PREDICTION RESULT
     # =========================
     if submitted:
-        input_df = pd.DataFrame([inputs])
-        prediction = model.predict(input_df)[0]
-
-        prediction = max(0, min(100, prediction))
+        x = np.array([inputs[f] for f in pipeline.features])
+        prediction, lower, upper, out_of_range, cached = cache.predict(pipeline, x)
+        monitor.observe(pipeline, x[None, :])
 
         st.divider()
         st.subheader("📊 Prediction Result")
 
-        if prediction >= 75:
-            level = "High Performance 🏆"
-            color = "#E6F4EA"  # pastel green
-        elif prediction >= 50:
-            level = "Medium Performance ⚠️"
-            color = "#FFF7E6"  # pastel yellow
-        else:
-            level = "Low Performance 🚨"
-            color = "#FDEAEA"  # pastel red
+        if out_of_range.any():
+            clipped = [f for f, flag in zip(pipeline.features, out_of_range) if flag]
+            st.warning(
+                "Nilai di luar rentang data training disesuaikan ke batas IQR: "
+                + ", ".join(clipped)
+            )
+
+        level = str(scoring.performance_level(prediction))
+        color = LEVEL_COLORS[level]
+        action = str(scoring.intervention(lower, upper))
 
         st.markdown(
     f"""
@@ -118,8 +130,226 @@ def prediction_app():
         <span style="font-size:42px; font-weight:700;">
             {round(prediction, 2)}
         </span><br>
+        <span style="font-size:15px;">
+            Interval {INTERVAL_LEVEL:.0%}: {lower:.2f} – {upper:.2f}
+        </span><br>
         {level}
     </div>
     """,
     unsafe_allow_html=True
 )
+
+        # keputusan intervensi dari batas interval, bukan dari titik prediksi saja
+        if action == scoring.INTERVENTION_REQUIRED:
+            st.error(
+                f"{action}: seluruh interval prediksi di bawah {scoring.LOW_THRESHOLD}, "
+                "siswa perlu pendampingan."
+            )
+        elif action == scoring.INTERVENTION_MONITOR:
+            st.warning(
+                f"{action}: interval prediksi memotong batas {scoring.LOW_THRESHOLD}, "
+                "pantau perkembangan siswa."
+            )
+        if not pipeline.has_intervals:
+            st.caption("Model ini belum menyimpan kovarians; latih ulang untuk interval prediksi.")
+
+        explanation(pipeline, x)
+
+        if profiling.debug_enabled():
+            stats = cache.stats()
+            st.caption(
+                f"{'cache hit' if cached else 'cache miss'} · hit rate {stats['hit_rate']:.0%} "
+                f"({stats['hits']}/{stats['hits'] + stats['misses']}) · {stats['entries']} entries"
+            )
+
+
+@profiling.timed()
+def explanation(pipeline, x):
+
+    # =========================
+    # PREDICTION EXPLANATION
+    # =========================
+    # model linear: kontribusi fitur = (x - mean) * bobot, jumlahnya + base value = prediksi
+    import plotly.express as px
+
+    contributions, _ = pipeline.explain(x[None, :])
+    contributions = contributions[0]
+    order = np.argsort(np.abs(contributions))
+
+    st.subheader("🔎 Kenapa prediksinya begini?")
+    fig = px.bar(
+        x=contributions[order],
+        y=[pipeline.features[i] for i in order],
+        orientation="h",
+        color=np.where(contributions[order] < 0, "menurunkan", "menaikkan"),
+        color_discrete_map={"menurunkan": "#F9A8D4", "menaikkan": "#A7F3D0"},
+        labels={"x": "kontribusi ke grade", "y": "", "color": ""},
+    )
+    fig.update_layout(paper_bgcolor=PINK_BG, plot_bgcolor=PINK_BG, height=320)
+    profiling.plotly_chart(fig, use_container_width=True)
+    st.caption(
+        f"Base value (rata-rata prediksi data training): {pipeline.base_value:.2f}; "
+        "prediksi = base value + jumlah kontribusi semua fitur."
+    )
+
+    with st.expander("📌 Pengaruh fitur secara global"):
+        ranking = np.argsort(pipeline.importance)[::-1]
+        st.table({
+            "Fitur": [pipeline.features[i] for i in ranking],
+            "|koefisien| (per 1 std)": np.round(pipeline.importance[ranking], 3),
+        })
+
+
+# hasil scoring per upload (file_id) dan model: rerun karena widget lain (form single,
+# selectbox drift, checkbox) tidak membaca & men-score ulang seluruh roster
+@st.cache_data(max_entries=4, show_spinner=False)
+def score_upload(file_id, model_id, explain, _uploaded, _pipeline):
+    try:
+        with profiling.section("read_roster"):
+            _uploaded.seek(0)
+            roster = scoring.read_roster(_uploaded)
+    except Exception as e:
+        return None, [f"File tidak dapat dibaca: {e}"]
+
+    with profiling.section("score_roster"):
+        return scoring.score_roster(_pipeline, roster, explain=explain)
+
+
+@profiling.timed()
+def batch_prediction(pipeline, monitor):
+    import model_registry
+    from model_pipeline import INTERVAL_LEVEL
+
+    # =========================
+    # ROSTER UPLOAD
+    # =========================
+    st.subheader("📂 Batch Prediction")
+    st.markdown(
+        "Upload file roster siswa (**.csv** atau **.parquet**) dengan kolom: "
+        + ", ".join(f"`{f}`" for f in scoring.input_features(pipeline.features))
+    )
+
+    uploaded = st.file_uploader("Roster file", type=["csv", "parquet"])
+    explain = st.checkbox(
+        "Sertakan kontribusi per fitur",
+        help="Tambah kolom contribution_<fitur> (kontribusi setiap fitur ke prediksi) di hasil."
+    )
+    if uploaded is None:
+        return
+
+    key = (uploaded.file_id, model_registry.model_id(pipeline))
+    result, errors = score_upload(*key, explain, uploaded, pipeline)
+    if errors:
+        for message in errors:
+            st.error(message)
+        return
+
+    # input roster dicatat sekali per upload, bukan di setiap rerun selama file masih di uploader
+    if st.session_state.get("drift_observed_upload") != key:
+        X, _ = scoring.validate_roster(result, pipeline.features)
+        monitor.observe(pipeline, X)
+        st.session_state["drift_observed_upload"] = key
+
+    # =========================
+    # BATCH RESULT
+    # =========================
+    st.success(f"{len(result)} siswa berhasil diprediksi ✅")
+
+    n_out_of_range = int(result["out_of_range"].sum())
+    if n_out_of_range:
+        st.warning(
+            f"{n_out_of_range} siswa memiliki nilai di luar rentang data training "
+            "(disesuaikan ke batas IQR, lihat kolom `out_of_range`)"
+        )
+
+    level_counts = result["performance_level"].value_counts()
+    cols = st.columns(3)
+    for col, level in zip(cols, LEVEL_COLORS):
+        with col:
+            st.metric(level, int(level_counts.get(level, 0)))
+
+    action_counts = result["intervention"].value_counts()
+    cols = st.columns(2)
+    for col, action in zip(cols, (scoring.INTERVENTION_REQUIRED, scoring.INTERVENTION_MONITOR)):
+        with col:
+            st.metric(action, int(action_counts.get(action, 0)))
+    st.caption(
+        f"Intervensi ditentukan dari interval prediksi {INTERVAL_LEVEL:.0%} "
+        f"(`predicted_lower` – `predicted_upper`) terhadap batas {scoring.LOW_THRESHOLD}. "
+        "`top_negative_factor` / `top_positive_factor`: fitur yang paling menurunkan / menaikkan prediksi siswa."
+    )
+
+    st.dataframe(result.head(100), use_container_width=True)
+
+    st.download_button(
+        "⬇️ Download Hasil Prediksi",
+        data=lambda: scoring.to_csv_bytes(result),
+        file_name="prediction_result.csv",
+        mime="text/csv"
+    )
+
+
+@profiling.timed()
+def drift_panel(pipeline, monitor):
+    import drift_monitor
+
+    # =========================
+    # DRIFT MONITOR
+    # =========================
+    st.subheader("📡 Drift Input vs Data Training")
+    if not pipeline.has_profile:
+        st.info("Model ini belum menyimpan profil data training; latih ulang untuk drift monitoring.")
+        return
+
+    # count dari session ini langsung terlihat, tanpa menunggu flush berkala
+    monitor.flush()
+    counts, info = drift_monitor.live_counts(pipeline)
+    if info is None:
+        st.info("Belum ada input prediksi untuk model ini.")
+        return
+
+    table = drift_monitor.report(pipeline, counts)
+    drifted = table.loc[table["Status"] == drift_monitor.STATUS_DRIFT, "Fitur"].tolist()
+    shifted = table.loc[table["Status"] == drift_monitor.STATUS_WARN, "Fitur"].tolist()
+    if drifted:
+        st.error(f"{drift_monitor.STATUS_DRIFT}: distribusi input berbeda jauh dari data training — "
+                 + ", ".join(drifted) + ". Pertimbangkan training ulang.")
+    if shifted:
+        st.warning(f"{drift_monitor.STATUS_WARN}: " + ", ".join(shifted))
+    if info["rows"] < drift_monitor.MIN_ROWS:
+        st.info(f"Baru {info['rows']} input; status drift muncul setelah {drift_monitor.MIN_ROWS} input.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Input tercatat", f"{info['rows']:,}")
+    with col2:
+        st.metric("Fitur drift", len(drifted))
+    st.dataframe(table, use_container_width=True, hide_index=True)
+    st.caption(
+        f"Model {pipeline.version}. PSI < {drift_monitor.PSI_WARN} stabil, "
+        f"{drift_monitor.PSI_WARN}–{drift_monitor.PSI_ALERT} bergeser, > {drift_monitor.PSI_ALERT} drift. "
+        "KS = selisih CDF terbesar antar bin."
+    )
+
+    # =========================
+    # DISTRIBUTION COMPARISON
+    # =========================
+    import plotly.graph_objects as go
+
+    feature = st.selectbox("Bandingkan distribusi fitur", pipeline.features)
+    i = pipeline.features.index(feature)
+    edges = drift_monitor.bin_edges(pipeline)[i]
+    labels = (
+        [f"< {edges[0]:g}"]
+        + [f"{lo:g}–{hi:g}" for lo, hi in zip(edges[:-1], edges[1:])]
+        + [f"> {edges[-1]:g}"]
+    )
+    fig = go.Figure([
+        go.Bar(x=labels, y=drift_monitor.proportions(pipeline.profile[i]), name="training", marker_color="#F9A8D4"),
+        go.Bar(x=labels, y=drift_monitor.proportions(counts[i]), name="input", marker_color="#A5B4FC"),
+    ])
+    fig.update_layout(
+        barmode="group", paper_bgcolor=PINK_BG, plot_bgcolor=PINK_BG,
+        yaxis_title="proporsi", height=320
+    )
+    profiling.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,82 @@
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+import model_registry
+
+# =========================
+# CONFIG
+# =========================
+MAX_ENTRIES = 4096
+TTL_SECONDS = 3600
+# input form dibulatkan ke 3 desimal: vektor yang "hampir sama" berbagi satu entry
+DECIMALS = 3
+
+
+# =========================
+# PREDICTION CACHE (LRU + TTL)
+# =========================
+# Dipakai bersama oleh semua session (lewat st.cache_resource). Key = id isi model
+# di registry + byte vektor fitur yang sudah dikuantisasi, jadi model baru otomatis
+# tidak memakai hasil lama (versi saja bisa sama untuk dua model di detik yang sama).
+class PredictionCache:
+    def __init__(self, max_entries=MAX_ENTRIES, ttl=TTL_SECONDS, decimals=DECIMALS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.decimals = decimals
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def quantize(self, x):
+        # + 0.0 menyamakan -0.0 dengan 0.0 supaya byte key-nya identik
+        return np.round(np.asarray(x, dtype=np.float64), self.decimals) + 0.0
+
+    def predict(self, pipeline, x):
+        x = self.quantize(x)
+        key = (model_registry.model_id(pipeline), x.tobytes())
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return (*entry[1:], True)
+                del self._entries[key]
+                self.expired += 1
+            self.misses += 1
+
+        # dihitung di luar lock: clip + dot product satu baris, tanpa DataFrame
+        predictions, lower, upper, out_of_range = pipeline.predict_interval(x[None, :])
+        value = (float(predictions[0]), float(lower[0]), float(upper[0]), out_of_range[0].copy())
+
+        with self._lock:
+            self._entries[key] = (now, *value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return (*value, False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "expired": self.expired,
+            }
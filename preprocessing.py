@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+# =========================
+# CONFIG
+# =========================
+IQR_FACTOR = 1.5
+TARGET = "grade"
+
+
+# =========================
+# IQR OUTLIER BOUNDS
+# =========================
+def fit_iqr_bounds(df, columns=None):
+    if columns is None:
+        columns = df.select_dtypes(include=["number"]).columns
+
+    # satu pass quantile untuk semua kolom sekaligus
+    Q1, Q3 = df[columns].quantile([0.25, 0.75]).to_numpy()
+    IQR = Q3 - Q1
+
+    return pd.DataFrame(
+        {"lower": Q1 - IQR_FACTOR * IQR, "upper": Q3 + IQR_FACTOR * IQR},
+        index=pd.Index(columns)
+    )
+
+
+def outlier_mask(df, bounds):
+    values = df[bounds.index].to_numpy(dtype=np.float64)
+    lower = bounds["lower"].to_numpy()
+    upper = bounds["upper"].to_numpy()
+    return ((values < lower) | (values > upper)).any(axis=1)
+
+
+def remove_outliers(df):
+    # baris dengan nilai di luar batas IQR pada kolom numerik mana pun dibuang
+    numbers = df.select_dtypes(include=["number"]).columns
+    bounds = fit_iqr_bounds(df, numbers)
+    return df[~outlier_mask(df, bounds)], numbers, bounds
+
+
+def model_frame(df, numbers):
+    # kolom int8 dari schema hanya format simpan; model & statistik selalu memakai float64
+    return df[numbers].astype(np.float64)
+
+
+# =========================
+# CORRELATION & VIF (vectorized)
+# =========================
+def correlation(df_select):
+    return df_select.corr().round(2)
+
+
+def compute_vif(X):
+    # VIF semua fitur sekaligus dari diagonal inverse matriks korelasi,
+    # setara dengan variance_inflation_factor statsmodels (standardize=True)
+    # tapi tanpa satu regresi OLS per kolom
+    corr = np.corrcoef(X.to_numpy(dtype=np.float64), rowvar=False)
+
+    vif_df = pd.DataFrame()
+    vif_df["Feature"] = X.columns
+    vif_df["VIF"] = np.diag(np.linalg.pinv(corr))
+    return vif_df
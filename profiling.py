@@ -0,0 +1,188 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# =========================
+# CONFIG
+# =========================
+# file JSON-lines per section dan file Prometheus text, kosong = tidak ditulis
+PROFILE_LOG = os.environ.get("STUDENT_PROFILE_LOG", "")
+PROFILE_PROM = os.environ.get("STUDENT_PROFILE_PROM", "")
+DEBUG_ENV = "STUDENT_APP_DEBUG"
+METRIC_PREFIX = "student_app_section"
+
+# record run yang sedang berjalan (per thread = per session Streamlit)
+_local = threading.local()
+# agregat semua run dalam proses ini, untuk export Prometheus
+_totals = {}
+_lock = threading.Lock()
+
+
+# =========================
+# MEMORY (RSS)
+# =========================
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource
+
+        # fallback non-Linux: peak RSS (KB di Linux, byte di macOS)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# =========================
+# SECTION TIMING
+# =========================
+def _state():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+        _local.records = []
+        # record per section hanya disimpan di dalam run halaman (start_run); thread lain
+        # (job worker, worker_pool, scoring service) hanya menambah agregat _totals
+        _local.active = False
+    return _local
+
+
+def start_run(page):
+    state = _state()
+    state.stack = []
+    state.records = []
+    state.page = page
+    state.active = True
+
+
+@contextmanager
+def section(name):
+    state = _state()
+    state.stack.append(name)
+    path = "/".join(state.stack)
+    # slot dipesan saat masuk supaya urutan record = urutan mulai section
+    record = {"section": path, "depth": len(state.stack) - 1}
+    if state.active:
+        state.records.append(record)
+    rss_before = _rss_bytes()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - start
+        rss_delta = _rss_bytes() - rss_before
+        state.stack.pop()
+        _record(record, path, wall, rss_delta)
+
+
+def timed(name=None):
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with section(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _record(record, path, wall, rss_delta):
+    record["wall_ms"] = round(wall * 1000, 3)
+    record["rss_delta_mb"] = round(rss_delta / 2**20, 3)
+    with _lock:
+        total = _totals.setdefault(path, {"count": 0, "seconds": 0.0, "max_seconds": 0.0, "rss_bytes": 0})
+        total["count"] += 1
+        total["seconds"] += wall
+        total["max_seconds"] = max(total["max_seconds"], wall)
+        total["rss_bytes"] += rss_delta
+
+
+def records():
+    # hanya section yang sudah selesai
+    return [record for record in _state().records if "wall_ms" in record]
+
+
+def totals():
+    with _lock:
+        return {path: dict(values) for path, values in _totals.items()}
+
+
+# =========================
+# EXPORT
+# =========================
+def prometheus_text():
+    lines = [
+        f"# HELP {METRIC_PREFIX}_seconds Wall time per section.",
+        f"# TYPE {METRIC_PREFIX}_seconds summary",
+    ]
+    snapshot = totals()
+    for path, values in sorted(snapshot.items()):
+        label = f'{{section="{path}"}}'
+        lines.append(f"{METRIC_PREFIX}_seconds_count{label} {values['count']}")
+        lines.append(f"{METRIC_PREFIX}_seconds_sum{label} {values['seconds']:.6f}")
+    lines.append(f"# TYPE {METRIC_PREFIX}_max_seconds gauge")
+    for path, values in sorted(snapshot.items()):
+        lines.append(f'{METRIC_PREFIX}_max_seconds{{section="{path}"}} {values["max_seconds"]:.6f}')
+    # jumlah perubahan RSS bisa turun (memori dilepas), jadi gauge, bukan counter
+    lines.append(f"# TYPE {METRIC_PREFIX}_rss_delta_bytes gauge")
+    for path, values in sorted(snapshot.items()):
+        lines.append(f'{METRIC_PREFIX}_rss_delta_bytes{{section="{path}"}} {values["rss_bytes"]}')
+    return "\n".join(lines) + "\n"
+
+
+def flush(log_path=None, prom_path=None):
+    # dipanggil sekali di akhir setiap run halaman
+    log_path = log_path or PROFILE_LOG
+    prom_path = prom_path or PROFILE_PROM
+    state = _state()
+
+    if log_path and state.records:
+        run = {"ts": time.time(), "pid": os.getpid(), "page": getattr(state, "page", None)}
+        with _lock, open(log_path, "a") as f:
+            for record in records():
+                f.write(json.dumps({**run, **record}) + "\n")
+
+    if prom_path:
+        tmp = f"{prom_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(prometheus_text())
+        os.replace(tmp, prom_path)
+
+
+# =========================
+# STREAMLIT HELPERS
+# =========================
+def plotly_chart(fig, **kwargs):
+    # serialisasi figure (to_json di dalam st.plotly_chart) tercatat sebagai section sendiri
+    import streamlit as st
+
+    with section("plotly_chart"):
+        return st.plotly_chart(fig, **kwargs)
+
+
+# =========================
+# DEBUG PANEL
+# =========================
+def debug_enabled():
+    import streamlit as st
+
+    return os.environ.get(DEBUG_ENV) == "1" or st.query_params.get("debug") == "1"
+
+
+def render_debug_panel():
+    import streamlit as st
+
+    rows = records()
+    with st.sidebar.expander("⏱️ Profiling (debug)", expanded=False):
+        if not rows:
+            st.caption("Belum ada section yang tercatat.")
+            return
+        st.dataframe(
+            [{**row, "section": "  " * row["depth"] + row["section"].rsplit("/", 1)[-1]} for row in rows],
+            column_order=["section", "wall_ms", "rss_delta_mb"],
+            hide_index=True,
+            use_container_width=True
+        )
+        st.caption(f"Total proses ini: {len(totals())} section, pid {os.getpid()}")
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+# =========================
+# CONFIG
+# =========================
+# naikkan jika schema berubah, cache parquet lama otomatis dibangun ulang
+SCHEMA_VERSION = 1
+JOBS = ["at_home", "health", "other", "services", "teacher"]
+YES_NO = ["no", "yes"]
+
+# kolom kategori -> daftar kategori yang valid (None = kategori diambil dari data,
+# untuk kolom turunan yang labelnya bisa bertambah)
+CATEGORIES = {
+    "sex": ["F", "M"],
+    "mother_job": JOBS,
+    "father_job": JOBS,
+    "school_support": YES_NO,
+    "family_support": YES_NO,
+    "internet": YES_NO,
+    "romantic": YES_NO,
+    "grade_category": ["Low", "Medium", "High"],
+    "digital_access": None,
+    "academic_risk": None,
+}
+
+# kolom ordinal / hitungan -> (min, max) yang valid, disimpan sebagai int8
+INTEGERS = {
+    "age": (15, 22),
+    "mother_edu": (0, 4),
+    "father_edu": (0, 4),
+    "traveltime": (1, 4),
+    "studytime": (1, 4),
+    "freetime": (1, 5),
+    "health": (1, 5),
+    "absences": (0, 93),
+    "grade": (0, 100),
+}
+
+
+# =========================
+# VALIDATION + CONVERSION
+# =========================
+def _category(series, categories):
+    column = series.name
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if categories is None or list(series.cat.categories) == categories:
+            return series
+        series = series.astype(object)
+
+    if categories is None:
+        return series.astype("category")
+
+    converted = series.astype(pd.CategoricalDtype(categories))
+    # nilai di luar daftar kategori menjadi NaN saat konversi
+    invalid = converted.isna() & series.notna()
+    if invalid.any():
+        values = sorted(series[invalid].astype(str).unique())[:5]
+        raise ValueError(f"Kolom '{column}' berisi nilai tidak valid: {values}")
+    return converted
+
+
+def _integer(series, low, high):
+    column = series.name
+    if not pd.api.types.is_numeric_dtype(series.dtype):
+        raise ValueError(f"Kolom '{column}' harus numerik, bukan {series.dtype}")
+
+    values = series.to_numpy(dtype=np.float64)
+    present = ~np.isnan(values)
+    if np.any(values[present] != np.round(values[present])):
+        raise ValueError(f"Kolom '{column}' harus bilangan bulat")
+    if present.any() and (values[present].min() < low or values[present].max() > high):
+        raise ValueError(
+            f"Kolom '{column}' di luar rentang {low}-{high}: "
+            f"{values[present].min():g}-{values[present].max():g}"
+        )
+
+    # int8 tidak bisa menyimpan NaN -> kolom yang punya nilai kosong tetap float
+    target = np.int8 if present.all() else np.float32
+    if series.dtype == target:
+        return series
+    return series.astype(target)
+
+
+def is_compact(arrow_schema):
+    # parquet yang sudah ditulis dengan dtype schema bisa langsung di-memory-map
+    import pyarrow as pa
+
+    for field in arrow_schema:
+        if field.name in CATEGORIES and not pa.types.is_dictionary(field.type):
+            return False
+        if field.name in INTEGERS and not pa.types.is_int8(field.type):
+            return False
+    return True
+
+
+def apply(df):
+    # dtype ringkas + validasi rentang; kolom di luar schema dibiarkan apa adanya.
+    # Frame yang sudah sesuai schema dikembalikan tanpa copy (tetap memory-mapped).
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if column in CATEGORIES:
+            converted = _category(series, CATEGORIES[column])
+        elif column in INTEGERS:
+            converted = _integer(series, *INTEGERS[column])
+        else:
+            continue
+        if converted is not series:
+            columns[column] = converted
+
+    if not columns:
+        return df
+    return df.assign(**columns)
+
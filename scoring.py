@@ -0,0 +1,163 @@
+import io
+import os
+
+import numpy as np
+
+# =========================
+# CONFIG
+# =========================
+EXCLUDED_FEATURES = ["grade", "study_efficiency"]
+CHUNK_SIZE = 50_000
+
+LEVEL_HIGH = "High Performance 🏆"
+LEVEL_MEDIUM = "Medium Performance ⚠️"
+LEVEL_LOW = "Low Performance 🚨"
+
+# keputusan intervensi memakai batas interval prediksi, bukan titik prediksi
+LOW_THRESHOLD = 50
+INTERVENTION_REQUIRED = "Intervensi 🚨"
+INTERVENTION_MONITOR = "Pantau 👀"
+INTERVENTION_NONE = "-"
+
+
+def input_features(feature_columns):
+    return [f for f in feature_columns if f not in EXCLUDED_FEATURES]
+
+
+# =========================
+# PERFORMANCE BANDING
+# =========================
+def performance_level(predictions):
+    predictions = np.asarray(predictions)
+    return np.select(
+        [predictions >= 75, predictions >= LOW_THRESHOLD],
+        [LEVEL_HIGH, LEVEL_MEDIUM],
+        default=LEVEL_LOW
+    )
+
+
+def intervention(lower, upper):
+    # seluruh interval di bawah batas -> intervensi; interval memotong batas -> pantau
+    lower, upper = np.asarray(lower), np.asarray(upper)
+    return np.select(
+        [upper < LOW_THRESHOLD, lower < LOW_THRESHOLD],
+        [INTERVENTION_REQUIRED, INTERVENTION_MONITOR],
+        default=INTERVENTION_NONE
+    )
+
+
+# =========================
+# ROSTER INPUT
+# =========================
+def read_roster(file, name=None):
+    import pandas as pd
+
+    name = name or getattr(file, "name", str(file))
+    ext = os.path.splitext(name)[1].lower()
+    if ext == ".csv":
+        return pd.read_csv(file)
+    if ext == ".parquet":
+        return pd.read_parquet(file)
+    raise ValueError(f"Format file tidak didukung: {name} (gunakan .csv atau .parquet)")
+
+
+def validate_roster(roster, feature_columns):
+    import pandas as pd
+
+    features = input_features(feature_columns)
+    errors = []
+
+    missing = [f for f in features if f not in roster.columns]
+    if missing:
+        errors.append(f"Kolom tidak ditemukan: {', '.join(missing)}")
+        return None, errors
+
+    X = roster[features].apply(pd.to_numeric, errors="coerce")
+    invalid = X.isna().any(axis=1)
+    if invalid.any():
+        rows = (np.flatnonzero(invalid.to_numpy())[:10] + 1).tolist()
+        errors.append(
+            f"{int(invalid.sum())} baris berisi nilai kosong/non-numerik "
+            f"(contoh baris: {rows})"
+        )
+        return None, errors
+
+    return X.to_numpy(dtype=np.float64), errors
+
+
+# =========================
+# VECTORIZED SCORING
+# =========================
+def explain_batch(pipeline, X, chunk_size=CHUNK_SIZE):
+    contributions = np.empty(X.shape, dtype=np.float64)
+    for start in range(0, X.shape[0], chunk_size):
+        stop = start + chunk_size
+        contributions[start:stop], _ = pipeline.explain(X[start:stop])
+    return contributions
+
+
+def top_factors(pipeline, X, chunk_size=CHUNK_SIZE):
+    # per siswa: fitur yang paling menurunkan / menaikkan prediksi (kode fitur, -1 = tidak ada);
+    # per chunk supaya matriks kontribusi penuh tidak perlu disimpan
+    negative = np.empty(X.shape[0], dtype=np.int16)
+    positive = np.empty(X.shape[0], dtype=np.int16)
+    for start in range(0, X.shape[0], chunk_size):
+        stop = start + chunk_size
+        contributions = pipeline.contributions(np.clip(X[start:stop], pipeline.lower, pipeline.upper))
+        lowest = contributions.argmin(axis=1)[:, None]
+        highest = contributions.argmax(axis=1)[:, None]
+        negative[start:stop] = np.where(np.take_along_axis(contributions, lowest, 1) < 0, lowest, -1)[:, 0]
+        positive[start:stop] = np.where(np.take_along_axis(contributions, highest, 1) > 0, highest, -1)[:, 0]
+    return negative, positive
+
+
+def predict_batch(pipeline, X, chunk_size=CHUNK_SIZE):
+    predictions = np.empty(X.shape[0], dtype=np.float64)
+    lower = np.empty(X.shape[0], dtype=np.float64)
+    upper = np.empty(X.shape[0], dtype=np.float64)
+    out_of_range = np.empty(X.shape, dtype=bool)
+    for start in range(0, X.shape[0], chunk_size):
+        stop = start + chunk_size
+        (
+            predictions[start:stop], lower[start:stop], upper[start:stop], out_of_range[start:stop]
+        ) = pipeline.predict_interval(X[start:stop])
+    return predictions, lower, upper, out_of_range
+
+
+def score_roster(pipeline, roster, chunk_size=CHUNK_SIZE, explain=False, monitor=None):
+    # explain=True menambah kolom kontribusi per fitur (contribution_<fitur>);
+    # monitor (drift_monitor.DriftMonitor) opsional mencatat distribusi input roster
+    import pandas as pd
+
+    X, errors = validate_roster(roster, pipeline.features)
+    if errors:
+        return None, errors
+    if monitor is not None:
+        monitor.observe(pipeline, X)
+
+    predictions, lower, upper, out_of_range = predict_batch(pipeline, X, chunk_size)
+    result = roster.copy()
+    result["predicted_grade"] = predictions.round(2)
+    result["predicted_lower"] = lower.round(2)
+    result["predicted_upper"] = upper.round(2)
+    result["performance_level"] = performance_level(predictions)
+    result["intervention"] = intervention(lower, upper)
+    negative, positive = top_factors(pipeline, X, chunk_size)
+    result["top_negative_factor"] = pd.Categorical.from_codes(negative, categories=pipeline.features)
+    result["top_positive_factor"] = pd.Categorical.from_codes(positive, categories=pipeline.features)
+    if explain:
+        contributions = explain_batch(pipeline, X, chunk_size).round(2)
+        for i, feature in enumerate(pipeline.features):
+            result[f"contribution_{feature}"] = contributions[:, i]
+    result["out_of_range"] = out_of_range.any(axis=1)
+    return result, errors
+
+
+def to_csv_bytes(result, chunk_size=CHUNK_SIZE):
+    # langsung ke buffer bytes: label emoji membuat StringIO menyimpan 4 byte per karakter
+    buffer = io.BytesIO()
+    for start in range(0, len(result), chunk_size):
+        result.iloc[start:start + chunk_size].to_csv(
+            buffer, index=False, header=(start == 0), encoding="utf-8"
+        )
+    return buffer.getvalue()
@@ -0,0 +1,315 @@
+import argparse
+import json
+import queue
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+import drift_monitor
+import model_registry
+import scoring
+
+# =========================
+# METRICS
+# =========================
+class ServiceMetrics:
+
+    def __init__(self, window=10_000):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.rows = 0
+        self.batches = 0
+        self.batch_rows = 0
+        self.latencies = deque(maxlen=window)
+
+    def record_request(self, rows, latency):
+        with self.lock:
+            self.requests += 1
+            self.rows += rows
+            self.latencies.append(latency)
+
+    def record_error(self):
+        with self.lock:
+            self.errors += 1
+
+    def record_batch(self, rows):
+        with self.lock:
+            self.batches += 1
+            self.batch_rows += rows
+
+    def snapshot(self):
+        with self.lock:
+            uptime = time.time() - self.started
+            latencies = np.asarray(self.latencies, dtype=np.float64) * 1000
+            p50, p95, p99 = (
+                np.percentile(latencies, [50, 95, 99]).round(3).tolist()
+                if latencies.size else (None, None, None)
+            )
+            return {
+                "uptime_s": round(uptime, 3),
+                "requests": self.requests,
+                "errors": self.errors,
+                "rows": self.rows,
+                "batches": self.batches,
+                "avg_batch_rows": round(self.batch_rows / self.batches, 2) if self.batches else 0,
+                "requests_per_s": round(self.requests / uptime, 2) if uptime else 0,
+                "rows_per_s": round(self.rows / uptime, 2) if uptime else 0,
+                "latency_ms": {"p50": p50, "p95": p95, "p99": p99},
+            }
+
+
+# =========================
+# MICRO-BATCHER
+# =========================
+class MicroBatcher:
+    # request yang datang bersamaan digabung jadi satu matriks, lalu diprediksi
+    # dengan satu kali matmul sebelum hasilnya dibagi lagi per request
+
+    def __init__(self, metrics, max_batch=4096, max_wait=0.002):
+        self.metrics = metrics
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def predict(self, X, pipeline):
+        item = {"X": X, "pipeline": pipeline, "done": threading.Event(), "result": None, "error": None}
+        self.queue.put(item)
+        item["done"].wait()
+        if item["error"] is not None:
+            raise item["error"]
+        return item["result"]
+
+    def _collect(self):
+        batch = [self.queue.get()]
+        rows = batch[0]["X"].shape[0]
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            rows += item["X"].shape[0]
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            # saat model baru dipromosikan, satu batch bisa berisi dua versi model
+            groups = {}
+            for item in batch:
+                groups.setdefault(id(item["pipeline"]), []).append(item)
+
+            for items in groups.values():
+                # error di satu grup hanya menggagalkan request grup itu; thread batcher
+                # tetap hidup dan setiap request pasti dibangunkan (done.set)
+                try:
+                    self._predict_group(items)
+                except Exception as e:
+                    for item in items:
+                        item["error"] = e
+                finally:
+                    for item in items:
+                        item["done"].set()
+
+    def _predict_group(self, items):
+        pipeline = items[0]["pipeline"]
+        X = np.concatenate([item["X"] for item in items])
+        raw = X @ pipeline.weights + pipeline.bias
+        half = pipeline.half_width(X)
+        predictions = np.clip(raw, 0, 100)
+        lower = np.clip(raw - half, 0, 100)
+        upper = np.clip(raw + half, 0, 100)
+        self.metrics.record_batch(X.shape[0])
+
+        start = 0
+        for item in items:
+            stop = start + item["X"].shape[0]
+            item["result"] = (predictions[start:stop], lower[start:stop], upper[start:stop])
+            start = stop
+
+
+# =========================
+# REQUEST PARSING
+# =========================
+def parse_instances(payload, features):
+    instances = payload.get("instances") if isinstance(payload, dict) else None
+    if not isinstance(instances, list) or not instances:
+        raise ValueError("Body harus berupa JSON {\"instances\": [...]}")
+
+    if isinstance(instances[0], dict):
+        # setiap instance dicek, bukan hanya yang pertama (KeyError = koneksi putus tanpa respons)
+        for i, row in enumerate(instances):
+            if not isinstance(row, dict):
+                raise ValueError(f"Instance ke-{i} harus berupa object seperti instance pertama")
+            missing = [f for f in features if f not in row]
+            if missing:
+                raise ValueError(f"Instance ke-{i}: kolom tidak ditemukan: {', '.join(missing)}")
+        rows = [[row[f] for f in features] for row in instances]
+    else:
+        rows = instances
+
+    X = np.asarray(rows, dtype=np.float64)
+    if X.ndim != 2 or X.shape[1] != len(features):
+        raise ValueError(f"Setiap instance harus berisi {len(features)} fitur: {features}")
+    # null/NaN/inf akan menghasilkan prediksi NaN (bukan JSON valid) -> tolak
+    finite = np.isfinite(X).all(axis=1)
+    if not finite.all():
+        invalid = ", ".join(str(i) for i in np.flatnonzero(~finite)[:5])
+        raise ValueError(f"Nilai kosong / NaN / inf tidak diperbolehkan (instance: {invalid})")
+    return X
+
+
+# =========================
+# HTTP HANDLER
+# =========================
+def make_handler(batcher, metrics, models, monitor):
+
+    class ScoringHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_json(self, status, body):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/health":
+                pipeline = models.get()
+                self._send_json(200, {
+                    "status": "ok",
+                    "version": pipeline.version,
+                    "features": pipeline.features,
+                    "importance": dict(zip(pipeline.features, pipeline.importance.round(4).tolist())),
+                })
+            elif self.path == "/metrics":
+                self._send_json(200, metrics.snapshot())
+            elif self.path == "/drift":
+                self._send_drift(models.get())
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                self._send_json(404, {"error": "not found"})
+                return
+
+            start = time.perf_counter()
+            pipeline = models.get()
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length))
+                X = parse_instances(payload, pipeline.features)
+                # count bin input mentah (sebelum clip) untuk drift monitor
+                monitor.observe(pipeline, X)
+                X, out_of_range = pipeline.clip(X)
+            except (ValueError, TypeError) as e:
+                metrics.record_error()
+                self._send_json(400, {"error": str(e)})
+                return
+
+            try:
+                predictions, lower, upper = batcher.predict(X, pipeline)
+            except Exception as e:
+                metrics.record_error()
+                self._send_json(500, {"error": f"Prediksi gagal: {e}"})
+                return
+            metrics.record_request(X.shape[0], time.perf_counter() - start)
+            body = {
+                "predictions": predictions.round(2).tolist(),
+                "lower": lower.round(2).tolist(),
+                "upper": upper.round(2).tolist(),
+                "performance_level": scoring.performance_level(predictions).tolist(),
+                "intervention": scoring.intervention(lower, upper).tolist(),
+                "out_of_range": out_of_range.any(axis=1).tolist(),
+            }
+            if payload.get("explain"):
+                # X sudah di-clip di atas; kontribusi per fitur dengan urutan `features`
+                body["base_value"] = round(pipeline.base_value, 4)
+                body["contributions"] = pipeline.contributions(X).round(4).tolist()
+            self._send_json(200, body)
+
+        def _send_drift(self, pipeline):
+            if not pipeline.has_profile:
+                self._send_json(200, {
+                    "version": pipeline.version,
+                    "model_id": model_registry.model_id(pipeline),
+                    "rows": 0,
+                    "features": [],
+                })
+                return
+            monitor.flush()
+            counts, info = drift_monitor.live_counts(pipeline)
+            table = drift_monitor.report(pipeline, counts) if info else None
+            self._send_json(200, {
+                "version": pipeline.version,
+                "model_id": model_registry.model_id(pipeline),
+                "rows": info["rows"] if info else 0,
+                "features": table.to_dict(orient="records") if table is not None else [],
+            })
+
+        def log_message(self, format, *args):
+            pass
+
+    return ScoringHandler
+
+
+class ScoringServer(ThreadingHTTPServer):
+    # backlog default (5) terlalu kecil untuk banyak klien LMS yang konek bersamaan
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+def build_server(host, port, pipeline_path, max_batch, max_wait_ms, registry=model_registry.REGISTRY_DIR):
+    # tanpa --pipeline: model CURRENT di registry (memory-mapped), di-reload saat dipromosikan;
+    # serving cukup clip + matmul, tanpa sklearn
+    if pipeline_path:
+        models = model_registry.CurrentModel(root=None, fallback=pipeline_path)
+    else:
+        models = model_registry.CurrentModel(root=registry)
+    metrics = ServiceMetrics()
+    batcher = MicroBatcher(metrics, max_batch, max_wait_ms / 1000)
+    monitor = drift_monitor.DriftMonitor()
+    return ScoringServer((host, port), make_handler(batcher, metrics, models, monitor))
+
+
+# =========================
+# CLI
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless scoring service untuk model Ridge di registry")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--pipeline", default=None, help="file .npz tertentu (default: model CURRENT di registry)")
+    parser.add_argument("--registry", default=model_registry.REGISTRY_DIR)
+    parser.add_argument("--max-batch", type=int, default=4096)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    server = build_server(
+        args.host, args.port, args.pipeline, args.max_batch, args.max_wait_ms, args.registry
+    )
+    print(f"Scoring service listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import argparse
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+# =========================
+# CONFIG
+# =========================
+SOURCE_PATH = "6. Student Performance Data.csv"
+CHUNK_SIZE = 100_000
+SEED = 42
+# ridge kecil di diagonal supaya matriks korelasi tetap positive definite
+CORR_JITTER = 1e-6
+
+
+# =========================
+# GAUSSIAN COPULA MODEL
+# =========================
+# Setiap kolom disimpan sebagai distribusi empiris (nilai unik + CDF), dan
+# hubungan antar kolom sebagai korelasi normal score (Gaussian copula).
+# Sampling: z ~ N(0, corr) -> u = Phi(z) -> nilai = quantile empiris(u),
+# jadi marginal tiap kolom identik dengan data asli dan korelasinya terjaga.
+@dataclass
+class SyntheticModel:
+    columns: list
+    dtypes: list
+    values: list
+    cdfs: list
+    corr: np.ndarray
+
+    def __post_init__(self):
+        self.chol = np.linalg.cholesky(self.corr)
+
+
+def _normal_scores(codes, cdf):
+    from scipy.special import ndtri
+
+    # mid-rank: titik tengah interval CDF setiap kategori
+    upper = cdf[codes]
+    lower = np.where(codes > 0, cdf[np.maximum(codes - 1, 0)], 0.0)
+    return ndtri((lower + upper) / 2)
+
+
+def fit(df):
+    columns, dtypes, values, cdfs, scores = [], [], [], [], []
+    for column in df.columns:
+        series = df[column].dropna()
+        uniques, codes, counts = np.unique(series.to_numpy(), return_inverse=True, return_counts=True)
+        cdf = np.cumsum(counts) / counts.sum()
+        cdf[-1] = 1.0
+
+        columns.append(column)
+        dtypes.append(series.dtype)
+        values.append(uniques)
+        cdfs.append(cdf)
+        scores.append(_normal_scores(codes, cdf))
+
+    corr = np.corrcoef(np.vstack(scores))
+    corr = corr + CORR_JITTER * np.eye(len(columns))
+    return SyntheticModel(columns, dtypes, values, cdfs, corr)
+
+
+def fit_source(path=SOURCE_PATH):
+    import data_loader
+
+    return fit(data_loader.load_dataset(path))
+
+
+# =========================
+# SAMPLING
+# =========================
+def sample(model, rows, rng):
+    import pandas as pd
+    from scipy.special import ndtr
+
+    z = rng.standard_normal((rows, len(model.columns))) @ model.chol.T
+    u = ndtr(z)
+    data = {}
+    for i, column in enumerate(model.columns):
+        cdf = model.cdfs[i]
+        codes = np.minimum(np.searchsorted(cdf, u[:, i], side="left"), len(cdf) - 1)
+        values, dtype = model.values[i][codes], model.dtypes[i]
+        # kolom category dari schema.py tidak bisa lewat numpy astype
+        if isinstance(dtype, pd.CategoricalDtype):
+            data[column] = pd.Categorical(values, dtype=dtype)
+        else:
+            data[column] = values.astype(dtype, copy=False)
+    return pd.DataFrame(data)
+
+
+def iter_chunks(model, rows, chunk_size=CHUNK_SIZE, seed=SEED):
+    # tiap chunk punya seed turunan sendiri: hasil deterministik untuk
+    # (seed, chunk_size) yang sama dan chunk bisa dibuat tanpa chunk sebelumnya
+    children = np.random.SeedSequence(seed).spawn(-(-rows // chunk_size))
+    for index, child in enumerate(children):
+        size = min(chunk_size, rows - index * chunk_size)
+        yield sample(model, size, np.random.default_rng(child))
+
+
+def generate(model, rows, seed=SEED):
+    import pandas as pd
+
+    return pd.concat(list(iter_chunks(model, rows, seed=seed)), ignore_index=True)
+
+
+# =========================
+# STREAMING WRITER
+# =========================
+def write(model, path, rows, chunk_size=CHUNK_SIZE, seed=SEED):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in (".csv", ".parquet"):
+        raise ValueError(f"Format output tidak didukung: {path}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    writer = None
+    try:
+        for index, chunk in enumerate(iter_chunks(model, rows, chunk_size, seed)):
+            if ext == ".csv":
+                chunk.to_csv(tmp, mode="w" if index == 0 else "a", header=index == 0, index=False)
+                continue
+
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    os.replace(tmp, path)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate dataset siswa sintetis untuk load testing")
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--out", required=True, help="file output .csv atau .parquet")
+    parser.add_argument("--source", default=SOURCE_PATH)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    model = fit_source(args.source)
+    write(model, args.out, args.rows, args.chunk_size, args.seed)
+    print(f"{args.rows} baris ditulis ke {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import streamlit as st
+
+# =========================
+# PASTEL COLOR PALETTE
+# =========================
+PINK_BG = "#FDF2F8"  # pink muda pastel (samakan dengan background web)
+
+PASTEL_COLORS = [
+    "#FADADD",  # pink
+    "#E3F2FD",  # blue
+    "#E8F5E9",  # green
+    "#FFF3E0",  # peach
+    "#E6E6FA",  # lavender
+    "#ECEFF1"   # grey
+]
+
+# =========================
+# CUSTOM CSS (PINK THEME)
+# =========================
+THEME_CSS = """
+<style>
+/* Background utama */
+.stApp {
+    background-color: #FDF2F8; /* pink muda */
+}
+
+/* Sidebar */
+section[data-testid="stSidebar"] {
+    background-color: #FADADD; /* pink pastel */
+}
+
+/* Header */
+h1, h2, h3, h4 {
+    color: #831843;
+}
+
+/* Divider */
+hr {
+    border-top: 1px solid #F9A8D4;
+}
+</style>
+"""
+
+
+def apply_theme():
+    # dipanggil sekali per run dari app.py, bukan di setiap halaman
+    st.markdown(THEME_CSS, unsafe_allow_html=True)
@@ -0,0 +1,244 @@
+import argparse
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import Lasso, LinearRegression, Ridge
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+import data_loader
+import drift_monitor
+import evaluation
+import out_of_core
+import preprocessing
+import profiling
+import tuning
+import model_registry
+from model_pipeline import ModelPipeline
+
+# =========================
+# CONFIG
+# =========================
+TARGET = preprocessing.TARGET
+TEST_SIZE = 0.2
+RANDOM_STATE = 42
+
+
+@dataclass
+class TrainingResult:
+    rows_before: int
+    rows_after: int
+    bounds: pd.DataFrame
+    df_clean: pd.DataFrame
+    corr: pd.DataFrame
+    vif_df: pd.DataFrame
+    X_train: pd.DataFrame
+    X_test: pd.DataFrame
+    y_train: pd.Series
+    y_test: pd.Series
+    X_train_scaled: np.ndarray
+    X_test_scaled: np.ndarray
+    scaler: StandardScaler
+    linreg: LinearRegression
+    ridge: Ridge
+    lasso: Lasso
+    results_df: pd.DataFrame
+    ridge_tuning: dict
+    lasso_tuning: dict
+    # key report evaluasi per (cv, repeats), diisi evaluation.report_key
+    evaluation_keys: dict = field(default_factory=dict)
+
+    @property
+    def feature_columns(self):
+        return self.X_train.columns
+
+
+# =========================
+# PIPELINE STEPS
+# =========================
+def split_scale(X, y):
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE
+    )
+
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+    return X_train, X_test, y_train, y_test, scaler, X_train_scaled, X_test_scaled
+
+
+def tuning_inputs(df):
+    # data train (scaled) yang sama persis dengan run_pipeline, untuk job tuning terpisah
+    df, numbers, _ = preprocessing.remove_outliers(df)
+    df_select = preprocessing.model_frame(df, numbers)
+    _, _, y_train, _, _, X_train_scaled, _ = split_scale(df_select.drop(TARGET, axis=1), df_select[TARGET])
+    return X_train_scaled, y_train
+
+
+def _fold_progress(progress, start, span):
+    if progress is None:
+        return None
+    return lambda done, total: progress(start + span * done / total)
+
+
+@profiling.timed("run_pipeline")
+def run_pipeline(df, ridge_alpha=None, lasso_alpha=None, progress=None):
+    # progress(fraction) opsional: dilaporkan per fold CV (dipakai job runner)
+    rows_before = df.shape[0]
+    with profiling.section("remove_outliers"):
+        df, numbers, bounds = preprocessing.remove_outliers(df)
+        df_select = preprocessing.model_frame(df, numbers)
+
+    X = df_select.drop(TARGET, axis=1)
+    y = df_select[TARGET]
+
+    with profiling.section("correlation"):
+        corr = preprocessing.correlation(df_select)
+
+    with profiling.section("vif"):
+        vif_df = preprocessing.compute_vif(X)
+
+    with profiling.section("split_scale"):
+        X_train, X_test, y_train, y_test, scaler, X_train_scaled, X_test_scaled = split_scale(X, y)
+
+    with profiling.section("fit_linreg"):
+        linreg = LinearRegression()
+        linreg.fit(X_train, y_train)
+
+    # alpha yang tidak ditentukan manual diambil dari hasil tuning (cached)
+    with profiling.section("tune_ridge"):
+        ridge_tuning = tuning.tune("ridge", X_train_scaled, y_train, progress=_fold_progress(progress, 0.1, 0.4))
+    with profiling.section("tune_lasso"):
+        lasso_tuning = tuning.tune("lasso", X_train_scaled, y_train, progress=_fold_progress(progress, 0.5, 0.4))
+    if ridge_alpha is None:
+        ridge_alpha = ridge_tuning["best_alpha"]
+    if lasso_alpha is None:
+        lasso_alpha = lasso_tuning["best_alpha"]
+
+    with profiling.section("fit_regularized"):
+        ridge = Ridge(alpha=ridge_alpha)
+        ridge.fit(X_train_scaled, y_train)
+
+        lasso = Lasso(alpha=lasso_alpha)
+        lasso.fit(X_train_scaled, y_train)
+
+    with profiling.section("evaluate"):
+        results_df = evaluation.metrics_table(y_test, {
+            "Ridge Regression": ridge.predict(X_test_scaled),
+            "Lasso Regression": lasso.predict(X_test_scaled),
+            "Linear Regression": linreg.predict(X_test)
+        })
+
+    return TrainingResult(
+        rows_before=rows_before,
+        rows_after=df.shape[0],
+        bounds=bounds,
+        df_clean=df,
+        corr=corr,
+        vif_df=vif_df,
+        X_train=X_train,
+        X_test=X_test,
+        y_train=y_train,
+        y_test=y_test,
+        X_train_scaled=X_train_scaled,
+        X_test_scaled=X_test_scaled,
+        scaler=scaler,
+        linreg=linreg,
+        ridge=ridge,
+        lasso=lasso,
+        results_df=results_df,
+        ridge_tuning=ridge_tuning,
+        lasso_tuning=lasso_tuning
+    )
+
+
+def run_from_path(path):
+    # entry point worker process (worker_pool): dataset dibaca sendiri oleh worker,
+    # hanya TrainingResult yang dikirim balik ke proses Streamlit
+    return run_pipeline(data_loader.load_dataset(path))
+
+
+# =========================
+# ARTIFACTS
+# =========================
+def save_artifacts(result, data_hash, registry=model_registry.REGISTRY_DIR, promote=True, source=None):
+    pipeline = ModelPipeline.from_training(result, {
+        "ridge_alpha": float(result.ridge.alpha),
+        **out_of_core.training_meta(result.bounds, result.rows_before, source)
+    })
+    # statistik cukup ikut disimpan supaya data baru bisa di-update tanpa retrain penuh
+    folds, test = out_of_core.stats_from_split(result.X_train, result.y_train, result.X_test, result.y_test)
+    pipeline.stats = out_of_core.pack_stats(folds, test)
+    # kovarians Ridge + varians residual untuk interval prediksi
+    pipeline.cov, pipeline.sigma2 = sum(folds[1:], folds[0]).ridge_covariance(
+        float(result.ridge.alpha), pipeline.scale, pipeline.weights, pipeline.bias
+    )
+    # profil distribusi fitur data train, referensi drift monitor
+    pipeline.profile = drift_monitor.bin_counts(result.X_train, pipeline.lower, pipeline.upper)
+    return model_registry.publish(pipeline, {
+        "rows_before": result.rows_before,
+        "rows_after": result.rows_after,
+        "ridge_alpha": float(result.ridge.alpha),
+        "lasso_alpha": float(result.lasso.alpha),
+        "features": list(result.feature_columns),
+        "metrics": result.results_df.set_index("Model").to_dict(orient="index"),
+        # report holdout + repeated CV yang sudah ada di cache ikut disimpan bersama versi model;
+        # tidak dihitung di sini supaya tombol simpan di halaman ML tidak menjalankan CV penuh
+        # (None jika belum ada: job train / evaluate dan CLI menghitungnya sebelum menyimpan)
+        "evaluation": evaluation.cached_report(result)
+    }, data_hash, registry, promote)
+
+
+def save_out_of_core_artifacts(result, data_hash, registry=model_registry.REGISTRY_DIR, promote=True):
+    return model_registry.publish(result.pipeline, {
+        "mode": "out_of_core",
+        "rows_before": result.rows_before,
+        "rows_after": result.rows_after,
+        "ridge_alpha": result.pipeline.meta["ridge_alpha"],
+        "features": result.features,
+        "metrics": result.metrics
+    }, data_hash, registry, promote)
+
+
+# =========================
+# CLI
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Training pipeline Student Performance")
+    parser.add_argument("--data", default=data_loader.DATASET_PATH)
+    parser.add_argument("--registry", default=model_registry.REGISTRY_DIR)
+    parser.add_argument("--ridge-alpha", type=float, default=None,
+                        help="default: alpha terbaik hasil tuning")
+    parser.add_argument("--lasso-alpha", type=float, default=None,
+                        help="default: alpha terbaik hasil tuning")
+    parser.add_argument("--no-promote", action="store_true",
+                        help="hanya daftarkan ke registry, jangan jadikan model CURRENT")
+    parser.add_argument("--out-of-core", action="store_true",
+                        help="training Ridge streaming per chunk (memori tidak bergantung jumlah baris)")
+    parser.add_argument("--chunksize", type=int, default=out_of_core.CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    data_hash = data_loader.file_hash(args.data)
+
+    if args.out_of_core:
+        result = out_of_core.run_pipeline(args.data, args.ridge_alpha, args.chunksize)
+        version = save_out_of_core_artifacts(result, data_hash, args.registry, promote=not args.no_promote)
+        print(f"Model version {version} ({result.rows_after}/{result.rows_before} baris, out-of-core)")
+        print(pd.DataFrame(result.metrics).T.to_string())
+        return
+
+    result = run_pipeline(
+        data_loader.load_dataset(args.data), args.ridge_alpha, args.lasso_alpha
+    )
+    report = evaluation.evaluate(result)
+    version = save_artifacts(result, data_hash, args.registry, promote=not args.no_promote, source=args.data)
+
+    print(f"Model version {version} ({result.rows_after}/{result.rows_before} baris)")
+    print(result.results_df.to_string(index=False))
+    print(f"\n{report['cv']['folds']}-fold CV x{report['cv']['repeats']} (mean ± std):")
+    print(evaluation.cv_table(report).to_string(float_format="{:.3f}".format))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+from concurrent.futures import as_completed
+
+import numpy as np
+
+import data_loader
+import worker_pool
+
+# =========================
+# CONFIG
+# =========================
+ALPHAS = np.logspace(-3, 3, 20)
+CV_FOLDS = 10
+LASSO_MAX_ITER = 10000
+# di bawah ukuran ini overhead spawn proses lebih mahal daripada fold-nya sendiri
+PARALLEL_MIN_ROWS = 20_000
+
+TUNING_CACHE_DIR = os.path.join(data_loader.CACHE_DIR, "tuning")
+_memory_cache = {}
+
+
+# =========================
+# PER-FOLD REGULARIZATION PATHS
+# =========================
+def _ridge_fold(X_train, y_train, X_val, y_val, alphas):
+    # satu SVD per fold, lalu koefisien untuk semua alpha didapat secara closed form
+    x_mean = X_train.mean(axis=0)
+    y_mean = y_train.mean()
+    U, s, Vt = np.linalg.svd(X_train - x_mean, full_matrices=False)
+    Uty = U.T @ (y_train - y_mean)
+
+    shrink = s[:, None] / (s[:, None] ** 2 + alphas[None, :])
+    coefs = Vt.T @ (shrink * Uty[:, None])
+
+    predictions = (X_val - x_mean) @ coefs + y_mean
+    return np.mean((y_val[:, None] - predictions) ** 2, axis=0)
+
+
+def _lasso_fold(X_train, y_train, X_val, y_val, alphas):
+    # lasso_path berjalan dari alpha terbesar ke terkecil dengan warm start
+    from sklearn.linear_model import lasso_path
+
+    x_mean = X_train.mean(axis=0)
+    y_mean = y_train.mean()
+    order = np.argsort(alphas)[::-1]
+    _, coefs, _ = lasso_path(
+        X_train - x_mean, y_train - y_mean,
+        alphas=alphas[order], max_iter=LASSO_MAX_ITER
+    )
+
+    predictions = (X_val - x_mean) @ coefs + y_mean
+    mse = np.empty(len(alphas))
+    mse[order] = np.mean((y_val[:, None] - predictions) ** 2, axis=0)
+    return mse
+
+
+FOLD_FUNCTIONS = {
+    "ridge": _ridge_fold,
+    "lasso": _lasso_fold,
+}
+
+
+def _run_fold(args):
+    model, X, y, train_idx, val_idx, alphas = args
+    return FOLD_FUNCTIONS[model](X[train_idx], y[train_idx], X[val_idx], y[val_idx], alphas)
+
+
+# =========================
+# CACHE
+# =========================
+def cache_key(model, X, y, alphas, cv):
+    digest = hashlib.sha256()
+    digest.update(model.encode("utf-8"))
+    digest.update(str(cv).encode("utf-8"))
+    for array in (X, y, alphas):
+        array = np.ascontiguousarray(array, dtype=np.float64)
+        digest.update(str(array.shape).encode("utf-8"))
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def _load_cached(key):
+    if key in _memory_cache:
+        return _memory_cache[key]
+    path = os.path.join(TUNING_CACHE_DIR, f"{key}.json")
+    if os.path.exists(path):
+        with open(path) as f:
+            result = json.load(f)
+        _memory_cache[key] = result
+        return result
+    return None
+
+
+def _store_cached(key, result):
+    _memory_cache[key] = result
+    os.makedirs(TUNING_CACHE_DIR, exist_ok=True)
+    path = os.path.join(TUNING_CACHE_DIR, f"{key}.json")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(result, f)
+    os.replace(tmp, path)
+
+
+# =========================
+# TUNING
+# =========================
+def tune(model, X, y, alphas=ALPHAS, cv=CV_FOLDS, n_jobs=None, progress=None):
+    # progress(done, total) dipanggil setiap satu fold selesai (dipakai job runner);
+    # exception dari callback menghentikan tuning (mis. job dibatalkan)
+    from sklearn.model_selection import KFold
+
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    alphas = np.asarray(alphas, dtype=np.float64)
+
+    key = cache_key(model, X, y, alphas, cv)
+    cached = _load_cached(key)
+    if cached is not None:
+        return cached
+
+    # KFold tanpa shuffle = split yang sama dengan GridSearchCV(cv=10) untuk regresi
+    tasks = [
+        (model, X, y, train_idx, val_idx, alphas)
+        for train_idx, val_idx in KFold(n_splits=cv).split(X)
+    ]
+
+    if n_jobs is None:
+        n_jobs = min(cv, os.cpu_count() or 1) if X.shape[0] >= PARALLEL_MIN_ROWS else 1
+
+    fold_mse = [None] * len(tasks)
+    if n_jobs > 1:
+        with worker_pool.process_pool(n_jobs) as pool:
+            futures = {pool.submit(_run_fold, task): i for i, task in enumerate(tasks)}
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    fold_mse[futures[future]] = future.result()
+                    if progress:
+                        progress(done, len(tasks))
+            except BaseException:
+                pool.shutdown(cancel_futures=True)
+                raise
+    else:
+        for i, task in enumerate(tasks):
+            fold_mse[i] = _run_fold(task)
+            if progress:
+                progress(i + 1, len(tasks))
+
+    mean_mse = np.mean(fold_mse, axis=0)
+    result = {
+        "model": model,
+        "alphas": alphas.tolist(),
+        "mean_mse": mean_mse.tolist(),
+        "best_alpha": float(alphas[np.argmin(mean_mse)]),
+    }
+    _store_cached(key, result)
+    return result
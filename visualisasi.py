@@ -1,84 +1,66 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 
-# =========================
-# PAGE CONFIG
-# =========================
-st.set_page_config(
-    page_title="Student Performance Dashboard",
-    layout="wide"
-)
+import data_loader
+import profiling
+from theme import PASTEL_COLORS, PINK_BG
 
 # =========================
-# CUSTOM CSS (PINK THEME)
+# FILTER ENGINE
 # =========================
-st.markdown(
-        """
-        <style>
-        /* Background utama */
-        .stApp {
-            background-color: #FDF2F8; /* pink muda */
-        }
+# satu engine per versi dataset, dipakai bersama oleh semua session
+def load_filter_engine(path, signature):
+    import filter_engine
 
-        /* Sidebar */
-        section[data-testid="stSidebar"] {
-            background-color: #FADADD; /* pink pastel */
-        }
+    return filter_engine.shared_engine(path, signature)
 
-        /* Header */
-        h1, h2, h3, h4 {
-            color: #831843;
-        }
 
-        /* Divider */
-        hr {
-            border-top: 1px solid #F9A8D4;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-)
+# KPI dibaca dari statistik yang sudah di-precompute (lihat dataset_stats.py);
+# store_token ikut jadi key supaya invalidasi store langsung terlihat di semua session
+@st.cache_data(show_spinner=False)
+def load_dataset_stats(path, signature, token):
+    import dataset_stats
+    import worker_pool
 
-# =========================
-# PASTEL COLOR PALETTE
-# =========================
-PASTEL_COLORS = [
-    "#FADADD",  # pink
-    "#E3F2FD",  # blue
-    "#E8F5E9",  # green
-    "#FFF3E0",  # peach
-    "#E6E6FA",  # lavender
-    "#ECEFF1"   # grey
-]
+    return worker_pool.run(dataset_stats.load_or_build, path)
 
 # =========================
 # MAIN FUNCTION
 # =========================
+@profiling.timed("dashboard")
 def chart():
-    df = pd.read_excel("Student Performance Data.xlsx")
+    # library plotting baru di-import saat halaman ini benar-benar dibuka
+    with profiling.section("imports"):
+        import plotly.express as px
+
+        import chart_aggregates as agg
+        import dataset_stats
+        import filter_engine
+        import worker_pool
+
+    path = data_loader.DATASET_PATH
+    signature = data_loader.source_signature(path)
+    engine = load_filter_engine(path, signature)
+    stats = load_dataset_stats(path, signature, dataset_stats.store_token(path))
 
     # =========================
     # SIDEBAR FILTER
     # =========================
-    st.sidebar.title("🔍 Filter Data")
+    with profiling.section("sidebar_filter"):
+        st.sidebar.title("🔍 Filter Data")
 
-    gender_filter = st.sidebar.multiselect(
-        "Sex",
-        options=df["sex"].unique(),
-        default=df["sex"].unique()
-    )
+        gender_filter = st.sidebar.multiselect(
+            "Sex",
+            options=engine.options("sex"),
+            default=engine.options("sex")
+        )
 
-    performance_filter = st.sidebar.multiselect(
-        "Performance Level",
-        options=df["grade"].dropna().unique(),
-        default=df["grade"].dropna().unique()
-    )
+        performance_filter = st.sidebar.multiselect(
+            "Performance Level",
+            options=engine.options("grade"),
+            default=engine.options("grade")
+        )
 
-    filtered_df = df[
-        (df["sex"].isin(gender_filter)) &
-        (df["grade"].isin(performance_filter))
-    ]
+        selection = {"sex": gender_filter, "grade": performance_filter}
 
     # =========================
     # TITLE
@@ -93,269 +75,282 @@ def chart():
     # =========================
     # KPI METRICS
     # =========================
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        avg_grade = filtered_df["grade"].mean()
-        st.markdown(
-            f"""
-            <div style="background-color:#E3F2FD; padding:16px; border-radius:16px; text-align:center;">
-                <h4>Average Grade</h4>
-                <h2>{avg_grade:.2f}</h2>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-
-    with col2:
-        avg_attendance = filtered_df["absences"].mean()
-        st.markdown(
-            f"""
-            <div style="background-color:#FFF3E0; padding:16px; border-radius:16px; text-align:center;">
-                <h4>Average Absences</h4>
-                <h2>{avg_attendance:.2f}</h2>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-
-    with col3:
-        total_students = filtered_df.shape[0]
-        st.markdown(
-            f"""
-            <div style="background-color:#E8F5E9; padding:16px; border-radius:16px; text-align:center;">
-                <h4>Total Students</h4>
-                <h2>{total_students}</h2>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+    with profiling.section("kpi"):
+        kpis = stats.kpis(selection)
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            avg_grade = kpis["avg_grade"]
+            st.markdown(
+                f"""
+                <div style="background-color:#E3F2FD; padding:16px; border-radius:16px; text-align:center;">
+                    <h4>Average Grade</h4>
+                    <h2>{avg_grade:.2f}</h2>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+
+        with col2:
+            avg_attendance = kpis["avg_absences"]
+            st.markdown(
+                f"""
+                <div style="background-color:#FFF3E0; padding:16px; border-radius:16px; text-align:center;">
+                    <h4>Average Absences</h4>
+                    <h2>{avg_attendance:.2f}</h2>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+
+        with col3:
+            total_students = kpis["total_students"]
+            st.markdown(
+                f"""
+                <div style="background-color:#E8F5E9; padding:16px; border-radius:16px; text-align:center;">
+                    <h4>Total Students</h4>
+                    <h2>{total_students}</h2>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+
+        with col4:
+            high_risk_students = kpis["high_risk"]
+            st.markdown(
+                f"""
+                <div style="background-color:#FADADD; padding:16px; border-radius:16px; text-align:center;">
+                    <h4>High Risk Students</h4>
+                    <h2>{high_risk_students}</h2>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
 
-    with col4:
-        high_risk_students = filtered_df[filtered_df["grade"] < 50].shape[0]
-        st.markdown(
-            f"""
-            <div style="background-color:#FADADD; padding:16px; border-radius:16px; text-align:center;">
-                <h4>High Risk Students</h4>
-                <h2>{high_risk_students}</h2>
-            </div>
-            """,
-            unsafe_allow_html=True
+    # =========================
+    # AGGREGATES
+    # =========================
+    # semua agregat chart untuk filter ini dihitung dalam satu task, dengan
+    # STUDENT_APP_WORKERS > 0 di worker process sehingga session lain tidak ikut tertahan
+    with profiling.section("aggregates"):
+        aggregates = worker_pool.poll(
+            "dashboard", (path, signature, filter_engine.selection_key(selection)),
+            agg.view_aggregates, path, signature, selection
         )
+    if aggregates is None:
+        worker_pool.rerun_later("⏳ Menghitung chart untuk filter ini di worker process...")
 
     # =========================
     # DATAFRAME
     # =========================
-    st.write("**1. Menampilkan DataFrame**")
-    st.dataframe(filtered_df.head(), use_container_width=True)
+    with profiling.section("dataframe"):
+        st.write("**1. Menampilkan DataFrame**")
+        st.dataframe(aggregates["preview"], use_container_width=True)
 
     # =========================
     # PARENT JOB VISUALIZATION
     # =========================
-    st.write("**2. Tipe Pekerjaan Orang Tua**")
+    with profiling.section("parent_job"):
+        st.write("**2. Tipe Pekerjaan Orang Tua**")
 
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
 
-    PINK_BG = "#FDF2F8"   # pink muda (samakan dengan background web)
+        with col1:
+            father_job = aggregates["father_job"]
 
-    with col1:
-        father_job = filtered_df["father_job"].value_counts()
+            fig_father = px.bar(
+                x=father_job.index,
+                y=father_job.values,
+                title="Tipe Pekerjaan Ayah",
+                color_discrete_sequence=PASTEL_COLORS
+            )
 
-        fig_father = px.bar(
-            x=father_job.index,
-            y=father_job.values,
-            title="Tipe Pekerjaan Ayah",
-            color_discrete_sequence=PASTEL_COLORS
-        )
-
-        fig_father.update_layout(
-            paper_bgcolor=PINK_BG,
-            plot_bgcolor=PINK_BG,
-            title_font=dict(size=16)
-        )
+            fig_father.update_layout(
+                paper_bgcolor=PINK_BG,
+                plot_bgcolor=PINK_BG,
+                title_font=dict(size=16)
+            )
 
-        st.plotly_chart(fig_father, use_container_width=True)
+            profiling.plotly_chart(fig_father, use_container_width=True)
 
-    with col2:
-        mother_job = filtered_df["mother_job"].value_counts()
+        with col2:
+            mother_job = aggregates["mother_job"]
 
-        fig_mother = px.bar(
-            x=mother_job.index,
-            y=mother_job.values,
-            title="Tipe Pekerjaan Ibu",
-            color_discrete_sequence=PASTEL_COLORS
-        )
+            fig_mother = px.bar(
+                x=mother_job.index,
+                y=mother_job.values,
+                title="Tipe Pekerjaan Ibu",
+                color_discrete_sequence=PASTEL_COLORS
+            )
 
-        fig_mother.update_layout(
-            paper_bgcolor=PINK_BG,
-            plot_bgcolor=PINK_BG,
-            title_font=dict(size=16)
-        )
+            fig_mother.update_layout(
+                paper_bgcolor=PINK_BG,
+                plot_bgcolor=PINK_BG,
+                title_font=dict(size=16)
+            )
 
-        st.plotly_chart(fig_mother, use_container_width=True)
+            profiling.plotly_chart(fig_mother, use_container_width=True)
 
 
-    # =========================
-    # PINK BACKGROUND SETTING
-    # =========================
-    PINK_BG = "#FDF2F8"  # pink muda pastel
-
     # =========================
     # DISTRIBUTION
     # =========================
-    st.write("**3. Distribusi Nilai Siswa**")
-
-    fig_grade = px.histogram(
-        filtered_df,
-        x="grade",
-        nbins=30,
-        title="Distribusi Nilai Siswa",
-        color_discrete_sequence=["#F9A8D4"]
-    )
-    fig_grade.update_layout(
-        paper_bgcolor=PINK_BG,
-        plot_bgcolor=PINK_BG
-    )
-    st.plotly_chart(fig_grade, use_container_width=True)
+    with profiling.section("grade_distribution"):
+        st.write("**3. Distribusi Nilai Siswa**")
+
+        grade_bins = aggregates["grade_bins"]
+        fig_grade = agg.histogram_figure(
+            grade_bins,
+            "grade",
+            title="Distribusi Nilai Siswa",
+            color="#F9A8D4"
+        )
+        fig_grade.update_layout(
+            paper_bgcolor=PINK_BG,
+            plot_bgcolor=PINK_BG
+        )
+        profiling.plotly_chart(fig_grade, use_container_width=True)
 
     # =========================
     # PERFORMANCE LEVEL
     # =========================
-    st.write("**4. Performance Level Distribution**")
+    with profiling.section("performance_level"):
+        st.write("**4. Performance Level Distribution**")
 
-    performance_counts = (
-        filtered_df["grade"]
-        .value_counts()
-        .reset_index()
-    )
-    performance_counts.columns = ["Performance Level", "Count"]
+        performance_counts = aggregates["grade_counts"]
 
-    # =========================
-    # FORCE COLOR FOR EACH CATEGORY ✅
-    # =========================
-    unique_levels = performance_counts["Performance Level"].unique()
-
-    color_map = {
-        level: PASTEL_COLORS[i % len(PASTEL_COLORS)]
-        for i, level in enumerate(unique_levels)
-    }
-
-    fig_performance = px.pie(
-        performance_counts,
-        names="Performance Level",
-        values="Count",
-        title="Performance Level Distribution",
-        color="Performance Level",
-        color_discrete_map=color_map
-    )
+        # =========================
+        # FORCE COLOR FOR EACH CATEGORY ✅
+        # =========================
+        unique_levels = performance_counts["Performance Level"].unique()
 
-    fig_performance.update_layout(
-        paper_bgcolor=PINK_BG,
-        plot_bgcolor=PINK_BG
-    )
+        color_map = {
+            level: PASTEL_COLORS[i % len(PASTEL_COLORS)]
+            for i, level in enumerate(unique_levels)
+        }
 
-    st.plotly_chart(fig_performance, use_container_width=True)
+        fig_performance = px.pie(
+            performance_counts,
+            names="Performance Level",
+            values="Count",
+            title="Performance Level Distribution",
+            color="Performance Level",
+            color_discrete_map=color_map
+        )
 
+        fig_performance.update_layout(
+            paper_bgcolor=PINK_BG,
+            plot_bgcolor=PINK_BG
+        )
+
+        profiling.plotly_chart(fig_performance, use_container_width=True)
 
-    # =========================
-    # ATTENDANCE VS PERFORMANCE
-    # =========================
-    st.write("**5. Attendance vs Performance**")
-
-    fig_attendance = px.scatter(
-        filtered_df,
-        x="absences",
-        y="grade",
-        title="Attendance vs Performance",
-        color_discrete_sequence=["#CE93D8"]
-    )
-    fig_attendance.update_layout(
-        paper_bgcolor=PINK_BG,
-        plot_bgcolor=PINK_BG
-    )
-    st.plotly_chart(fig_attendance, use_container_width=True)
 
     # =========================
-    # BEHAVIOR ANALYSIS
+    # ATTENDANCE VS PERFORMANCE
     # =========================
-    st.write("**6. Behavior Analysis**")
-    col1, col2 = st.columns(2)
-
-    with col1:
-        fig_studytime = px.box(
-            filtered_df,
-            x="studytime",
-            y="grade",
-            title="Study Time vs Performance",
-            color_discrete_sequence=["#A5D6A7"]
+    with profiling.section("attendance"):
+        st.write("**5. Attendance vs Performance**")
+
+        attendance_points = aggregates["attendance_points"]
+        fig_attendance = agg.scatter_figure(
+            attendance_points,
+            "absences",
+            "grade",
+            title="Attendance vs Performance",
+            color="#CE93D8"
         )
-        fig_studytime.update_layout(
+        fig_attendance.update_layout(
             paper_bgcolor=PINK_BG,
             plot_bgcolor=PINK_BG
         )
-        st.plotly_chart(fig_studytime, use_container_width=True)
-
-    with col2:
-        fig_freetime = px.box(
-            filtered_df,
-            x="freetime",
-            y="grade",
-            title="Free Time vs Performance",
-            color_discrete_sequence=["#FFCCBC"]
-        )
-        fig_freetime.update_layout(
-            paper_bgcolor=PINK_BG,
-            plot_bgcolor=PINK_BG
-        )
-        st.plotly_chart(fig_freetime, use_container_width=True)
+        profiling.plotly_chart(fig_attendance, use_container_width=True)
+
+    # =========================
+    # BEHAVIOR ANALYSIS
+    # =========================
+    with profiling.section("behavior"):
+        st.write("**6. Behavior Analysis**")
+        col1, col2 = st.columns(2)
+
+        with col1:
+            studytime_stats = aggregates["studytime_box"]
+            fig_studytime = agg.box_figure(
+                studytime_stats,
+                "studytime",
+                "grade",
+                title="Study Time vs Performance",
+                color="#A5D6A7"
+            )
+            fig_studytime.update_layout(
+                paper_bgcolor=PINK_BG,
+                plot_bgcolor=PINK_BG
+            )
+            profiling.plotly_chart(fig_studytime, use_container_width=True)
+
+        with col2:
+            freetime_stats = aggregates["freetime_box"]
+            fig_freetime = agg.box_figure(
+                freetime_stats,
+                "freetime",
+                "grade",
+                title="Free Time vs Performance",
+                color="#FFCCBC"
+            )
+            fig_freetime.update_layout(
+                paper_bgcolor=PINK_BG,
+                plot_bgcolor=PINK_BG
+            )
+            profiling.plotly_chart(fig_freetime, use_container_width=True)
 
     # =========================
     # SUPPORT & SOCIAL
     # =========================
-    st.write("**7. Support & Social Analysis**")
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        fig_support = px.pie(
-            filtered_df,
-            names="school_support",
-            title="School Support",
-            hole=0.4,
-            color_discrete_sequence=PASTEL_COLORS
-        )
-        fig_support.update_layout(
-            paper_bgcolor=PINK_BG,
-            plot_bgcolor=PINK_BG
-        )
-        st.plotly_chart(fig_support, use_container_width=True)
-
-    with col2:
-        fig_health = px.pie(
-            filtered_df,
-            names="health",
-            title="Health Status",
-            hole=0.4,
-            color_discrete_sequence=PASTEL_COLORS
-        )
-        fig_health.update_layout(
-            paper_bgcolor=PINK_BG,
-            plot_bgcolor=PINK_BG
-        )
-        st.plotly_chart(fig_health, use_container_width=True)
-
-    with col3:
-        fig_travel = px.pie(
-            filtered_df,
-            names="traveltime",
-            title="Travel Time",
-            hole=0.4,
-            color_discrete_sequence=PASTEL_COLORS
-        )
-        fig_travel.update_layout(
-            paper_bgcolor=PINK_BG,
-            plot_bgcolor=PINK_BG
-        )
-        st.plotly_chart(fig_travel, use_container_width=True)
+    with profiling.section("support_social"):
+        st.write("**7. Support & Social Analysis**")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            school_support_counts = aggregates["school_support_counts"]
+            fig_support = agg.pie_figure(
+                school_support_counts,
+                title="School Support",
+                colors=PASTEL_COLORS,
+                hole=0.4
+            )
+            fig_support.update_layout(
+                paper_bgcolor=PINK_BG,
+                plot_bgcolor=PINK_BG
+            )
+            profiling.plotly_chart(fig_support, use_container_width=True)
+
+        with col2:
+            health_counts = aggregates["health_counts"]
+            fig_health = agg.pie_figure(
+                health_counts,
+                title="Health Status",
+                colors=PASTEL_COLORS,
+                hole=0.4
+            )
+            fig_health.update_layout(
+                paper_bgcolor=PINK_BG,
+                plot_bgcolor=PINK_BG
+            )
+            profiling.plotly_chart(fig_health, use_container_width=True)
+
+        with col3:
+            traveltime_counts = aggregates["traveltime_counts"]
+            fig_travel = agg.pie_figure(
+                traveltime_counts,
+                title="Travel Time",
+                colors=PASTEL_COLORS,
+                hole=0.4
+            )
+            fig_travel.update_layout(
+                paper_bgcolor=PINK_BG,
+                plot_bgcolor=PINK_BG
+            )
+            profiling.plotly_chart(fig_travel, use_container_width=True)
 
 
     st.divider()
@@ -0,0 +1,149 @@
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# =========================
+# CONFIG
+# =========================
+# 0 = semua komputasi jalan di proses Streamlit (default, sama seperti sebelumnya);
+# N > 0 = training & agregasi dashboard dikirim ke N worker process
+WORKERS = int(os.environ.get("STUDENT_APP_WORKERS", "0"))
+POLL_INTERVAL = float(os.environ.get("STUDENT_APP_POLL_INTERVAL", "0.5"))
+# batas hasil per store: agregat dashboard (satu per kombinasi filter) tidak boleh
+# menggusur hasil training yang belum sempat dibaca session yang menunggunya
+MAX_RESULTS = {"training": 8, "dashboard": 64}
+
+_pool = None
+# per store, task per key: future yang sedang berjalan atau hasil yang sudah selesai (LRU)
+_tasks = {store: OrderedDict() for store in MAX_RESULTS}
+_lock = threading.Lock()
+
+
+# =========================
+# POOL
+# =========================
+def enabled():
+    return WORKERS > 0
+
+
+def process_pool(max_workers):
+    # satu kebijakan untuk semua process pool di repo, termasuk pool sementara fold CV
+    # tuning / evaluasi. Spawn, bukan fork: proses Streamlit punya banyak thread (satu per
+    # session) dan fork dari proses multi-thread bisa mewarisi lock yang sedang dipegang.
+    # Worker meng-import ulang app.py sebagai __mp_main__ (halaman tidak dirender, lihat
+    # guard di app.py); task-nya fungsi level modul (training, chart_aggregates, tuning, ...)
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = process_pool(WORKERS)
+    return _pool
+
+
+def _reset_pool():
+    # worker mati (mis. OOM) membuat seluruh pool rusak -> buat ulang saat task berikutnya
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        for tasks in _tasks.values():
+            for key in [key for key, future in tasks.items() if not future.done()]:
+                del tasks[key]
+
+
+def _evict(store):
+    tasks = _tasks[store]
+    done = [key for key, future in tasks.items() if future.done()]
+    while len(tasks) > MAX_RESULTS[store] and done:
+        del tasks[done.pop(0)]
+
+
+# =========================
+# SHARED TASKS
+# =========================
+def run(func, *args):
+    # blocking, tapi thread session hanya menunggu (GIL dilepas) selama worker menghitung
+    if not enabled():
+        return func(*args)
+    with _lock:
+        future = _get_pool().submit(func, *args)
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        _reset_pool()
+        raise
+
+
+def poll(store, key, func, *args):
+    # store = "training" / "dashboard". Task dengan key yang sama dijalankan sekali dan hasilnya dipakai bersama
+    # oleh semua session. Mode pool: return None selama task masih berjalan,
+    # page menampilkan status lalu rerun (lihat rerun_later) tanpa memblok session lain.
+    created = False
+    with _lock:
+        tasks = _tasks[store]
+        future = tasks.get(key)
+        if future is None:
+            future = _get_pool().submit(func, *args) if enabled() else Future()
+            tasks[key] = future
+            created = True
+            _evict(store)
+        else:
+            tasks.move_to_end(key)
+
+    if not enabled():
+        if created:
+            try:
+                future.set_result(func(*args))
+            except BaseException as exc:
+                future.set_exception(exc)
+        # session lain yang meminta key yang sama menunggu hasil yang sedang dihitung
+        return _result(store, key, future)
+
+    if not future.done():
+        return None
+    return _result(store, key, future)
+
+
+def _result(store, key, future):
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        _reset_pool()
+        raise
+    except BaseException:
+        # task gagal tidak di-cache, rerun berikutnya mencoba lagi
+        with _lock:
+            if _tasks[store].get(key) is future:
+                del _tasks[store][key]
+        raise
+
+
+def pending():
+    with _lock:
+        return sum(not future.done() for tasks in _tasks.values() for future in tasks.values())
+
+
+def clear():
+    with _lock:
+        for tasks in _tasks.values():
+            for key in [key for key, future in tasks.items() if future.done()]:
+                del tasks[key]
+
+
+# =========================
+# STREAMLIT
+# =========================
+def rerun_later(message):
+    # thread session hanya tidur (GIL dilepas), komputasinya ada di worker process
+    import streamlit as st
+
+    st.info(message)
+    time.sleep(POLL_INTERVAL)
+    st.rerun()